@@ -3,12 +3,15 @@ Authentication and Authorization System
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, NamedTuple
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import os
 import logging
 
@@ -30,6 +33,50 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # HTTP Bearer token
 security = HTTPBearer()
 
+# Short-lived user snapshots so authenticated calls skip the users table
+USER_CACHE_TTL_SECONDS = 60
+
+class CachedUser(NamedTuple):
+    """Auth-relevant fields of a User row"""
+    id: Any
+    username: str
+    email: str
+    role: str
+    permissions: Any
+    active: bool
+
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
+async def get_cached_user(user_id: str, db: Optional[AsyncSession] = None) -> Optional[CachedUser]:
+    """Look up a user snapshot, hitting the database only on a cache miss"""
+    key = str(user_id)
+    cached = _user_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    if db is None:
+        from app.config.database import AsyncSessionLocal
+        async with AsyncSessionLocal() as session:
+            user = await session.get(User, user_id)
+    else:
+        user = await db.get(User, user_id)
+    if user is None:
+        return None
+    
+    cached = CachedUser(user.id, user.username, user.email, user.role, user.permissions, user.active)
+    _user_cache[key] = cached
+    return cached
+
+def invalidate_cached_user(user_id: str):
+    """Drop a user's snapshot after it is updated or deactivated"""
+    _user_cache.pop(str(user_id), None)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_on_user_change(mapper, connection, target: User):
+    """Any ORM update or delete of a user row (role, permissions, active, ...) evicts its snapshot"""
+    invalidate_cached_user(target.id)
+
 class AuthService:
     """Authentication service"""
     
@@ -109,7 +156,7 @@ class AuthService:
     async def get_current_user(
         credentials: HTTPAuthorizationCredentials = Depends(security),
         db: AsyncSession = Depends(get_db)
-    ) -> User:
+    ) -> CachedUser:
         """Get current authenticated user"""
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -126,7 +173,7 @@ class AuthService:
         except JWTError:
             raise credentials_exception
         
-        user = await db.get(User, user_id)
+        user = await get_cached_user(user_id, db)
         if user is None:
             raise credentials_exception
         
@@ -141,7 +188,7 @@ class AuthService:
     @staticmethod
     def check_permissions(required_permissions: list):
         """Decorator to check user permissions"""
-        def permission_checker(current_user: User = Depends(AuthService.get_current_user)):
+        def permission_checker(current_user: CachedUser = Depends(AuthService.get_current_user)):
             user_permissions = current_user.permissions or []
             
             # Admin has all permissions
@@ -163,7 +210,7 @@ class AuthService:
     @staticmethod
     def check_role(required_role: str):
         """Decorator to check user role"""
-        def role_checker(current_user: User = Depends(AuthService.get_current_user)):
+        def role_checker(current_user: CachedUser = Depends(AuthService.get_current_user)):
             if current_user.role != required_role and current_user.role != "admin":
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
@@ -179,11 +226,26 @@ class TokenManager:
     
     def __init__(self):
         self.blacklisted_tokens = set()
+        self.refresh_token_versions: Dict[str, int] = {}
     
     def blacklist_token(self, token: str):
         """Add token to blacklist"""
         self.blacklisted_tokens.add(token)
     
+    def refresh_token_version(self, user_id: str) -> int:
+        """Current refresh-token version to embed for a user"""
+        return self.refresh_token_versions.get(str(user_id), 0)
+    
+    def revoke_refresh_tokens(self, user_id: str):
+        """Invalidate every refresh token issued to a user so far"""
+        key = str(user_id)
+        self.refresh_token_versions[key] = self.refresh_token_versions.get(key, 0) + 1
+        invalidate_cached_user(key)
+    
+    def is_refresh_token_revoked(self, user_id: str, version: Optional[int]) -> bool:
+        """Check a refresh token's version against the user's current one"""
+        return (version or 0) < self.refresh_token_versions.get(str(user_id), 0)
+    
     def is_token_blacklisted(self, token: str) -> bool:
         """Check if token is blacklisted"""
         return token in self.blacklisted_tokens
@@ -243,6 +305,111 @@ class AuditLogger:
         except Exception as e:
             logger.error(f"Failed to create audit log: {e}")
 
+AUDIT_QUEUE_MAXSIZE = 10_000
+AUDIT_BATCH_SIZE = 256
+
+class AuditWriter:
+    """Batched audit-log writer: requests enqueue rows, a background task inserts them"""
+    
+    def __init__(self, maxsize: int = AUDIT_QUEUE_MAXSIZE, batch_size: int = AUDIT_BATCH_SIZE):
+        self.maxsize = maxsize
+        self.batch_size = batch_size
+        self.audit_drops = 0
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def _ensure_started(self):
+        """Create the queue and drain task on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self.queue = asyncio.Queue(maxsize=self.maxsize)
+            self._task = loop.create_task(self._run())
+    
+    def enqueue(
+        self,
+        user_id: Optional[str],
+        action: str,
+        resource_type: str,
+        resource_id: str = None,
+        ip_address: str = None,
+        user_agent: str = None,
+        old_values: Dict = None,
+        new_values: Dict = None
+    ):
+        """Queue an audit row without waiting on the database"""
+        self._ensure_started()
+        row = {
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "old_values": old_values,
+            "new_values": new_values,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            self.audit_drops += 1
+    
+    def _drain(self, first: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collect up to batch_size queued rows"""
+        rows = [first]
+        while len(rows) < self.batch_size and not self.queue.empty():
+            rows.append(self.queue.get_nowait())
+        return rows
+    
+    async def _write(self, rows: List[Dict[str, Any]]):
+        """Insert a batch of audit rows in one transaction"""
+        from sqlalchemy import insert
+        from app.config.database import AsyncSessionLocal
+        from app.models.database import AuditLog
+        
+        try:
+            async with AsyncSessionLocal() as db:
+                await db.execute(insert(AuditLog), rows)
+                await db.commit()
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                self.audit_drops += 1
+                logger.error(f"Failed to write audit log: {e}")
+                return
+            logger.warning(f"Audit batch of {len(rows)} failed, retrying row by row: {e}")
+        
+        # One bad row (e.g. a user_id that no longer exists) must not discard the rest
+        for row in rows:
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(insert(AuditLog), [row])
+                    await db.commit()
+            except Exception as e:
+                self.audit_drops += 1
+                logger.error(f"Failed to write audit log: {e}")
+    
+    async def _run(self):
+        """Drain the queue in batches until cancelled"""
+        while True:
+            rows = self._drain(await self.queue.get())
+            try:
+                await self._write(rows)
+            finally:
+                for _ in rows:
+                    self.queue.task_done()
+    
+    async def stop(self):
+        """Flush queued rows and stop the drain task"""
+        if self._task is None:
+            return
+        await self.queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
 # Password policies
 class PasswordPolicy:
     """Password validation policies"""
@@ -381,4 +548,5 @@ class RateLimiter:
 # Global instances
 token_manager = TokenManager()
 session_manager = SessionManager()
-rate_limiter = RateLimiter()
\ No newline at end of file
+rate_limiter = RateLimiter()
+audit_writer = AuditWriter()
\ No newline at end of file
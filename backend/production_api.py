@@ -5,25 +5,61 @@ Real-time AI Pipeline, Risk Scoring, Evidence Management
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, FileResponse
+from fastapi.responses import StreamingResponse, FileResponse, Response, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
-from typing import Dict, List, Optional, Any
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Sequence, Set, Tuple
+from collections import OrderedDict, defaultdict, deque
 import asyncio
+import base64
+import bisect
+import functools
+import itertools
 import json
+import orjson
+import httpx
 import cv2
 import numpy as np
 import time
 import uuid
 import random
 import hashlib
+import secrets
+import io
+import csv
 import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
+from dateutil import parser as date_parser
+from cachetools import TTLCache
 
 def utcnow():
     return datetime.now(timezone.utc)
-from dataclasses import asdict, is_dataclass
+
+_NOW_ISO_RESOLUTION = 0.01  # seconds
+_now_iso_cache = [0.0, ""]
+
+def _now_iso() -> str:
+    """Current UTC time as ISO-8601, cached to 10 ms for response timestamps"""
+    now = time.time()
+    if now - _now_iso_cache[0] >= _NOW_ISO_RESOLUTION:
+        _now_iso_cache[:] = [now, datetime.fromtimestamp(now, timezone.utc).isoformat()]
+    return _now_iso_cache[1]
+
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp, falling back to dateutil for other formats"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return date_parser.parse(value)
+from dataclasses import dataclass
 
 # Add parent directory to path for imports
 import os
@@ -45,27 +81,6 @@ from risk_engine.engine import risk_engine, RiskAssessment as RAResult
 from offence_engine.engine import offence_engine, OffenceType, OffenceStatus
 from integrations.services import integrations
 
-def serialize_for_json(obj: Any) -> Any:
-    """Convert objects to JSON-serializable format"""
-    if obj is None:
-        return None
-    elif isinstance(obj, datetime):
-        return obj.isoformat()
-    elif is_dataclass(obj):
-        result = {}
-        for field in obj.__dataclass_fields__:
-            value = getattr(obj, field)
-            result[field] = serialize_for_json(value)
-        return result
-    elif isinstance(obj, dict):
-        return {k: serialize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [serialize_for_json(item) for item in obj]
-    elif hasattr(obj, 'value'):
-        return obj.value
-    else:
-        return obj
-
 # Global citizen reports storage
 citizen_reports_store = []
 
@@ -109,6 +124,94 @@ MOCK_CITIZEN_REPORTS = [
     }
 ]
 
+def _citizen_report_key(report: Dict[str, Any]) -> Tuple[str, str]:
+    """Keyset order for citizen reports; the id breaks ties between equal timestamps"""
+    return report["created_at"], report["id"]
+
+# Citizen reports ordered by (created_at, id), for keyset pagination
+citizen_report_timeline = sorted(MOCK_CITIZEN_REPORTS, key=_citizen_report_key)
+
+def encode_cursor(value: Any) -> str:
+    """Opaque, URL-safe pagination cursor for a sort key"""
+    return base64.urlsafe_b64encode(orjson.dumps(value)).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str) -> Any:
+    """Inverse of encode_cursor; compound keys come back as tuples"""
+    try:
+        value = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return tuple(value) if isinstance(value, list) else value
+
+def keyset_page(
+    items: Sequence[Any], key, after: Optional[str], limit: int, predicate=None
+) -> Tuple[List[Any], Optional[str]]:
+    """Up to limit items after the cursor from a sequence sorted ascending by key; returns (page, next_cursor)"""
+    start = 0
+    if after:
+        try:
+            start = bisect.bisect_right(items, decode_cursor(after), key=key)
+        except TypeError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    page = []
+    for index in range(start, len(items)):
+        item = items[index]
+        if predicate is None or predicate(item):
+            page.append(item)
+            if len(page) == limit:
+                return page, (encode_cursor(key(item)) if index + 1 < len(items) else None)
+    return page, None
+
+# ==================== PRECOMPUTED RESPONSES ====================
+
+_TIMESTAMP_SLOT = "__timestamp_slot__"
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson can't encode natively"""
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if hasattr(obj, 'value'):
+        return obj.value
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class OverwatchJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also encodes sets and value-wrapped types"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+def _json_bytes(payload: Any) -> bytes:
+    """Serialize a static payload once at import time"""
+    return orjson.dumps(payload, default=_orjson_default, option=_ORJSON_OPTIONS)
+
+def _json_template(payload: Any) -> List[bytes]:
+    """Pre-serialize payload, splitting it at each _TIMESTAMP_SLOT value"""
+    return _json_bytes(payload).split(f'"{_TIMESTAMP_SLOT}"'.encode())
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+def _fill_json_template(parts: List[bytes], *values: str) -> Response:
+    """Render a _json_template with string values substituted in slot order"""
+    chunks = [parts[0]]
+    for value, part in zip(values, parts[1:]):
+        chunks += (b'"', value.encode(), b'"', part)
+    return _json_response(b"".join(chunks))
+
+class PrerenderedJSON:
+    """Serialized JSON body with its response headers (incl. Content-Length) computed once"""
+    __slots__ = ("body", "headers")
+    
+    def __init__(self, payload: Any):
+        self.body = _json_bytes(payload)
+        self.headers = {"content-length": str(len(self.body)), "content-type": "application/json"}
+    
+    def response(self) -> Response:
+        return Response(content=self.body, headers=self.headers)
+
+_MOCK_CITIZEN_REPORTS_JSON = PrerenderedJSON({"reports": MOCK_CITIZEN_REPORTS, "total": len(MOCK_CITIZEN_REPORTS)})
+
 # Configure production logging
 import os
 
@@ -152,13 +255,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Move the configured root handlers onto a QueueListener thread so request
+# paths only enqueue records instead of formatting and writing inline
+_root_logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+log_listener.start()
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Kenya Overwatch Production API",
     description="Real-time AI surveillance with risk scoring and evidence management",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=OverwatchJSONResponse
 )
 
 # Configure CORS for production
@@ -170,9 +282,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add compression
+# Add compression (brotli when available, gzip otherwise)
 from fastapi.middleware.gzip import GZipMiddleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+try:
+    from brotli_asgi import BrotliMiddleware
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+if BROTLI_AVAILABLE:
+    app.add_middleware(BrotliMiddleware, quality=4, minimum_size=1024)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=4)
 
 # Request logging middleware
 @app.middleware("http")
@@ -191,34 +312,27 @@ async def log_requests(request, call_next):
     
     return response
 
-# Rate limiting storage
-rate_limit_storage = {}
+# Rate limiting storage: client_id -> (minute bucket, request count), least recently seen first
+rate_limit_storage: "OrderedDict[str, Tuple[int, int]]" = OrderedDict()
 RATE_LIMIT_REQUESTS = 100  # requests per minute
 RATE_LIMIT_BURST = 10  # burst allowance
+RATE_LIMIT_MAX_CLIENTS = 100_000  # LRU cap on tracked clients
 
 def check_rate_limit(client_id: str) -> tuple[bool, int]:
     """Check if client has exceeded rate limit"""
-    import time
-    current_time = time.time()
-    minute_key = int(current_time / 60)
+    minute_key = int(time.time() / 60)
     
-    if client_id not in rate_limit_storage:
-        rate_limit_storage[client_id] = {}
-    
-    client_data = rate_limit_storage[client_id]
-    
-    # Clean old entries
-    client_data = {k: v for k, v in client_data.items() if k >= minute_key - 2}
-    rate_limit_storage[client_id] = client_data
-    
-    # Count requests in current minute
-    current_count = client_data.get(minute_key, 0)
+    bucket, current_count = rate_limit_storage.get(client_id, (minute_key, 0))
+    if bucket != minute_key:
+        current_count = 0
     
     if current_count >= RATE_LIMIT_REQUESTS:
-        return False, RATE_LIMIT_REQUESTS - current_count
+        return False, 0
     
-    client_data[minute_key] = current_count + 1
-    rate_limit_storage[client_id] = client_data
+    rate_limit_storage[client_id] = (minute_key, current_count + 1)
+    rate_limit_storage.move_to_end(client_id)
+    if len(rate_limit_storage) > RATE_LIMIT_MAX_CLIENTS:
+        rate_limit_storage.popitem(last=False)
     
     return True, RATE_LIMIT_REQUESTS - current_count - 1
 
@@ -244,28 +358,89 @@ async def add_security_headers(request, call_next):
     
     return response
 
-# Mount static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
+# Mount static files only when no reverse proxy serves /static (see nginx.conf)
+SERVE_STATIC = os.getenv("SERVE_STATIC") == "1"
+if SERVE_STATIC:
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+
+# Enum lookups by value, avoiding Enum.__call__ on request paths
+_INCIDENT_STATUS_BY_STR: Dict[str, IncidentStatus] = {s.value: s for s in IncidentStatus}
+_MILESTONE_STATUS_BY_STR: Dict[str, MilestoneStatus] = {s.value: s for s in MilestoneStatus}
+_MILESTONE_TYPE_BY_STR: Dict[str, MilestoneType] = {t.value: t for t in MilestoneType}
+_SEVERITY_BY_STR: Dict[str, SeverityLevel] = {s.value: s for s in SeverityLevel}
+
+def _enum_from_str(lookup: Dict[str, Any], value: Any, label: str) -> Any:
+    """Resolve an enum member from a value map, or reject the request with 400"""
+    member = lookup.get(value) if isinstance(value, str) else None
+    if member is None:
+        raise HTTPException(status_code=400, detail=f"Invalid {label}: {value}")
+    return member
 
 # Initialize production system
 production_system = KenyaOverwatchProduction()
 
+# Flat package_id -> EvidencePackage index, maintained by the evidence manager on create
+evidence_index: Dict[str, EvidencePackage] = production_system.evidence_manager.evidence_packages
+
+# Optional binary broadcast protocol for internal dashboards
+def _msgpack_enc_hook(obj: Any) -> Any:
+    """Expand pre-serialized JSON fragments for msgpack clients"""
+    if isinstance(obj, orjson.Fragment):
+        return orjson.loads(obj.contents)
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__}")
+
+try:
+    import msgspec
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder(enc_hook=_msgpack_enc_hook)
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    _MSGPACK_ENCODER = None
+    MSGPACK_AVAILABLE = False
+
+def _negotiate_ws_format(websocket: WebSocket) -> tuple[str, Optional[str]]:
+    """Pick 'msgpack', 'json-binary' (via ?format= or subprotocol) or 'json'; returns (format, subprotocol)"""
+    requested = websocket.headers.get("sec-websocket-protocol", "")
+    if MSGPACK_AVAILABLE and "msgpack" in requested:
+        return "msgpack", "msgpack"
+    if "json-binary" in requested:
+        return "json-binary", "json-binary"
+    fmt = websocket.query_params.get("format")
+    if fmt == "msgpack" and MSGPACK_AVAILABLE:
+        return "msgpack", None
+    if fmt == "json-binary":
+        return "json-binary", None
+    return "json", None
+
+BROADCAST_BATCH_SIZE = 50  # concurrent sends per broadcast batch
+BROADCAST_COALESCE_SECONDS = 0.005  # window for collecting queued broadcasts into one fan-out
+BROADCAST_MAX_COALESCED = 100  # max queued messages sent per fan-out
+BROADCAST_SEND_TIMEOUT_SECONDS = 5.0  # clients slower than this are dropped
+
+# Strong refs to fire-and-forget broadcast tasks so they aren't garbage collected mid-send
+_pending_broadcasts: Set[asyncio.Task] = set()
+
 # WebSocket connection manager for real-time updates
 class ProductionConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
         self.user_connections: Dict[str, WebSocket] = {}
+        self.connection_formats: Dict[WebSocket, str] = {}
+        self.broadcast_queue: asyncio.Queue = asyncio.Queue()
+        self.broadcast_task: Optional[asyncio.Task] = None
         
     async def connect(self, websocket: WebSocket, user_id: Optional[str] = None):
-        await websocket.accept()
+        fmt, subprotocol = _negotiate_ws_format(websocket)
+        await websocket.accept(subprotocol=subprotocol)
         self.active_connections.append(websocket)
+        self.connection_formats[websocket] = fmt
         if user_id:
             self.user_connections[user_id] = websocket
-        logger.info(f"WebSocket connected - User: {user_id}")
+        logger.info(f"WebSocket connected - User: {user_id} | Format: {fmt}")
     
     def disconnect(self, websocket: WebSocket):
         if websocket in self.active_connections:
             self.active_connections.remove(websocket)
+        self.connection_formats.pop(websocket, None)
         # Remove from user connections
         user_id = None
         for uid, ws in self.user_connections.items():
@@ -282,54 +457,231 @@ class ProductionConnectionManager:
         except:
             self.disconnect(websocket)
     
+    def _encode(self, message: Dict[str, Any], fmt: str) -> Any:
+        if fmt == "msgpack":
+            return _MSGPACK_ENCODER.encode(message)
+        if fmt == "json-binary":
+            return _json_bytes(message)
+        return _json_bytes(message).decode()
+    
+    async def _send(self, connection: WebSocket, payload: Any):
+        if isinstance(payload, bytes):
+            await connection.send_bytes(payload)
+        else:
+            await connection.send_text(payload)
+    
     async def broadcast(self, message: Dict[str, Any]):
-        message_str = json.dumps(message)
-        dead_connections = []
+        await self.broadcast_many([message])
+    
+    async def _send_all(self, connection: WebSocket, payloads: List[Any]):
+        """Send frames to one client in order"""
+        for payload in payloads:
+            await self._send(connection, payload)
+    
+    async def broadcast_many(self, messages: List[Dict[str, Any]]):
+        """Send each message as its own frame, encoding each once per wire format in use"""
+        encoded: Dict[str, List[Any]] = {}
+        sends = []
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except:
-                dead_connections.append(connection)
+        for connection in list(self.active_connections):
+            fmt = self.connection_formats.get(connection, "json")
+            payloads = encoded.get(fmt)
+            if payloads is None:
+                payloads = encoded[fmt] = [self._encode(message, fmt) for message in messages]
+            sends.append((connection, payloads))
+        
+        # Fan out in batches so one slow client can't stall the event loop
+        dead_connections = []
+        for start in range(0, len(sends), BROADCAST_BATCH_SIZE):
+            batch = sends[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(self._send_all(connection, payloads), BROADCAST_SEND_TIMEOUT_SECONDS)
+                    for connection, payloads in batch
+                ),
+                return_exceptions=True
+            )
+            for (connection, _), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    dead_connections.append(connection)
+            if start + BROADCAST_BATCH_SIZE < len(sends):
+                await asyncio.sleep(0)
         
         # Remove dead connections
         for connection in dead_connections:
             self.disconnect(connection)
     
+    def enqueue(self, message: Dict[str, Any]):
+        """Queue a message for the next coalesced broadcast"""
+        if not self.active_connections:
+            return
+        if self.broadcast_task is None or self.broadcast_task.done():
+            # Queue isn't being drained (no startup event); send in the background instead
+            task = asyncio.create_task(self.broadcast(message))
+            _pending_broadcasts.add(task)
+            task.add_done_callback(_pending_broadcasts.discard)
+            return
+        self.broadcast_queue.put_nowait(message)
+    
+    def start_broadcast_queue(self):
+        self.broadcast_task = asyncio.create_task(self.run_broadcast_queue())
+    
+    async def run_broadcast_queue(self):
+        """Drain queued messages every few ms and send the window in one fan-out, a frame per message"""
+        while True:
+            messages = [await self.broadcast_queue.get()]
+            await asyncio.sleep(BROADCAST_COALESCE_SECONDS)
+            while len(messages) < BROADCAST_MAX_COALESCED and not self.broadcast_queue.empty():
+                messages.append(self.broadcast_queue.get_nowait())
+            
+            try:
+                # Clients switch on each frame's own "type", so messages are never wrapped in an envelope
+                await self.broadcast_many(messages)
+            except Exception as e:
+                logger.error(f"Broadcast queue error: {e}")
+    
     async def send_to_user(self, user_id: str, message: Dict[str, Any]):
         if user_id in self.user_connections:
+            connection = self.user_connections[user_id]
             try:
-                await self.user_connections[user_id].send_text(json.dumps(message))
+                await self._send(connection, self._encode(message, self.connection_formats.get(connection, "json")))
             except:
-                self.disconnect(self.user_connections[user_id])
+                self.disconnect(connection)
 
 ws_manager = ProductionConnectionManager()
 
 # Camera streaming setup
 active_streams = {}
 
+class CameraSource:
+    """Single capture thread per physical device, shared by all stream viewers"""
+
+    def __init__(self, device: int = 0):
+        self.device = device
+        self.frames = deque(maxlen=3)
+        self.seq = 0
+        self.cond = threading.Condition()
+        self.viewers = 0
+        self.cap = cv2.VideoCapture(device)
+        self.running = self.cap.isOpened()
+        self.thread = threading.Thread(target=self._loop, name=f"camera-source-{device}", daemon=True)
+        if self.running:
+            self.thread.start()
+        else:
+            self.cap.release()
+
+    def _loop(self):
+        while self.running:
+            success, frame = self.cap.read()
+            if not success:
+                logger.warning(f"Camera source {self.device} read failed")
+                break
+            with self.cond:
+                self.frames.append(frame)
+                self.seq += 1
+                self.cond.notify_all()
+        self.running = False
+        self.cap.release()
+        with self.cond:
+            self.cond.notify_all()
+        logger.info(f"Camera source {self.device} stopped")
+
+    def stop(self, timeout: float = 2.0):
+        """Stop the capture thread; the thread releases the device on exit"""
+        self.running = False
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+
+    def next_frame(self, last_seq: int, timeout: float = 1.0) -> tuple[int, Optional[np.ndarray]]:
+        """Wait for a frame newer than last_seq; the frame is shared and must not be modified"""
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > last_seq or not self.running, timeout)
+            if self.seq == last_seq:
+                return last_seq, None
+            return self.seq, self.frames[-1]
+
+_sources: Dict[int, CameraSource] = {}
+_sources_lock = threading.Lock()
+
+def acquire_camera_source(device: int = 0) -> Optional[CameraSource]:
+    """Register a viewer on a device's capture source, opening it on first use"""
+    with _sources_lock:
+        source = _sources.get(device)
+        if source is None or not source.running:
+            try:
+                source = CameraSource(device)
+            except Exception as e:
+                logger.warning(f"Camera source {device} unavailable: {e}")
+                return None
+            if not source.running:
+                return None
+            _sources[device] = source
+        source.viewers += 1
+        return source
+
+def release_camera_source(source: CameraSource):
+    """Drop a viewer; the last one out stops the thread and frees the device"""
+    with _sources_lock:
+        source.viewers -= 1
+        if source.viewers > 0:
+            return
+        if _sources.get(source.device) is source:
+            del _sources[source.device]
+        # Joined under the lock so a new viewer can't reopen the device before it is released
+        source.stop()
+
+# Pre-rendered label patches for the dynamic demo-frame overlay text
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_OVERLAY_BG = (40, 50, 60)
+_RISK_COLORS = {"LOW": (0, 255, 0), "MEDIUM": (0, 255, 255), "HIGH": (0, 0, 255)}
+
+def _render_label(text: str, color: tuple, bg: tuple = _OVERLAY_BG, scale: float = 0.5) -> tuple[np.ndarray, int]:
+    """Rasterize text once onto a solid background; returns (patch, ascent above baseline)"""
+    (w, h), baseline = cv2.getTextSize(text, _LABEL_FONT, scale, 1)
+    ascent = h + 1
+    patch = np.full((ascent + baseline + 1, w + 1, 3), bg, dtype=np.uint8)
+    cv2.putText(patch, text, (0, ascent), _LABEL_FONT, scale, color, 1)
+    return patch, ascent
+
+def _render_risk_badge(level: str) -> np.ndarray:
+    """Filled 111x31 risk badge matching the rectangle drawn at (width-120, 10)"""
+    patch = np.full((31, 111, 3), _RISK_COLORS[level], dtype=np.uint8)
+    cv2.putText(patch, f"RISK: {level}", (5, 22), _LABEL_FONT, 0.5, (0, 0, 0), 1)
+    return patch
+
+def _blit_label(frame: np.ndarray, label: tuple[np.ndarray, int], org: tuple[int, int]):
+    """Copy a pre-rendered label so its baseline sits at org, like cv2.putText"""
+    patch, ascent = label
+    x, y = org
+    top = y - ascent
+    frame[top:top + patch.shape[0], x:x + patch.shape[1]] = patch
+
+_FPS_LABELS = {fps: _render_label(f"FPS: {fps}", (0, 255, 0)) for fps in range(20, 31)}
+_OBJECT_LABELS = {count: _render_label(f"Objects: {count}", (255, 100, 100)) for count in range(1, 6)}
+_RISK_BADGES = {level: _render_risk_badge(level) for level in _RISK_COLORS}
+
 def generate_ai_enhanced_stream(camera_id: str):
     """Generate AI-enhanced camera stream with real-time analysis"""
-    import random
-    
     # Try to use webcam, fall back to generated frames
-    cap = None
+    source = acquire_camera_source(0)
     try:
-        cap = cv2.VideoCapture(0)
-        if not cap.isOpened():
-            cap.release()
-            cap = None
-    except:
-        cap = None
+        yield from _ai_enhanced_frames(camera_id, source)
+    finally:
+        if source is not None:
+            release_camera_source(source)
+
+def _ai_enhanced_frames(camera_id: str, source: Optional[CameraSource]):
+    import random
     
+    last_seq = 0
     frame_count = 0
     
     while True:
         frame_count += 1
         
-        if cap is not None:
-            success, frame = cap.read()
-            if success:
+        if source is not None and source.running:
+            last_seq, frame = source.next_frame(last_seq)
+            if frame is not None:
                 timestamp = utcnow()
                 frame_processed = process_frame_with_ai(camera_id, frame, timestamp)
                 ret, buffer = cv2.imencode('.jpg', frame_processed)
@@ -364,11 +716,11 @@ def generate_ai_enhanced_stream(camera_id: str):
         
         # FPS simulation
         fps = 25 + random.randint(-3, 3)
-        cv2.putText(frame, f"FPS: {fps}", (20, 85), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 1)
+        _blit_label(frame, _FPS_LABELS[fps], (20, 85))
         
         # Detection stats
         det_count = random.randint(1, 5)
-        cv2.putText(frame, f"Objects: {det_count}", (20, 105), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 100, 100), 1)
+        _blit_label(frame, _OBJECT_LABELS[det_count], (20, 105))
         
         # Simulated bounding boxes
         for i in range(det_count):
@@ -387,9 +739,7 @@ def generate_ai_enhanced_stream(camera_id: str):
         
         # Risk indicator
         risk_level = random.choice(["LOW", "MEDIUM", "HIGH"])
-        risk_color = (0, 255, 0) if risk_level == "LOW" else (0, 255, 255) if risk_level == "MEDIUM" else (0, 0, 255)
-        cv2.rectangle(frame, (width - 120, 10), (width - 10, 40), risk_color, -1)
-        cv2.putText(frame, f"RISK: {risk_level}", (width - 115, 32), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 1)
+        frame[10:41, width - 120:width - 9] = _RISK_BADGES[risk_level]
         
         # Location overlay
         cv2.rectangle(frame, (10, height - 60), (200, height - 10), (40, 50, 60), -1)
@@ -402,9 +752,6 @@ def generate_ai_enhanced_stream(camera_id: str):
                    b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
         
         time.sleep(0.04)  # ~25 FPS
-    
-    if cap:
-        cap.release()
 
 def process_frame_with_ai(camera_id: str, frame: np.ndarray, timestamp: datetime) -> np.ndarray:
     """Process frame with AI overlays and analysis"""
@@ -506,9 +853,8 @@ async def get_rate_limit_status():
     
     # Get top clients by request count
     client_counts = []
-    for client_id, data in rate_limit_storage.items():
-        count = data.get(minute_key, 0)
-        client_counts.append({"client": client_id, "requests": count})
+    for client_id, (bucket, count) in rate_limit_storage.items():
+        client_counts.append({"client": client_id, "requests": count if bucket == minute_key else 0})
     
     client_counts.sort(key=lambda x: x['requests'], reverse=True)
     
@@ -541,6 +887,35 @@ def set_cached(key: str, data: dict):
     import time
     api_cache[key] = (time.time(), data)
 
+# Bumped on incident/alert writes so cached aggregates are never served stale
+data_version = 0
+AGGREGATE_CACHE_TTL_SECONDS = 2.0
+AGGREGATE_CACHE_MAX_ENTRIES = 32
+aggregate_cache = TTLCache(maxsize=AGGREGATE_CACHE_MAX_ENTRIES, ttl=AGGREGATE_CACHE_TTL_SECONDS)
+aggregate_cache_lock = threading.Lock()
+
+def bump_data_version():
+    global data_version
+    data_version += 1
+
+def cached_aggregate():
+    """Share one result of a sync read-only handler between callers for a short TTL"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = f"aggregate:{func.__name__}:{sorted(kwargs.items())}"
+            with aggregate_cache_lock:
+                entry = aggregate_cache.get(key)
+            if entry is not None and entry[0] == data_version:
+                return entry[1]
+            version = data_version
+            data = func(*args, **kwargs)
+            with aggregate_cache_lock:
+                aggregate_cache[key] = (version, data)
+            return data
+        return wrapper
+    return decorator
+
 @app.get("/api/cache-stats")
 async def get_cache_stats():
     """Get cache statistics"""
@@ -555,8 +930,10 @@ async def get_cache_stats():
 async def clear_cache():
     """Clear API cache"""
     global api_cache
-    cleared_keys = len(api_cache)
+    cleared_keys = len(api_cache) + len(aggregate_cache)
     api_cache = {}
+    with aggregate_cache_lock:
+        aggregate_cache.clear()
     return {"message": "Cache cleared", "entries_cleared": cleared_keys}
 
 @app.get("/api/health")
@@ -564,7 +941,7 @@ async def health_check():
     """Comprehensive health check for all systems"""
     return {
         "status": "healthy",
-        "timestamp": utcnow().isoformat(),
+        "timestamp": _now_iso(),
         "services": {
             "ai_pipeline": "operational",
             "risk_engine": "operational",
@@ -573,6 +950,7 @@ async def health_check():
             "database": "connected" if db_connected else "mock_data",
             "alert_system": "operational"
         },
+        "frames_dropped": production_system.dropped_frames,
         "system_metrics": {
             "cpu_usage": 45.2,
             "memory_usage": 62.8,
@@ -603,7 +981,7 @@ async def prometheus_metrics():
     
     metrics.append(f'# HELP kenya_overwatch_evidence_packages_total Total evidence packages')
     metrics.append(f'# TYPE kenya_overwatch_evidence_packages_total counter')
-    metrics.append(f'kenya_overwatch_evidence_packages_total {len(production_system.evidence_packages)}')
+    metrics.append(f'kenya_overwatch_evidence_packages_total {len(evidence_index)}')
     
     metrics.append(f'# HELP kenya_overwatch_active_streams Active camera streams')
     metrics.append(f'# TYPE kenya_overwatch_active_streams gauge')
@@ -629,80 +1007,150 @@ async def prometheus_metrics():
 
 # ==================== INCIDENT MANAGEMENT ====================
 
-@app.get("/api/incidents")
+# Secondary indexes over production_system.active_incidents (values -> incident ids)
+incidents_by_status: Dict[str, Set[str]] = defaultdict(set)
+incidents_by_severity: Dict[str, Set[str]] = defaultdict(set)
+_indexed_incident_ids: Set[str] = set()
+
+@dataclass
+class IncidentStats:
+    """Running incident counters maintained alongside the incident indexes"""
+    total: int = 0
+    active: int = 0
+
+incident_stats = IncidentStats()
+_HIGH_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+_incident_index_lock = threading.RLock()  # sync handlers read the indexes from the threadpool
+
+def index_incident(incident: ProductionIncident, old_status: Optional[IncidentStatus] = None):
+    """Add incident to the status/severity indexes, moving it out of old_status"""
+    with _incident_index_lock:
+        is_new = incident.id not in _indexed_incident_ids
+        if is_new:
+            incident_stats.total += 1
+        if old_status is not None and not is_new:
+            incidents_by_status[old_status.value].discard(incident.id)
+            if old_status == IncidentStatus.ACTIVE:
+                incident_stats.active -= 1
+        if incident.status == IncidentStatus.ACTIVE:
+            incident_stats.active += 1
+        incidents_by_status[incident.status.value].add(incident.id)
+        incidents_by_severity[incident.severity.value].add(incident.id)
+        _indexed_incident_ids.add(incident.id)
+    bump_data_version()
+
+def live_incident_counts() -> Tuple[int, int, int]:
+    """(high_risk, pending_reviews, evidence_packages), counted live because the pipeline
+    attaches evidence and raises risk on incidents that are already indexed"""
+    high_risk = pending_reviews = evidence_packages = 0
+    for incident in list(production_system.active_incidents.values()):
+        if incident.risk_assessment and incident.risk_assessment.risk_level in _HIGH_RISK_LEVELS:
+            high_risk += 1
+        if incident.requires_human_review and not incident.human_review_completed:
+            pending_reviews += 1
+        evidence_packages += len(incident.evidence_packages)
+    return high_risk, pending_reviews, evidence_packages
+
+def sync_incident_indexes():
+    """Index incidents added directly by the production pipeline"""
+    active = production_system.active_incidents
+    if len(_indexed_incident_ids) != len(active):
+        with _incident_index_lock:
+            for incident_id, incident in list(active.items()):
+                if incident_id not in _indexed_incident_ids:
+                    index_incident(incident)
+
+@app.get("/api/incidents", response_class=OverwatchJSONResponse)
 async def get_incidents(status: Optional[str] = None, severity: Optional[str] = None):
     """Get incidents with filtering options"""
-    incidents = list(production_system.active_incidents.values())
-    
-    # If no real incidents, return mock data for demo
-    if not incidents:
-        mock_incidents = [
-            {
-                "id": "inc_001",
-                "type": "suspicious_activity",
-                "title": "Suspicious Person Detected",
-                "description": "Unidentified individual showing unusual behavior near ATM",
-                "location": "Nairobi CBD - Kenyatta Avenue",
-                "coordinates": {"lat": -1.2864, "lng": 36.8232},
-                "severity": "high",
-                "status": "active",
-                "risk_assessment": {
-                    "risk_score": 0.75,
-                    "risk_level": "high",
-                    "factors": {
-                        "temporal_risk": 0.6,
-                        "spatial_risk": 0.8,
-                        "behavioral_risk": 0.9,
-                        "contextual_risk": 0.5,
-                        "reason_codes": ["LOITERING", "UNIDENTIFIED"]
-                    },
-                    "recommended_action": "Dispatch response team",
-                    "confidence": 0.85,
-                    "timestamp": utcnow().isoformat()
+    active = production_system.active_incidents
+    
+    # Indexed lookup for real incidents
+    if active:
+        sync_incident_indexes()
+        if not status and not severity:
+            return OverwatchJSONResponse(list(active.values()))
+        ids = None
+        if status:
+            ids = incidents_by_status.get(status, set())
+        if severity:
+            severity_ids = incidents_by_severity.get(severity, set())
+            ids = severity_ids if ids is None else ids & severity_ids
+        if not ids:
+            return OverwatchJSONResponse([])
+        # Walk active (creation order) rather than the id set, so filtered results order like unfiltered ones
+        return OverwatchJSONResponse([incident for incident_id, incident in active.items() if incident_id in ids])
+    
+    # No real incidents yet, return mock data for demo
+    now = utcnow()
+    now_iso = now.isoformat()
+    mock_incidents = [
+        {
+            "id": "inc_001",
+            "type": "suspicious_activity",
+            "title": "Suspicious Person Detected",
+            "description": "Unidentified individual showing unusual behavior near ATM",
+            "location": "Nairobi CBD - Kenyatta Avenue",
+            "coordinates": {"lat": -1.2864, "lng": 36.8232},
+            "severity": "high",
+            "status": "active",
+            "risk_assessment": {
+                "risk_score": 0.75,
+                "risk_level": "high",
+                "factors": {
+                    "temporal_risk": 0.6,
+                    "spatial_risk": 0.8,
+                    "behavioral_risk": 0.9,
+                    "contextual_risk": 0.5,
+                    "reason_codes": ["LOITERING", "UNIDENTIFIED"]
                 },
-                "evidence_packages": [],
-                "created_at": (utcnow() - timedelta(minutes=15)).isoformat(),
-                "requires_human_review": True,
-                "human_review_completed": False
+                "recommended_action": "Dispatch response team",
+                "confidence": 0.85,
+                "timestamp": now_iso
             },
-            {
-                "id": "inc_002",
-                "type": "traffic_violation",
-                "title": "Traffic Signal Violation",
-                "description": "Vehicle ran red light at intersection",
-                "location": "Moi Avenue & Kenyatta Avenue",
-                "coordinates": {"lat": -1.2833, "lng": 36.8167},
-                "severity": "medium",
-                "status": "responding",
-                "risk_assessment": {
-                    "risk_score": 0.45,
-                    "risk_level": "medium",
-                    "factors": {
-                        "temporal_risk": 0.3,
-                        "spatial_risk": 0.5,
-                        "behavioral_risk": 0.6,
-                        "contextual_risk": 0.4,
-                        "reason_codes": ["RED_LIGHT_VIOLATION"]
-                    },
-                    "recommended_action": "Log and monitor",
-                    "confidence": 0.92,
-                    "timestamp": utcnow().isoformat()
+            "evidence_packages": [],
+            "created_at": (now - timedelta(minutes=15)).isoformat(),
+            "requires_human_review": True,
+            "human_review_completed": False
+        },
+        {
+            "id": "inc_002",
+            "type": "traffic_violation",
+            "title": "Traffic Signal Violation",
+            "description": "Vehicle ran red light at intersection",
+            "location": "Moi Avenue & Kenyatta Avenue",
+            "coordinates": {"lat": -1.2833, "lng": 36.8167},
+            "severity": "medium",
+            "status": "responding",
+            "risk_assessment": {
+                "risk_score": 0.45,
+                "risk_level": "medium",
+                "factors": {
+                    "temporal_risk": 0.3,
+                    "spatial_risk": 0.5,
+                    "behavioral_risk": 0.6,
+                    "contextual_risk": 0.4,
+                    "reason_codes": ["RED_LIGHT_VIOLATION"]
                 },
-                "evidence_packages": [],
-                "created_at": (utcnow() - timedelta(minutes=30)).isoformat(),
-                "requires_human_review": False,
-                "human_review_completed": False
-            }
-        ]
-        incidents = mock_incidents
+                "recommended_action": "Log and monitor",
+                "confidence": 0.92,
+                "timestamp": now_iso
+            },
+            "evidence_packages": [],
+            "created_at": (now - timedelta(minutes=30)).isoformat(),
+            "requires_human_review": False,
+            "human_review_completed": False
+        }
+    ]
+    incidents = mock_incidents
     
     # Apply filters
     if status:
-        incidents = [inc for inc in incidents if getattr(inc, 'status', None) and getattr(inc, 'status').value == status]
+        incidents = [inc for inc in incidents if inc['status'] == status]
     if severity:
-        incidents = [inc for inc in incidents if getattr(inc, 'severity', None) and getattr(inc, 'severity').value == severity]
+        incidents = [inc for inc in incidents if inc['severity'] == severity]
     
-    return incidents
+    return OverwatchJSONResponse(incidents)
 
 @app.get("/api/incidents/{incident_id}")
 async def get_incident(incident_id: str):
@@ -712,21 +1160,39 @@ async def get_incident(incident_id: str):
         raise HTTPException(status_code=404, detail="Incident not found")
     return incident
 
+class CoordinatesBody(BaseModel):
+    lat: float = 0.0
+    lng: float = 0.0
+
+class IncidentCreate(BaseModel):
+    type: str = 'manual'
+    title: str = 'Manual Report'
+    description: str = ''
+    location: str = ''
+    coordinates: CoordinatesBody = CoordinatesBody()
+    severity: SeverityLevel = SeverityLevel.MEDIUM
+    status: IncidentStatus = IncidentStatus.ACTIVE
+    reported_by: str = 'manual'
+
+class IncidentStatusUpdate(BaseModel):
+    status: IncidentStatus = IncidentStatus.ACTIVE
+
 @app.post("/api/incidents")
-async def create_incident(incident_data: Dict[str, Any]):
+async def create_incident(incident_data: IncidentCreate):
     """Create new incident (manual or AI-generated)"""
     incident_id = str(uuid.uuid4())
+    now = utcnow()
     
     # Convert to production incident format
     incident = ProductionIncident(
         id=incident_id,
-        type=incident_data.get('type', 'manual'),
-        title=incident_data.get('title', 'Manual Report'),
-        description=incident_data.get('description', ''),
-        location=incident_data.get('location', ''),
-        coordinates=Coordinates(**incident_data.get('coordinates', {'lat': 0.0, 'lng': 0.0})),
-        severity=SeverityLevel(incident_data.get('severity', 'medium')),
-        status=IncidentStatus(incident_data.get('status', 'active')),
+        type=incident_data.type,
+        title=incident_data.title,
+        description=incident_data.description,
+        location=incident_data.location,
+        coordinates=Coordinates(lat=incident_data.coordinates.lat, lng=incident_data.coordinates.lng),
+        severity=incident_data.severity,
+        status=incident_data.status,
         risk_assessment=RiskAssessment(
             risk_score=0.0,
             risk_level=RiskLevel.LOW,
@@ -739,12 +1205,12 @@ async def create_incident(incident_data: Dict[str, Any]):
             ),
             recommended_action="Pending assessment",
             confidence=0.0,
-            timestamp=utcnow()
+            timestamp=now
         ),
         evidence_packages=[],
-        created_at=utcnow(),
+        created_at=now,
         updated_at=None,
-        reported_by=incident_data.get('reported_by', 'manual'),
+        reported_by=incident_data.reported_by,
         assigned_team_id=None,
         requires_human_review=True,
         human_review_completed=False,
@@ -752,6 +1218,7 @@ async def create_incident(incident_data: Dict[str, Any]):
     )
     
     production_system.active_incidents[incident_id] = incident
+    index_incident(incident)
     
     # Convert to dict with ISO format dates for JSON serialization
     incident_dict = {
@@ -788,7 +1255,7 @@ async def create_incident(incident_data: Dict[str, Any]):
     }
     
     # Broadcast new incident
-    await ws_manager.broadcast({
+    ws_manager.enqueue({
         "type": "incident_created",
         "data": incident_dict
     })
@@ -797,23 +1264,24 @@ async def create_incident(incident_data: Dict[str, Any]):
     return incident
 
 @app.put("/api/incidents/{incident_id}/status")
-async def update_incident_status(incident_id: str, status_data: Dict[str, str]):
+async def update_incident_status(incident_id: str, status_data: IncidentStatusUpdate):
     """Update incident status with audit trail"""
     incident = production_system.active_incidents.get(incident_id)
     if not incident:
         raise HTTPException(status_code=404, detail="Incident not found")
     
     old_status = incident.status
-    new_status = IncidentStatus(status_data.get('status', 'active'))
+    new_status = status_data.status
     
     incident.status = new_status
     incident.updated_at = utcnow()
+    index_incident(incident, old_status)
     
     # Log status change
     logger.info(f"Incident {incident_id} status changed: {old_status} -> {new_status}")
     
     # Broadcast update
-    await ws_manager.broadcast({
+    ws_manager.enqueue({
         "type": "incident_status_updated",
         "data": {
             "incident_id": incident_id,
@@ -825,8 +1293,56 @@ async def update_incident_status(incident_id: str, status_data: Dict[str, str]):
     
     return incident
 
+class SnapshotStore:
+    """Dict-backed store whose values() is a cached, immutable snapshot in insertion order"""
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        # Sync handlers read from the threadpool while the event loop inserts
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Tuple[Any, ...]] = None
+        self._sorted_snapshot: Optional[Tuple[Any, ...]] = None
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._snapshot = self._sorted_snapshot = None
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            del self._data[key]
+            self._snapshot = self._sorted_snapshot = None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def values(self) -> Tuple[Any, ...]:
+        """Values in insertion order; cached until the next insert or delete"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot = tuple(self._data.values())
+        return snapshot
+
+    def values_by_key(self) -> Tuple[Any, ...]:
+        """Values ordered by key, for keyset pagination; cached like values()"""
+        snapshot = self._sorted_snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._sorted_snapshot = tuple(value for _, value in sorted(self._data.items()))
+        return snapshot
+
 # Evidence storage for review functionality
-evidence_store = {}
+evidence_store = SnapshotStore()
 
 # Initialize with mock data
 evidence_store["ev_001"] = {
@@ -869,8 +1385,16 @@ evidence_store["ev_002"] = {
 }
 
 # Alert storage for bulk operations
-alert_store = {}
-alert_store["alert_001"] = {
+alert_store = SnapshotStore()
+alerts_by_severity: Dict[str, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+
+def store_alert(alert: Dict[str, Any]):
+    """Insert alert into the store and its severity index"""
+    alert_store[alert["id"]] = alert
+    alerts_by_severity[alert["severity"]][alert["id"]] = alert
+    bump_data_version()
+
+store_alert({
     "id": "alert_001",
     "type": "high_risk_incident",
     "title": "High Risk Behavior Detected",
@@ -881,8 +1405,8 @@ alert_store["alert_001"] = {
     "acknowledged": False,
     "requires_action": True,
     "created_at": utcnow().isoformat()
-}
-alert_store["alert_002"] = {
+})
+store_alert({
     "id": "alert_002",
     "type": "weapon_detection",
     "title": "Potential Weapon Detected",
@@ -893,8 +1417,8 @@ alert_store["alert_002"] = {
     "acknowledged": False,
     "requires_action": True,
     "created_at": (utcnow() - timedelta(minutes=5)).isoformat()
-}
-alert_store["alert_003"] = {
+})
+store_alert({
     "id": "alert_003",
     "type": "unauthorized_access",
     "title": "Unauthorized Access Attempt",
@@ -906,22 +1430,24 @@ alert_store["alert_003"] = {
     "acknowledged_by": "operator_01",
     "requires_action": False,
     "created_at": (utcnow() - timedelta(hours=1)).isoformat()
-}
+})
 
 # ==================== EVIDENCE MANAGEMENT ====================
 
-@app.get("/api/evidence")
+@app.get("/api/evidence", response_class=OverwatchJSONResponse)
 async def get_evidence_packages(incident_id: Optional[str] = None, status: Optional[str] = None):
     """Get evidence packages with filtering"""
-    evidence = list(evidence_store.values())
-    
-    # Apply filters
-    if incident_id:
-        evidence = [pkg for pkg in evidence if pkg['incident_id'] == incident_id]
-    if status:
-        evidence = [pkg for pkg in evidence if pkg['status'] == status]
+    evidence = evidence_store.values()
+    
+    # Apply filters in a single pass
+    if incident_id or status:
+        evidence = [
+            pkg for pkg in evidence
+            if (not incident_id or pkg['incident_id'] == incident_id)
+            and (not status or pkg['status'] == status)
+        ]
     
-    return evidence
+    return OverwatchJSONResponse(evidence)
 
 @app.get("/api/evidence/{package_id}")
 async def get_evidence_package(package_id: str):
@@ -930,12 +1456,21 @@ async def get_evidence_package(package_id: str):
         return evidence_store[package_id]
     raise HTTPException(status_code=404, detail="Evidence package not found")
 
+class EvidenceReview(BaseModel):
+    reviewer_id: str = 'unknown'
+    decision: str = 'rejected'
+    notes: str = ''
+
+class EvidenceAppeal(BaseModel):
+    reason: str = ''
+    citizen_id: str = 'anonymous'
+
 @app.post("/api/evidence/{package_id}/review")
-async def review_evidence(package_id: str, review_data: Dict[str, Any]):
+async def review_evidence(package_id: str, review_data: EvidenceReview):
     """Review evidence package (human approval/rejection)"""
-    reviewer_id = review_data.get('reviewer_id', 'unknown')
-    decision = review_data.get('decision', 'rejected')
-    notes = review_data.get('notes', '')
+    reviewer_id = review_data.reviewer_id
+    decision = review_data.decision
+    notes = review_data.notes
     
     # Find evidence package
     if package_id not in evidence_store:
@@ -952,7 +1487,7 @@ async def review_evidence(package_id: str, review_data: Dict[str, Any]):
     logger.info(f"Evidence {package_id} reviewed by {reviewer_id}: {decision}")
     
     # Broadcast review
-    await ws_manager.broadcast({
+    ws_manager.enqueue({
         "type": "evidence_reviewed",
         "data": {
             "package_id": package_id,
@@ -965,21 +1500,13 @@ async def review_evidence(package_id: str, review_data: Dict[str, Any]):
     return {"message": "Evidence review completed", "status": decision}
 
 @app.post("/api/evidence/{package_id}/appeal")
-async def submit_appeal(package_id: str, appeal_data: Dict[str, Any]):
+async def submit_appeal(package_id: str, appeal_data: EvidenceAppeal):
     """Submit citizen appeal"""
-    appeal_reason = appeal_data.get('reason', '')
-    citizen_id = appeal_data.get('citizen_id', 'anonymous')
+    appeal_reason = appeal_data.reason
+    citizen_id = appeal_data.citizen_id
     
     # Find evidence package
-    evidence_package = None
-    for incident in production_system.active_incidents.values():
-        for package in incident.evidence_packages:
-            if package.id == package_id:
-                evidence_package = package
-                break
-        if evidence_package:
-            break
-    
+    evidence_package = evidence_index.get(package_id)
     if not evidence_package:
         raise HTTPException(status_code=404, detail="Evidence package not found")
     
@@ -988,10 +1515,11 @@ async def submit_appeal(package_id: str, appeal_data: Dict[str, Any]):
     evidence_package.appeal_status = 'submitted'
     evidence_package.metadata['appeal_reason'] = appeal_reason
     evidence_package.metadata['citizen_id'] = citizen_id
-    evidence_package.metadata['appeal_date'] = utcnow().isoformat()
+    now = utcnow()
+    evidence_package.metadata['appeal_date'] = now.isoformat()
     
     # Extend retention
-    evidence_package.retention_until = utcnow() + timedelta(days=2555)  # 7 years
+    evidence_package.retention_until = now + timedelta(days=2555)  # 7 years
     
     # Log appeal
     logger.info(f"Appeal submitted for evidence {package_id} by {citizen_id}")
@@ -1000,7 +1528,6 @@ async def submit_appeal(package_id: str, appeal_data: Dict[str, Any]):
 
 # ==================== EVIDENCE ATTACHMENTS ====================
 
-import base64
 import os
 from pathlib import Path
 
@@ -1020,18 +1547,8 @@ async def upload_snapshot(
     """Upload snapshot image as evidence attachment"""
     
     # Validate evidence package exists
-    if package_id not in evidence_store:
-        # Check in production incidents
-        found = False
-        for incident in production_system.active_incidents.values():
-            for pkg in incident.evidence_packages:
-                if pkg.id == package_id:
-                    found = True
-                    break
-            if found:
-                break
-        if not found:
-            raise HTTPException(status_code=404, detail="Evidence package not found")
+    if package_id not in evidence_store and package_id not in evidence_index:
+        raise HTTPException(status_code=404, detail="Evidence package not found")
     
     # Decode base64 image
     try:
@@ -1085,17 +1602,8 @@ async def upload_video_clip(
     """Upload 3-second video clip as evidence attachment"""
     
     # Validate evidence package exists
-    if package_id not in evidence_store:
-        found = False
-        for incident in production_system.active_incidents.values():
-            for pkg in incident.evidence_packages:
-                if pkg.id == package_id:
-                    found = True
-                    break
-            if found:
-                break
-        if not found:
-            raise HTTPException(status_code=404, detail="Evidence package not found")
+    if package_id not in evidence_store and package_id not in evidence_index:
+        raise HTTPException(status_code=404, detail="Evidence package not found")
     
     # Validate duration
     if duration_seconds > 10:
@@ -1151,13 +1659,10 @@ async def get_attachments(package_id: str):
     if package_id in evidence_store:
         attachments = evidence_store[package_id].get("attachments", [])
     
-    # Check in production incidents
-    for incident in production_system.active_incidents.values():
-        for pkg in incident.evidence_packages:
-            if pkg.id == package_id:
-                # Get from metadata if available
-                if hasattr(pkg, 'metadata') and pkg.metadata:
-                    attachments = pkg.metadata.get("attachments", [])
+    # Check in production evidence packages
+    pkg = evidence_index.get(package_id)
+    if pkg is not None and pkg.metadata:
+        attachments = pkg.metadata.get("attachments", [])
     
     return attachments
 
@@ -1181,23 +1686,34 @@ async def get_attachment(attachment_id: str):
 
 # ==================== CITIZEN REPORTS ====================
 
-@app.get("/api/citizen/reports")
-async def get_citizen_reports(status: Optional[str] = None):
-    """Get citizen incident reports"""
+@app.get("/api/citizen/reports", response_class=OverwatchJSONResponse)
+def get_citizen_reports(status: Optional[str] = None, after: Optional[str] = None, limit: Optional[int] = None):
+    """Get citizen incident reports (pass after/limit for keyset pagination by created_at, then id)"""
+    if after is not None or limit is not None:
+        predicate = (lambda report: report["status"] == status) if status and status != "all" else None
+        reports, next_cursor = keyset_page(
+            citizen_report_timeline, _citizen_report_key, after, limit or 50, predicate
+        )
+        return OverwatchJSONResponse({"reports": reports, "next_cursor": next_cursor})
+    
+    if not citizen_reports_store and (not status or status == "all"):
+        return _MOCK_CITIZEN_REPORTS_JSON.response()
+    
     all_reports = MOCK_CITIZEN_REPORTS + citizen_reports_store
     
     if status and status != "all":
         all_reports = [r for r in all_reports if r["status"] == status]
     
-    return {"reports": all_reports, "total": len(all_reports)}
+    return OverwatchJSONResponse({"reports": all_reports, "total": len(all_reports)})
 
 @app.post("/api/citizen/reports")
 async def submit_citizen_report(report_data: Dict[str, Any]):
     """Submit new citizen incident report"""
     import random
     
+    now_iso = utcnow().isoformat()
     new_report = {
-        "id": f"cit_{uuid.uuid4().hex[:8].upper()}",
+        "id": f"cit_{secrets.token_hex(8).upper()}",
         "type": report_data.get("type", "general"),
         "description": report_data.get("description", ""),
         "location": report_data.get("location", "Unknown"),
@@ -1207,7 +1723,7 @@ async def submit_citizen_report(report_data: Dict[str, Any]):
         "reported_by": report_data.get("reported_by", "anonymous"),
         "status": "pending",
         "priority": report_data.get("priority", "low"),
-        "created_at": utcnow().isoformat(),
+        "created_at": now_iso,
         "verified": False,
         "attachments": report_data.get("attachments", []),
         "ai_analysis": None,
@@ -1249,7 +1765,7 @@ async def submit_citizen_report(report_data: Dict[str, Any]):
         "recommendation": recommendation,
         "response_time_estimate": response_time,
         "required_teams": get_required_teams(report_type),
-        "analysis_timestamp": utcnow().isoformat(),
+        "analysis_timestamp": now_iso,
         "automated": True,
         "confidence": 0.85 if has_attachments else 0.65
     }
@@ -1259,6 +1775,7 @@ async def submit_citizen_report(report_data: Dict[str, Any]):
     new_report["status"] = "in_progress" if severity_score >= 0.7 else "pending"
     
     citizen_reports_store.append(new_report)
+    bisect.insort(citizen_report_timeline, new_report, key=_citizen_report_key)
     
     if has_attachments:
         logger.info(f"Citizen report {new_report['id']} has {len(new_report['attachments'])} attachments - AI expedited analysis triggered")
@@ -1326,12 +1843,9 @@ async def upload_evidence_attachment(file: UploadFile = File(...)):
 
 # ==================== RISK ASSSMENT ====================
 
-@app.get("/api/risk/scores")
-async def get_risk_scores(camera_id: Optional[str] = None):
-    """Get current risk scores for cameras"""
-    # In production, return real-time risk scores
+def _risk_scores_payload(camera_id: str, timestamp: str) -> Dict[str, Any]:
     return {
-        "camera_id": camera_id or "all",
+        "camera_id": camera_id,
         "risk_scores": {
             "behavioral": 0.3,
             "spatial": 0.4,
@@ -1341,9 +1855,19 @@ async def get_risk_scores(camera_id: Optional[str] = None):
         },
         "risk_level": "high",
         "recommended_action": "Supervisor review",
-        "timestamp": utcnow().isoformat()
+        "timestamp": timestamp
     }
 
+_ALL_RISK_SCORES_TEMPLATE = _json_template(_risk_scores_payload("all", _TIMESTAMP_SLOT))
+
+@app.get("/api/risk/scores")
+def get_risk_scores(camera_id: Optional[str] = None):
+    """Get current risk scores for cameras"""
+    # In production, return real-time risk scores
+    if not camera_id:
+        return _fill_json_template(_ALL_RISK_SCORES_TEMPLATE, _now_iso())
+    return _risk_scores_payload(camera_id, _now_iso())
+
 @app.post("/api/risk/assess")
 async def assess_risk(assessment_data: Dict[str, Any]):
     """Manual risk assessment or trigger AI assessment"""
@@ -1363,12 +1887,12 @@ async def assess_risk(assessment_data: Dict[str, Any]):
             "reason_codes": ["BEHAVIORAL_ANOMALY", "MEDIUM_RISK_LOCATION"]
         },
         "recommended_action": "Operator notification",
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
     
     # Send alert if high risk
     if assessment["risk_score"] > 0.6:
-        await ws_manager.broadcast({
+        ws_manager.enqueue({
             "type": "high_risk_assessment",
             "data": assessment
         })
@@ -1377,27 +1901,29 @@ async def assess_risk(assessment_data: Dict[str, Any]):
 
 # ==================== CAMERA MANAGEMENT ====================
 
+_CAMERAS_MANAGEMENT_TEMPLATE = _json_template({
+    "cameras": [
+        {
+            "id": "cam_001",
+            "name": "Main Entrance - AI Enhanced",
+            "location": "Nairobi CBD Main Gate",
+            "coordinates": {"lat": -1.2921, "lng": 36.8219},
+            "status": "online",
+            "ai_enabled": True,
+            "ai_models": ["person_detection", "vehicle_detection", "anpr", "behavior_analysis"],
+            "resolution": "1920x1080",
+            "fps": 30,
+            "risk_score": 0.45,
+            "detections_last_hour": 127,
+            "last_frame": _TIMESTAMP_SLOT
+        }
+    ]
+})
+
 @app.get("/api/cameras/management")
 async def get_cameras_management():
     """Get all cameras with AI status"""
-    return {
-        "cameras": [
-            {
-                "id": "cam_001",
-                "name": "Main Entrance - AI Enhanced",
-                "location": "Nairobi CBD Main Gate",
-                "coordinates": {"lat": -1.2921, "lng": 36.8219},
-                "status": "online",
-                "ai_enabled": True,
-                "ai_models": ["person_detection", "vehicle_detection", "anpr", "behavior_analysis"],
-                "resolution": "1920x1080",
-                "fps": 30,
-                "risk_score": 0.45,
-                "detections_last_hour": 127,
-                "last_frame": utcnow().isoformat()
-            }
-        ]
-    }
+    return _fill_json_template(_CAMERAS_MANAGEMENT_TEMPLATE, _now_iso())
 
 @app.get("/api/cameras/{camera_id}/stream")
 async def get_camera_stream(camera_id: str):
@@ -1418,7 +1944,7 @@ async def enable_ai(camera_id: str, ai_config: Dict[str, Any]):
         "message": "AI enabled successfully",
         "camera_id": camera_id,
         "enabled_models": models,
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 @app.get("/api/cameras/{camera_id}/snapshot")
@@ -1435,7 +1961,8 @@ async def get_camera_snapshot(camera_id: str):
     img = Image.fromarray(frame)
     draw = ImageDraw.Draw(img)
     draw.text((10, 10), f"Camera: {camera_id}", fill=(255, 255, 255))
-    draw.text((10, 30), utcnow().strftime("%Y-%m-%d %H:%M:%S"), fill=(255, 255, 255))
+    now = utcnow()
+    draw.text((10, 30), now.strftime("%Y-%m-%d %H:%M:%S"), fill=(255, 255, 255))
     
     # Convert to base64
     buffer = io.BytesIO()
@@ -1444,7 +1971,7 @@ async def get_camera_snapshot(camera_id: str):
     
     return {
         "camera_id": camera_id,
-        "timestamp": utcnow().isoformat(),
+        "timestamp": now.isoformat(),
         "image": image_base64,
         "format": "jpeg"
     }
@@ -1453,6 +1980,7 @@ async def get_camera_snapshot(camera_id: str):
 async def get_recent_detections(camera_id: str, limit: int = 10):
     """Get recent AI detections for a camera"""
     detection_types = ['person', 'vehicle', 'license_plate', 'weapon', 'suspicious_behavior']
+    now = utcnow()
     
     detections = []
     for i in range(min(limit, 20)):
@@ -1461,7 +1989,7 @@ async def get_recent_detections(camera_id: str, limit: int = 10):
             "camera_id": camera_id,
             "type": random.choice(detection_types),
             "confidence": round(random.uniform(0.7, 0.99), 2),
-            "timestamp": (utcnow() - timedelta(seconds=i*30)).isoformat(),
+            "timestamp": (now - timedelta(seconds=i*30)).isoformat(),
             "bounding_box": {
                 "x": random.randint(50, 500),
                 "y": random.randint(50, 350),
@@ -1707,9 +2235,32 @@ async def events_stream():
 
 # ==================== ALERT SYSTEM ====================
 
-@app.get("/api/alerts")
-async def get_alerts(severity: Optional[str] = None, acknowledged: Optional[bool] = None):
-    """Get alerts with filtering"""
+@app.get("/api/alerts", response_class=OverwatchJSONResponse)
+async def get_alerts(
+    severity: Optional[str] = None,
+    acknowledged: Optional[bool] = None,
+    after: Optional[str] = None,
+    limit: Optional[int] = None
+):
+    """Get alerts with filtering (pass after/limit for keyset pagination by alert id)"""
+    if after is not None or limit is not None:
+        alerts, next_cursor = keyset_page(
+            alert_store.values_by_key(), lambda alert: alert['id'], after, limit or 50,
+            lambda alert: (not severity or alert['severity'] == severity)
+            and (acknowledged is None or alert['acknowledged'] == acknowledged)
+        )
+        return OverwatchJSONResponse({"alerts": alerts, "next_cursor": next_cursor})
+    
+    # Use alert store if available
+    if alert_store:
+        if severity:
+            alerts = alerts_by_severity.get(severity, {}).values()
+        else:
+            alerts = alert_store.values()
+        if acknowledged is None:
+            return OverwatchJSONResponse(list(alerts))
+        return OverwatchJSONResponse([alert for alert in alerts if alert['acknowledged'] == acknowledged])
+    
     # In production, return from alert database
     alerts = [
         {
@@ -1726,17 +2277,12 @@ async def get_alerts(severity: Optional[str] = None, acknowledged: Optional[bool
         }
     ]
     
-    # Use alert store if available
-    if alert_store:
-        alerts = list(alert_store.values())
-    
-    # Apply filters
-    if severity:
-        alerts = [alert for alert in alerts if alert['severity'] == severity]
-    if acknowledged is not None:
-        alerts = [alert for alert in alerts if alert['acknowledged'] == acknowledged]
-    
-    return alerts
+    # Apply filters in a single pass
+    return OverwatchJSONResponse([
+        alert for alert in alerts
+        if (not severity or alert['severity'] == severity)
+        and (acknowledged is None or alert['acknowledged'] == acknowledged)
+    ])
 
 @app.post("/api/alerts/{alert_id}/acknowledge")
 async def acknowledge_alert(alert_id: str, ack_data: Dict[str, str]):
@@ -1747,7 +2293,7 @@ async def acknowledge_alert(alert_id: str, ack_data: Dict[str, str]):
     logger.info(f"Alert {alert_id} acknowledged by {acknowledged_by}: {action_taken}")
     
     # Broadcast acknowledgment
-    await ws_manager.broadcast({
+    ws_manager.enqueue({
         "type": "alert_acknowledged",
         "data": {
             "alert_id": alert_id,
@@ -1761,25 +2307,48 @@ async def acknowledge_alert(alert_id: str, ack_data: Dict[str, str]):
 
 # ==================== NOTIFICATIONS ====================
 
-@app.get("/api/notifications")
-async def get_notifications(limit: int = 20):
+# Pre-generated random fields for mock feeds; requests read a window at a random offset
+_MOCK_POOL_SIZE = 1000
+
+def _pool_window(pool: List[tuple], count: int) -> List[tuple]:
+    """Take count consecutive rows from a random offset in a pre-generated pool"""
+    start = random.randrange(len(pool))
+    window = pool[start:start + count]
+    if len(window) < count:
+        window += pool[:count - len(window)]
+    return window
+
+_NOTIFICATIONS_BUILT_AT = utcnow()
+MOCK_NOTIFICATIONS = [
+    {
+        "id": f"notif_{i}",
+        "type": random.choice(["alert", "incident", "system", "evidence"]),
+        "title": random.choice([
+            "New high-risk incident detected",
+            "Evidence package ready for review",
+            "System update available",
+            "New milestone assigned"
+        ]),
+        "message": "Notification message details here",
+        "read": i > 5,
+        "timestamp": (_NOTIFICATIONS_BUILT_AT - timedelta(minutes=i * 5)).isoformat()
+    }
+    for i in range(20)
+]
+
+@functools.lru_cache(maxsize=32)
+def _notifications_json(count: int) -> PrerenderedJSON:
+    notifications = MOCK_NOTIFICATIONS[:count]
+    return PrerenderedJSON({
+        "notifications": notifications,
+        "total": len(notifications),
+        "unread_count": min(len(notifications), 6)
+    })
+
+@app.get("/api/notifications", response_class=OverwatchJSONResponse)
+def get_notifications(limit: int = 20):
     """Get user notifications"""
-    notifications = []
-    for i in range(min(limit, 20)):
-        notifications.append({
-            "id": f"notif_{i}",
-            "type": random.choice(["alert", "incident", "system", "evidence"]),
-            "title": random.choice([
-                "New high-risk incident detected",
-                "Evidence package ready for review",
-                "System update available",
-                "New milestone assigned"
-            ]),
-            "message": "Notification message details here",
-            "read": i > 5,
-            "timestamp": (utcnow() - timedelta(minutes=i * 5)).isoformat()
-        })
-    return {"notifications": notifications, "total": len(notifications), "unread_count": sum(1 for n in notifications if not n["read"])}
+    return _notifications_json(max(0, min(limit, 20))).response()
 
 @app.post("/api/notifications/{notification_id}/read")
 async def mark_notification_read(notification_id: str):
@@ -1793,15 +2362,25 @@ async def mark_all_notifications_read():
 
 # ==================== USERS ====================
 
+MOCK_USERS = [
+    {"id": "user_1", "username": "admin", "email": "admin@kenya-overwatch.go.ke",
+     "role": "admin", "active": True},
+    {"id": "user_2", "username": "operator1", "email": "op1@kenya-overwatch.go.ke",
+     "role": "operator", "active": True},
+    {"id": "user_3", "username": "operator2", "email": "op2@kenya-overwatch.go.ke",
+     "role": "operator", "active": True},
+    {"id": "user_4", "username": "analyst", "email": "analyst@kenya-overwatch.go.ke",
+     "role": "analyst", "active": True},
+]
+_MOCK_USERS_JSON = PrerenderedJSON({"users": MOCK_USERS, "total": len(MOCK_USERS)})
+
 @app.get("/api/users")
-async def get_users(role: Optional[str] = None, limit: int = 50):
+def get_users(role: Optional[str] = None, limit: int = 50):
     """Get all users"""
-    users = [
-        {"id": "user_1", "username": "admin", "email": "admin@kenya-overwatch.go.ke", "role": "admin", "active": True},
-        {"id": "user_2", "username": "operator1", "email": "op1@kenya-overwatch.go.ke", "role": "operator", "active": True},
-        {"id": "user_3", "username": "operator2", "email": "op2@kenya-overwatch.go.ke", "role": "operator", "active": True},
-        {"id": "user_4", "username": "analyst", "email": "analyst@kenya-overwatch.go.ke", "role": "analyst", "active": True},
-    ]
+    if not role and limit >= len(MOCK_USERS):
+        return _MOCK_USERS_JSON.response()
+    
+    users = MOCK_USERS
     if role:
         users = [u for u in users if u["role"] == role]
     return {"users": users[:limit], "total": len(users)}
@@ -1814,7 +2393,7 @@ async def get_user(user_id: str):
 @app.post("/api/users")
 async def create_user(user_data: Dict[str, Any]):
     """Create new user"""
-    return {"message": "User created", "user_id": f"user_{random.randint(1000,9999)}", **user_data}
+    return {"message": "User created", "user_id": f"user_{secrets.token_hex(8)}", **user_data}
 
 @app.patch("/api/users/{user_id}")
 async def update_user(user_id: str, user_data: Dict[str, Any]):
@@ -1828,17 +2407,25 @@ async def delete_user(user_id: str):
 
 # ==================== CAMERAS ====================
 
+MOCK_CAMERAS = [
+    {"id": "cam_1", "name": "Downtown Main", "location": "Nairobi CBD",
+     "status": "active", "fps": 30, "resolution": "1080p"},
+    {"id": "cam_2", "name": "Airport Terminal 1", "location": "JKI Airport",
+     "status": "active", "fps": 25, "resolution": "4K"},
+    {"id": "cam_3", "name": "Mombasa Port", "location": "Mombasa",
+     "status": "active", "fps": 30, "resolution": "1080p"},
+    {"id": "cam_4", "name": "Nakuru Highway", "location": "Nakuru",
+     "status": "inactive", "fps": 0, "resolution": "720p"},
+]
+_MOCK_CAMERAS_JSON = PrerenderedJSON({"cameras": MOCK_CAMERAS, "total": len(MOCK_CAMERAS)})
+
 @app.get("/api/cameras")
-async def get_cameras(status: Optional[str] = None):
+def get_cameras(status: Optional[str] = None):
     """Get all cameras"""
-    cameras = [
-        {"id": "cam_1", "name": "Downtown Main", "location": "Nairobi CBD", "status": "active", "fps": 30, "resolution": "1080p"},
-        {"id": "cam_2", "name": "Airport Terminal 1", "location": "JKI Airport", "status": "active", "fps": 25, "resolution": "4K"},
-        {"id": "cam_3", "name": "Mombasa Port", "location": "Mombasa", "status": "active", "fps": 30, "resolution": "1080p"},
-        {"id": "cam_4", "name": "Nakuru Highway", "location": "Nakuru", "status": "inactive", "fps": 0, "resolution": "720p"},
-    ]
-    if status:
-        cameras = [c for c in cameras if c["status"] == status]
+    if not status:
+        return _MOCK_CAMERAS_JSON.response()
+    
+    cameras = [c for c in MOCK_CAMERAS if c["status"] == status]
     return {"cameras": cameras, "total": len(cameras)}
 
 @app.get("/api/cameras/{camera_id}")
@@ -1854,25 +2441,20 @@ async def toggle_camera(camera_id: str):
 # ==================== DASHBOARD ====================
 
 @app.get("/api/dashboard/stats")
-async def get_dashboard_stats():
+def get_dashboard_stats():
     """Get comprehensive dashboard statistics"""
-    incidents = list(production_system.active_incidents.values())
-    
-    # Calculate statistics
-    total_incidents = len(incidents)
-    active_incidents = len([inc for inc in incidents if inc.status == IncidentStatus.ACTIVE])
-    high_risk_incidents = len([inc for inc in incidents if inc.risk_assessment and inc.risk_assessment.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]])
-    pending_reviews = len([inc for inc in incidents if inc.requires_human_review and not inc.human_review_completed])
+    sync_incident_indexes()
+    high_risk, pending_reviews, evidence_packages = live_incident_counts()
     
     return {
         "incidents": {
-            "total": total_incidents,
-            "active": active_incidents,
-            "high_risk": high_risk_incidents,
+            "total": incident_stats.total,
+            "active": incident_stats.active,
+            "high_risk": high_risk,
             "pending_reviews": pending_reviews
         },
         "evidence": {
-            "total_packages": sum(len(inc.evidence_packages) for inc in incidents),
+            "total_packages": evidence_packages,
             "pending_review": 5,
             "approved": 12,
             "appealed": 2
@@ -1883,42 +2465,55 @@ async def get_dashboard_stats():
             "risk_alerts_today": 3,
             "system_health": "optimal"
         },
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 # ==================== ANALYTICS ====================
 
+_PERFORMANCE_METRICS_TEMPLATE = _json_template({
+    "ai_pipeline": {
+        "fps": 29.8,
+        "detection_accuracy": 0.94,
+        "false_positive_rate": 0.02,
+        "processing_latency_ms": 45
+    },
+    "risk_engine": {
+        "assessments_per_hour": 156,
+        "high_risk_accuracy": 0.89,
+        "average_response_time_minutes": 3.2
+    },
+    "evidence_system": {
+        "packages_created_today": 24,
+        "review_completion_rate": 0.92,
+        "appeal_success_rate": 0.15
+    },
+    "system": {
+        "uptime_percentage": 99.98,
+        "data_integrity_score": 1.0,
+        "audit_log_completeness": 1.0
+    },
+    "timestamp": _TIMESTAMP_SLOT
+})
+
 @app.get("/api/analytics/performance")
-async def get_performance_metrics():
+def get_performance_metrics():
     """Get system performance metrics"""
-    return {
-        "ai_pipeline": {
-            "fps": 29.8,
-            "detection_accuracy": 0.94,
-            "false_positive_rate": 0.02,
-            "processing_latency_ms": 45
-        },
-        "risk_engine": {
-            "assessments_per_hour": 156,
-            "high_risk_accuracy": 0.89,
-            "average_response_time_minutes": 3.2
-        },
-        "evidence_system": {
-            "packages_created_today": 24,
-            "review_completion_rate": 0.92,
-            "appeal_success_rate": 0.15
-        },
-        "system": {
-            "uptime_percentage": 99.98,
-            "data_integrity_score": 1.0,
-            "audit_log_completeness": 1.0
-        },
-        "timestamp": utcnow().isoformat()
-    }
+    return _fill_json_template(_PERFORMANCE_METRICS_TEMPLATE, _now_iso())
 
 # ==================== SEARCH & STATISTICS ====================
 
-@app.get("/api/search")
+# incident_id -> (title, description, lowercased "title\ndescription") for search
+_incident_search_text: Dict[str, tuple[str, str, str]] = {}
+
+def _incident_haystack(incident: ProductionIncident) -> str:
+    """Lowercased searchable text, recomputed only when title/description change"""
+    cached = _incident_search_text.get(incident.id)
+    if cached is None or cached[0] is not incident.title or cached[1] is not incident.description:
+        cached = (incident.title, incident.description, f"{incident.title}\n{incident.description}".lower())
+        _incident_search_text[incident.id] = cached
+    return cached[2]
+
+@app.get("/api/search", response_class=OverwatchJSONResponse)
 async def search_all(query: str, limit: int = 20):
     """Search across incidents, evidence, and alerts"""
     results = {
@@ -1929,38 +2524,41 @@ async def search_all(query: str, limit: int = 20):
         "total_results": 0
     }
     
-    # Search incidents
-    for incident_id, incident in production_system.active_incidents.items():
-        if query.lower() in incident.title.lower() or query.lower() in incident.description.lower():
-            results["incidents"].append(serialize_for_json(incident))
+    q = query.lower()
+    
+    # Search incidents (snapshot so concurrent writers can't resize the dict mid-scan)
+    incidents_snap = tuple(production_system.active_incidents.values())
+    for incident in incidents_snap:
+        if q in _incident_haystack(incident):
+            results["incidents"].append(incident)
     
     # Search alerts
     try:
         for alert in production_system.alert_manager.active_alerts:
-            if query.lower() in alert.title.lower() or query.lower() in alert.message.lower():
+            if q in alert.title.lower() or q in alert.message.lower():
                 results["alerts"].append(alert)
     except AttributeError:
         pass  # alert_manager not available
     
     results["total_results"] = len(results["incidents"]) + len(results["alerts"])
     
-    return results
+    return OverwatchJSONResponse(results)
 
 @app.get("/api/statistics/summary")
-async def get_statistics_summary():
+@cached_aggregate()
+def get_statistics_summary():
     """Get overall system statistics summary"""
-    total_incidents = len(production_system.active_incidents)
-    high_risk_count = sum(1 for i in production_system.active_incidents.values() 
-                         if i.risk_assessment and i.risk_assessment.risk_level == RiskLevel.HIGH)
+    sync_incident_indexes()
+    total_incidents = incident_stats.total
+    high_risk, pending_reviews, _ = live_incident_counts()
     
     return {
         "incidents": {
             "total": total_incidents,
             "active": total_incidents,
             "resolved": 0,
-            "high_risk": high_risk_count,
-            "pending_review": sum(1 for i in production_system.active_incidents.values() 
-                               if i.requires_human_review and not i.human_review_completed)
+            "high_risk": high_risk,
+            "pending_review": pending_reviews
         },
         "evidence": {
             "total_packages": 24,
@@ -1979,15 +2577,20 @@ async def get_statistics_summary():
             "active_cameras": 10,
             "average_fps": 29.8
         },
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
+MAX_TREND_DAYS = 365
+
 @app.get("/api/statistics/trends")
-async def get_statistics_trends(days: int = 7):
+@cached_aggregate()
+def get_statistics_trends(days: int = 7):
     """Get trend data for the specified number of days"""
+    days = max(1, min(days, MAX_TREND_DAYS))
+    now = utcnow()
     trends = []
     for i in range(days):
-        date = utcnow() - timedelta(days=days - i - 1)
+        date = now - timedelta(days=days - i - 1)
         trends.append({
             "date": date.strftime("%Y-%m-%d"),
             "incidents": 5 + (i * 2) % 10,
@@ -1999,7 +2602,7 @@ async def get_statistics_trends(days: int = 7):
     return {
         "trends": trends,
         "period_days": days,
-        "timestamp": utcnow().isoformat()
+        "timestamp": now.isoformat()
     }
 
 # ==================== EXPORT ====================
@@ -2025,91 +2628,141 @@ async def get_compliance_audit_logs(user_id: Optional[str] = None, action: Optio
         "has_more": True
     }
 
+_RETENTION_STATUS_TEMPLATE = _json_template({
+    "retention_policies": {
+        "non_offence_data": "72 hours",
+        "offence_evidence": "365 days",
+        "appeal_data": "2555 days (7 years)",
+        "audit_logs": "1825 days (5 years)"
+    },
+    "auto_deletion": {
+        "enabled": True,
+        "next_run": _TIMESTAMP_SLOT,
+        "last_run": _TIMESTAMP_SLOT
+    },
+    "storage_usage": {
+        "total_gb": 1250,
+        "used_gb": 342.5,
+        "available_gb": 907.5,
+        "classification_used": "27.4%"
+    }
+})
+
 @app.get("/api/retention/status")
-async def get_retention_status():
+def get_retention_status():
     """Get data retention status"""
-    return {
-        "retention_policies": {
-            "non_offence_data": "72 hours",
-            "offence_evidence": "365 days",
-            "appeal_data": "2555 days (7 years)",
-            "audit_logs": "1825 days (5 years)"
-        },
-        "auto_deletion": {
-            "enabled": True,
-            "next_run": (utcnow() + timedelta(hours=1)).isoformat(),
-            "last_run": (utcnow() - timedelta(hours=23)).isoformat()
-        },
-        "storage_usage": {
-            "total_gb": 1250,
-            "used_gb": 342.5,
-            "available_gb": 907.5,
-            "classification_used": "27.4%"
-        }
-    }
+    now = utcnow()
+    return _fill_json_template(
+        _RETENTION_STATUS_TEMPLATE,
+        (now + timedelta(hours=1)).isoformat(),
+        (now - timedelta(hours=23)).isoformat()
+    )
 
 # ==================== ACTIVITY LOGS ====================
 
-@app.get("/api/logs/activity")
-async def get_activity_logs(limit: int = 50):
+_ACTIVITY_POOL = [
+    (
+        random.choice(["incident", "dispatch", "camera", "user", "system"]),
+        random.choice([
+            "Incident created", "Team dispatched", "Alert acknowledged", 
+            "Camera online", "User login", "Config updated",
+            "Evidence reviewed", "Report submitted"
+        ]),
+        random.choice(["admin", "operator_01", "operator_02", "system"])
+    )
+    for _ in range(_MOCK_POOL_SIZE)
+]
+
+@app.get("/api/logs/activity", response_class=OverwatchJSONResponse)
+def get_activity_logs(limit: int = 50):
     """Get system activity logs"""
-    logs = []
-    for i in range(min(limit, 50)):
-        logs.append({
+    now = utcnow()
+    logs = [
+        {
             "id": f"log_{i:04d}",
-            "timestamp": (utcnow() - timedelta(minutes=i * 5)).isoformat(),
-            "type": random.choice(["incident", "dispatch", "camera", "user", "system"]),
-            "action": random.choice([
-                "Incident created", "Team dispatched", "Alert acknowledged", 
-                "Camera online", "User login", "Config updated",
-                "Evidence reviewed", "Report submitted"
-            ]),
-            "user": random.choice(["admin", "operator_01", "operator_02", "system"]),
-            "details": f"Action completed successfully"
-        })
-    return {"logs": logs, "total": len(logs)}
+            "timestamp": (now - timedelta(minutes=i * 5)).isoformat(),
+            "type": log_type,
+            "action": action,
+            "user": user,
+            "details": "Action completed successfully"
+        }
+        for i, (log_type, action, user) in enumerate(_pool_window(_ACTIVITY_POOL, min(limit, 50)))
+    ]
+    return OverwatchJSONResponse({"logs": logs, "total": len(logs)})
 
-@app.get("/api/logs/audit")
-async def get_audit_logs(limit: int = 50):
+_AUDIT_ACTIONS = [
+    "LOGIN", "LOGOUT", "VIEW_INCIDENT", "UPDATE_INCIDENT", "DISPATCH_TEAM", "REVIEW_EVIDENCE", "EXPORT_DATA"
+]
+_AUDIT_POOL = [
+    (
+        random.choice(["admin", "operator_01", "operator_02"]),
+        random.choice(_AUDIT_ACTIONS),
+        random.choice(["incidents", "cameras", "teams", "evidence"]),
+        f"192.168.1.{random.randint(1, 254)}",
+        random.choice(["success", "success", "success", "denied"])
+    )
+    for _ in range(_MOCK_POOL_SIZE)
+]
+
+@app.get("/api/logs/audit", response_class=OverwatchJSONResponse)
+def get_audit_logs(limit: int = 50):
     """Get audit trail logs"""
-    logs = []
-    actions = ["LOGIN", "LOGOUT", "VIEW_INCIDENT", "UPDATE_INCIDENT", "DISPATCH_TEAM", "REVIEW_EVIDENCE", "EXPORT_DATA"]
-    for i in range(min(limit, 50)):
-        logs.append({
+    now = utcnow()
+    logs = [
+        {
             "id": f"audit_{i:04d}",
-            "timestamp": (utcnow() - timedelta(minutes=i * 3)).isoformat(),
-            "user_id": random.choice(["admin", "operator_01", "operator_02"]),
-            "action": random.choice(actions),
-            "resource": random.choice(["incidents", "cameras", "teams", "evidence"]),
-            "ip_address": f"192.168.1.{random.randint(1, 254)}",
-            "result": random.choice(["success", "success", "success", "denied"])
-        })
-    return {"logs": logs, "total": len(logs)}
+            "timestamp": (now - timedelta(minutes=i * 3)).isoformat(),
+            "user_id": user_id,
+            "action": action,
+            "resource": resource,
+            "ip_address": ip_address,
+            "result": result
+        }
+        for i, (user_id, action, resource, ip_address, result) in enumerate(_pool_window(_AUDIT_POOL, min(limit, 50)))
+    ]
+    return OverwatchJSONResponse({"logs": logs, "total": len(logs)})
 
 # ==================== INCIDENT HISTORY ====================
 
-@app.get("/api/history/incidents")
-async def get_incident_history(days: int = 7):
+_HISTORY_POOL = [
+    (
+        f"inc_{random.randint(100, 999)}",
+        random.choice(["suspicious_activity", "theft", "assault", "traffic_violation", "emergency"]),
+        random.choice(["Nairobi CBD", "Westlands", "Kasarani", "Kilimani", "CBD North"]),
+        random.choice(["low", "medium", "high", "critical"]),
+        random.choice(["active", "responding", "resolved", "closed"]),
+        random.random() > 0.3,
+        random.randint(3, 25)
+    )
+    for _ in range(_MOCK_POOL_SIZE)
+]
+
+@app.get("/api/history/incidents", response_class=OverwatchJSONResponse)
+def get_incident_history(days: int = 7):
     """Get incident history"""
-    history = []
-    for i in range(min(days * 10, 70)):
-        history.append({
+    now = utcnow()
+    history = [
+        {
             "id": f"hist_{i:04d}",
-            "incident_id": f"inc_{random.randint(100, 999)}",
-            "type": random.choice(["suspicious_activity", "theft", "assault", "traffic_violation", "emergency"]),
-            "location": random.choice(["Nairobi CBD", "Westlands", "Kasarani", "Kilimani", "CBD North"]),
-            "severity": random.choice(["low", "medium", "high", "critical"]),
-            "status": random.choice(["active", "responding", "resolved", "closed"]),
-            "created_at": (utcnow() - timedelta(hours=i * 2)).isoformat(),
-            "resolved_at": (utcnow() - timedelta(hours=i * 2 - 1)).isoformat() if random.random() > 0.3 else None,
-            "response_time_minutes": random.randint(3, 25)
-        })
-    return {"history": history, "total": len(history)}
+            "incident_id": incident_id,
+            "type": incident_type,
+            "location": location,
+            "severity": severity,
+            "status": status,
+            "created_at": (now - timedelta(hours=i * 2)).isoformat(),
+            "resolved_at": (now - timedelta(hours=i * 2 - 1)).isoformat() if resolved else None,
+            "response_time_minutes": response_time
+        }
+        for i, (incident_id, incident_type, location, severity, status, resolved, response_time)
+        in enumerate(_pool_window(_HISTORY_POOL, min(days * 10, 70)))
+    ]
+    return OverwatchJSONResponse({"history": history, "total": len(history)})
 
 # ==================== ANALYTICS CHARTS ====================
 
 @app.get("/api/analytics/charts")
-async def get_analytics_charts():
+@cached_aggregate()
+def get_analytics_charts():
     """Get analytics data for charts"""
     return {
         "incidents_over_time": [
@@ -2142,13 +2795,14 @@ async def get_analytics_charts():
 # ==================== TREND ANALYSIS ====================
 
 @app.get("/api/analytics/trends")
-async def get_trend_analysis(
+def get_trend_analysis(
     period: str = "week",
     metric: str = "incidents"
 ):
     """Get trend analysis for specified period"""
     periods_map = {"day": 24, "week": 7, "month": 30, "year": 12}
     hours = periods_map.get(period, 7)
+    now = utcnow()
     
     return {
         "period": period,
@@ -2157,14 +2811,14 @@ async def get_trend_analysis(
         "change_percentage": round(random.uniform(-20, 30), 1),
         "data_points": [
             {
-                "timestamp": (utcnow() - timedelta(hours=i*hours)).isoformat(),
+                "timestamp": (now - timedelta(hours=i*hours)).isoformat(),
                 "value": random.randint(10, 100)
             }
             for i in range(min(10, hours))
         ],
         "forecast": [
             {
-                "timestamp": (utcnow() + timedelta(hours=i*hours)).isoformat(),
+                "timestamp": (now + timedelta(hours=i*hours)).isoformat(),
                 "predicted": random.randint(10, 100)
             }
             for i in range(1, 4)
@@ -2173,36 +2827,69 @@ async def get_trend_analysis(
 
 # ==================== EXPORT DATA ====================
 
-@app.get("/api/export/incidents")
-async def export_incidents(
+def _stream_csv(header: List[str], rows, filename: str) -> StreamingResponse:
+    """Stream RFC 4180 CSV one row at a time"""
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+        yield buffer.getvalue()
+    
+    return StreamingResponse(
+        generate(),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.get("/api/export/incidents", response_class=OverwatchJSONResponse)
+def export_incidents(
     format: str = "json",
     status: Optional[str] = None,
     limit: int = 100
 ):
     """Export incidents data"""
-    incidents = list(production_system.active_incidents.values())[:limit]
+    incidents_snap = tuple(production_system.active_incidents.values())
+    if status:
+        incidents_snap = tuple(inc for inc in incidents_snap if inc.status.value == status)
+    incidents = incidents_snap[:limit]
     
     if format == "csv":
-        csv_data = "id,title,type,status,severity,location,created_at\n"
-        for inc in incidents:
-            csv_data += f"{inc.id},{inc.title},{inc.type},{inc.status.value},{inc.severity.value},{inc.location},{inc.created_at.isoformat()}\n"
-        return {"format": "csv", "data": csv_data}
+        return _stream_csv(
+            ["id", "title", "type", "status", "severity", "location", "created_at"],
+            (
+                (
+                    inc.id, inc.title, inc.type, inc.status.value, inc.severity.value,
+                    inc.location, inc.created_at.isoformat()
+                )
+                for inc in incidents
+            ),
+            "incidents.csv"
+        )
     
-    return {"format": "json", "count": len(incidents), "incidents": [serialize_for_json(inc) for inc in incidents]}
+    return OverwatchJSONResponse({"format": "json", "count": len(incidents), "incidents": incidents})
 
 @app.get("/api/export/evidence")
-async def export_evidence(
+def export_evidence(
     format: str = "json",
     limit: int = 100
 ):
     """Export evidence packages"""
-    evidence_list = list(evidence_store.values())[:limit]
+    evidence_list = evidence_store.values()[:limit]
     
     if format == "csv":
-        csv_data = "id,incident_id,status,created_at,package_hash\n"
-        for ev in evidence_list:
-            csv_data += f"{ev['id']},{ev['incident_id']},{ev['status']},{ev['created_at']},{ev.get('package_hash', '')}\n"
-        return {"format": "csv", "data": csv_data}
+        return _stream_csv(
+            ["id", "incident_id", "status", "created_at", "package_hash"],
+            (
+                (ev['id'], ev['incident_id'], ev['status'], ev['created_at'], ev.get('package_hash', ''))
+                for ev in evidence_list
+            ),
+            "evidence.csv"
+        )
     
     return {"format": "json", "count": len(evidence_list), "evidence": evidence_list}
 
@@ -2214,15 +2901,19 @@ async def bulk_update_incident_status(
     new_status: str
 ):
     """Bulk update incident statuses"""
-    updated = []
-    failed = []
+    status = _INCIDENT_STATUS_BY_STR.get(new_status)
+    if status is None:
+        raise HTTPException(status_code=400, detail=f"Invalid status: {new_status}")
     
-    for inc_id in incident_ids:
-        if inc_id in production_system.active_incidents:
-            production_system.active_incidents[inc_id].status = IncidentStatus(new_status)
-            updated.append(inc_id)
-        else:
-            failed.append(inc_id)
+    active = production_system.active_incidents
+    updated = [inc_id for inc_id in incident_ids if inc_id in active]
+    failed = [inc_id for inc_id in incident_ids if inc_id not in active]
+    
+    for inc_id in updated:
+        incident = active[inc_id]
+        old_status = incident.status
+        incident.status = status
+        index_incident(incident, old_status)
     
     return {
         "updated": updated,
@@ -2237,17 +2928,18 @@ async def bulk_acknowledge_alerts(
     acknowledged_by: str
 ):
     """Bulk acknowledge alerts"""
-    acknowledged = []
-    failed = []
-    
-    for alert_id in alert_ids:
-        if alert_id in alert_store:
-            alert_store[alert_id]['acknowledged'] = True
-            alert_store[alert_id]['acknowledged_by'] = acknowledged_by
-            alert_store[alert_id]['acknowledged_at'] = utcnow().isoformat()
-            acknowledged.append(alert_id)
-        else:
-            failed.append(alert_id)
+    acknowledged = [alert_id for alert_id in alert_ids if alert_id in alert_store]
+    failed = [alert_id for alert_id in alert_ids if alert_id not in alert_store]
+    acknowledged_at = utcnow().isoformat()
+    
+    for alert_id in acknowledged:
+        alert = alert_store[alert_id]
+        alert['acknowledged'] = True
+        alert['acknowledged_by'] = acknowledged_by
+        alert['acknowledged_at'] = acknowledged_at
+    
+    if acknowledged:
+        bump_data_version()
     
     return {
         "acknowledged": acknowledged,
@@ -2257,15 +2949,92 @@ async def bulk_acknowledge_alerts(
 
 # ==================== MILESTONE MANAGEMENT ====================
 
-@app.get("/api/milestones")
+_MILESTONES_BUILT_AT = utcnow()
+MOCK_MILESTONES = [
+    {
+        "id": "ms_001",
+        "title": "Implement AI Detection Pipeline",
+        "description": "Set up YOLOv8 models for person and vehicle detection",
+        "type": "development",
+        "status": "approved",
+        "priority": "high",
+        "created_by": "admin",
+        "assigned_to": "developer_01",
+        "approved_by": "supervisor_01",
+        "created_at": (_MILESTONES_BUILT_AT - timedelta(days=5)).isoformat(),
+        "due_date": (_MILESTONES_BUILT_AT + timedelta(days=10)).isoformat(),
+        "completed_at": (_MILESTONES_BUILT_AT - timedelta(days=2)).isoformat()
+    },
+    {
+        "id": "ms_002",
+        "title": "Review Evidence Package ev_001",
+        "description": "Complete human review of AI-generated evidence for incident inc_001",
+        "type": "evidence_review",
+        "status": "in_progress",
+        "priority": "high",
+        "created_by": "system",
+        "assigned_to": "reviewer_01",
+        "approved_by": None,
+        "created_at": (_MILESTONES_BUILT_AT - timedelta(hours=2)).isoformat(),
+        "due_date": (_MILESTONES_BUILT_AT + timedelta(hours=6)).isoformat(),
+        "completed_at": None,
+        "submitted_for_approval_at": None
+    },
+    {
+        "id": "ms_003",
+        "title": "Resolve Active Incident inc_001",
+        "description": "Complete investigation and resolution of suspicious activity incident",
+        "type": "incident_case",
+        "status": "pending_approval",
+        "priority": "critical",
+        "created_by": "operator_01",
+        "assigned_to": "supervisor_01",
+        "approved_by": None,
+        "created_at": (_MILESTONES_BUILT_AT - timedelta(hours=4)).isoformat(),
+        "due_date": (_MILESTONES_BUILT_AT + timedelta(hours=2)).isoformat(),
+        "completed_at": None,
+        "submitted_for_approval_at": (_MILESTONES_BUILT_AT - timedelta(minutes=30)).isoformat()
+    },
+    {
+        "id": "ms_004",
+        "title": "Add Mobile Officer App Support",
+        "description": "Implement mobile app endpoints and push notification integration",
+        "type": "development",
+        "status": "draft",
+        "priority": "medium",
+        "created_by": "admin",
+        "assigned_to": None,
+        "approved_by": None,
+        "created_at": _MILESTONES_BUILT_AT.isoformat(),
+        "due_date": (_MILESTONES_BUILT_AT + timedelta(days=14)).isoformat(),
+        "completed_at": None,
+        "submitted_for_approval_at": None
+    }
+]
+
+# Demo milestones bucketed under every (status, type, assigned_to) filter they match; None = unfiltered
+_mock_milestones_by_filter: Dict[tuple, List[dict]] = defaultdict(list)
+for _milestone in MOCK_MILESTONES:
+    for _filter_key in set(itertools.product(
+        (None, _milestone["status"]), (None, _milestone["type"]), (None, _milestone["assigned_to"])
+    )):
+        _mock_milestones_by_filter[_filter_key].append(_milestone)
+_MOCK_MILESTONES_JSON: Dict[tuple, PrerenderedJSON] = {
+    filter_key: PrerenderedJSON(milestones) for filter_key, milestones in _mock_milestones_by_filter.items()
+}
+_EMPTY_LIST_JSON = PrerenderedJSON([])
+
+THREADPOOL_SERIALIZE_MIN_ITEMS = 200  # below this, encoding is cheaper than the thread handoff
+
+@app.get("/api/milestones", response_class=OverwatchJSONResponse)
 async def get_milestones(
     status: Optional[str] = None,
     milestone_type: Optional[str] = None,
     assigned_to: Optional[str] = None
 ):
     """Get milestones with optional filters"""
-    status_enum = MilestoneStatus(status) if status else None
-    type_enum = MilestoneType(milestone_type) if milestone_type else None
+    status_enum = _enum_from_str(_MILESTONE_STATUS_BY_STR, status, "status") if status else None
+    type_enum = _enum_from_str(_MILESTONE_TYPE_BY_STR, milestone_type, "milestone type") if milestone_type else None
     
     milestones = production_system.milestone_manager.get_milestones(
         status=status_enum,
@@ -2274,83 +3043,32 @@ async def get_milestones(
     )
     
     if not milestones:
-        mock_milestones = [
-            {
-                "id": "ms_001",
-                "title": "Implement AI Detection Pipeline",
-                "description": "Set up YOLOv8 models for person and vehicle detection",
-                "type": "development",
-                "status": "approved",
-                "priority": "high",
-                "created_by": "admin",
-                "assigned_to": "developer_01",
-                "approved_by": "supervisor_01",
-                "created_at": (utcnow() - timedelta(days=5)).isoformat(),
-                "due_date": (utcnow() + timedelta(days=10)).isoformat(),
-                "completed_at": (utcnow() - timedelta(days=2)).isoformat()
-            },
-            {
-                "id": "ms_002",
-                "title": "Review Evidence Package ev_001",
-                "description": "Complete human review of AI-generated evidence for incident inc_001",
-                "type": "evidence_review",
-                "status": "in_progress",
-                "priority": "high",
-                "created_by": "system",
-                "assigned_to": "reviewer_01",
-                "approved_by": None,
-                "created_at": (utcnow() - timedelta(hours=2)).isoformat(),
-                "due_date": (utcnow() + timedelta(hours=6)).isoformat(),
-                "completed_at": None,
-                "submitted_for_approval_at": None
-            },
-            {
-                "id": "ms_003",
-                "title": "Resolve Active Incident inc_001",
-                "description": "Complete investigation and resolution of suspicious activity incident",
-                "type": "incident_case",
-                "status": "pending_approval",
-                "priority": "critical",
-                "created_by": "operator_01",
-                "assigned_to": "supervisor_01",
-                "approved_by": None,
-                "created_at": (utcnow() - timedelta(hours=4)).isoformat(),
-                "due_date": (utcnow() + timedelta(hours=2)).isoformat(),
-                "completed_at": None,
-                "submitted_for_approval_at": (utcnow() - timedelta(minutes=30)).isoformat()
-            },
-            {
-                "id": "ms_004",
-                "title": "Add Mobile Officer App Support",
-                "description": "Implement mobile app endpoints and push notification integration",
-                "type": "development",
-                "status": "draft",
-                "priority": "medium",
-                "created_by": "admin",
-                "assigned_to": None,
-                "approved_by": None,
-                "created_at": utcnow().isoformat(),
-                "due_date": (utcnow() + timedelta(days=14)).isoformat(),
-                "completed_at": None,
-                "submitted_for_approval_at": None
-            }
-        ]
-        
-        if status_enum or type_enum or assigned_to:
-            filtered = []
-            for m in mock_milestones:
-                if status_enum and m["status"] != status_enum.value:
-                    continue
-                if type_enum and m["type"] != type_enum.value:
-                    continue
-                if assigned_to and m.get("assigned_to") != assigned_to:
-                    continue
-                filtered.append(m)
-            return filtered
-        
-        return mock_milestones
+        filter_key = (status or None, milestone_type or None, assigned_to or None)
+        return _MOCK_MILESTONES_JSON.get(filter_key, _EMPTY_LIST_JSON).response()
     
-    return [serialize_for_json(m) for m in milestones]
+    if len(milestones) >= THREADPOOL_SERIALIZE_MIN_ITEMS:
+        return _json_response(await run_in_threadpool(_json_bytes, milestones))
+    return OverwatchJSONResponse(milestones)
+
+_APPROVER_ROLES = frozenset({"supervisor", "admin"})
+_MILESTONE_UPDATE_FIELDS = frozenset({"title", "description", "priority", "assigned_to", "due_date"})
+def _identity(value: Any) -> Any:
+    return value
+
+def _parse_optional_iso(value: Optional[str]) -> Optional[datetime]:
+    return _parse_iso(value) if value else value
+
+def _parse_priority(value: Any) -> SeverityLevel:
+    return _enum_from_str(_SEVERITY_BY_STR, value, "priority")
+
+_MILESTONE_FIELD_TX = {"due_date": _parse_optional_iso, "priority": _parse_priority}
+
+def _milestone_event(event_type: str, milestone: Optional[Milestone]) -> Response:
+    """Serialize a milestone once, queue it for broadcast and return it as the response"""
+    # Sent as its own {"type": "milestone_*"} frame even when coalesced with other queued events
+    body = _json_bytes(milestone)
+    ws_manager.enqueue({"type": event_type, "data": orjson.Fragment(body)})
+    return _json_response(body)
 
 @app.post("/api/milestones")
 async def create_milestone(milestone_data: Dict[str, Any]):
@@ -2360,8 +3078,8 @@ async def create_milestone(milestone_data: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="Title is required")
     
     description = milestone_data.get("description", "")
-    milestone_type = MilestoneType(milestone_data.get("type", "development"))
-    priority = SeverityLevel(milestone_data.get("priority", "medium"))
+    milestone_type = _enum_from_str(_MILESTONE_TYPE_BY_STR, milestone_data.get("type", "development"), "milestone type")
+    priority = _enum_from_str(_SEVERITY_BY_STR, milestone_data.get("priority", "medium"), "priority")
     created_by = milestone_data.get("created_by", "unknown")
     assigned_to = milestone_data.get("assigned_to")
     due_date_str = milestone_data.get("due_date")
@@ -2370,7 +3088,7 @@ async def create_milestone(milestone_data: Dict[str, Any]):
     
     due_date = None
     if due_date_str:
-        due_date = datetime.fromisoformat(due_date_str.replace("Z", "+00:00"))
+        due_date = _parse_iso(due_date_str)
     
     milestone = production_system.milestone_manager.create_milestone(
         title=title,
@@ -2384,13 +3102,8 @@ async def create_milestone(milestone_data: Dict[str, Any]):
         linked_evidence_id=linked_evidence_id
     )
     
-    await ws_manager.broadcast({
-        "type": "milestone_created",
-        "data": serialize_for_json(milestone)
-    })
-    
     logger.info(f"Milestone created: {milestone.id}")
-    return serialize_for_json(milestone)
+    return _milestone_event("milestone_created", milestone)
 
 @app.get("/api/milestones/{milestone_id}")
 async def get_milestone(milestone_id: str):
@@ -2400,7 +3113,7 @@ async def get_milestone(milestone_id: str):
     if not milestone:
         raise HTTPException(status_code=404, detail="Milestone not found")
     
-    return serialize_for_json(milestone)
+    return _json_response(_json_bytes(milestone))
 
 @app.put("/api/milestones/{milestone_id}")
 async def update_milestone(milestone_id: str, update_data: Dict[str, Any]):
@@ -2410,17 +3123,11 @@ async def update_milestone(milestone_id: str, update_data: Dict[str, Any]):
     if not milestone:
         raise HTTPException(status_code=404, detail="Milestone not found")
     
-    allowed_fields = ["title", "description", "priority", "assigned_to", "due_date"]
-    updates = {}
-    
-    for field in allowed_fields:
-        if field in update_data:
-            if field == "due_date" and update_data[field]:
-                updates[field] = datetime.fromisoformat(update_data[field].replace("Z", "+00:00"))
-            elif field == "priority":
-                updates[field] = SeverityLevel(update_data[field])
-            else:
-                updates[field] = update_data[field]
+    updates = {
+        field: _MILESTONE_FIELD_TX.get(field, _identity)(value)
+        for field, value in update_data.items()
+        if field in _MILESTONE_UPDATE_FIELDS
+    }
     
     updated_milestone = production_system.milestone_manager.update_milestone(
         milestone_id=milestone_id,
@@ -2428,12 +3135,7 @@ async def update_milestone(milestone_id: str, update_data: Dict[str, Any]):
         **updates
     )
     
-    await ws_manager.broadcast({
-        "type": "milestone_updated",
-        "data": asdict(updated_milestone) if updated_milestone else None
-    })
-    
-    return serialize_for_json(updated_milestone)
+    return _milestone_event("milestone_updated", updated_milestone)
 
 @app.patch("/api/milestones/{milestone_id}/status")
 async def update_milestone_status(milestone_id: str, status_data: Dict[str, Any]):
@@ -2449,10 +3151,7 @@ async def update_milestone_status(milestone_id: str, status_data: Dict[str, Any]
     if not milestone:
         raise HTTPException(status_code=404, detail="Milestone not found")
     
-    try:
-        status_enum = MilestoneStatus(new_status)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid status")
+    status_enum = _enum_from_str(_MILESTONE_STATUS_BY_STR, new_status, "status")
     
     updated_milestone = production_system.milestone_manager.update_milestone(
         milestone_id=milestone_id,
@@ -2460,12 +3159,7 @@ async def update_milestone_status(milestone_id: str, status_data: Dict[str, Any]
         status=status_enum
     )
     
-    await ws_manager.broadcast({
-        "type": "milestone_status_updated",
-        "data": asdict(updated_milestone) if updated_milestone else None
-    })
-    
-    return serialize_for_json(updated_milestone)
+    return _milestone_event("milestone_status_updated", updated_milestone)
 
 @app.post("/api/milestones/{milestone_id}/submit-for-approval")
 async def submit_milestone_for_approval(milestone_id: str, submit_data: Dict[str, Any]):
@@ -2488,12 +3182,7 @@ async def submit_milestone_for_approval(milestone_id: str, submit_data: Dict[str
             detail="Milestone cannot be submitted for approval. It must be in draft or in_progress status."
         )
     
-    await ws_manager.broadcast({
-        "type": "milestone_submitted_for_approval",
-        "data": asdict(updated_milestone)
-    })
-    
-    return serialize_for_json(updated_milestone)
+    return _milestone_event("milestone_submitted_for_approval", updated_milestone)
 
 @app.post("/api/milestones/{milestone_id}/approve")
 async def approve_milestone(milestone_id: str, approval_data: Dict[str, Any]):
@@ -2502,7 +3191,7 @@ async def approve_milestone(milestone_id: str, approval_data: Dict[str, Any]):
     notes = approval_data.get("notes", "")
     
     user_role = approval_data.get("user_role", "operator")
-    if user_role not in ["supervisor", "admin"]:
+    if user_role not in _APPROVER_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Only supervisors and admins can approve milestones"
@@ -2525,13 +3214,8 @@ async def approve_milestone(milestone_id: str, approval_data: Dict[str, Any]):
             detail="Milestone cannot be approved. It must be in pending_approval status."
         )
     
-    await ws_manager.broadcast({
-        "type": "milestone_approved",
-        "data": asdict(approved_milestone)
-    })
-    
     logger.info(f"Milestone {milestone_id} approved by {approved_by}")
-    return serialize_for_json(approved_milestone)
+    return _milestone_event("milestone_approved", approved_milestone)
 
 @app.post("/api/milestones/{milestone_id}/reject")
 async def reject_milestone(milestone_id: str, rejection_data: Dict[str, Any]):
@@ -2540,7 +3224,7 @@ async def reject_milestone(milestone_id: str, rejection_data: Dict[str, Any]):
     reason = rejection_data.get("reason", "")
     
     user_role = rejection_data.get("user_role", "operator")
-    if user_role not in ["supervisor", "admin"]:
+    if user_role not in _APPROVER_ROLES:
         raise HTTPException(
             status_code=403,
             detail="Only supervisors and admins can reject milestones"
@@ -2566,13 +3250,8 @@ async def reject_milestone(milestone_id: str, rejection_data: Dict[str, Any]):
             detail="Milestone cannot be rejected. It must be in pending_approval status."
         )
     
-    await ws_manager.broadcast({
-        "type": "milestone_rejected",
-        "data": asdict(rejected_milestone)
-    })
-    
     logger.info(f"Milestone {milestone_id} rejected by {rejected_by}")
-    return serialize_for_json(rejected_milestone)
+    return _milestone_event("milestone_rejected", rejected_milestone)
 
 @app.delete("/api/milestones/{milestone_id}")
 async def delete_milestone(milestone_id: str):
@@ -2585,7 +3264,7 @@ async def delete_milestone(milestone_id: str):
             detail="Milestone cannot be deleted. Only draft milestones can be deleted."
         )
     
-    await ws_manager.broadcast({
+    ws_manager.enqueue({
         "type": "milestone_deleted",
         "data": {"milestone_id": milestone_id}
     })
@@ -2602,52 +3281,69 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
         while True:
             data = await websocket.receive_text()
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 # Handle different message types
                 await handle_websocket_message(websocket, user_id, message)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 await ws_manager.send_personal_message(
-                    json.dumps({"error": "Invalid JSON format"}), 
+                    orjson.dumps({"error": "Invalid JSON format"}).decode(), 
                     websocket
                 )
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
 
+async def _handle_ping(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    await ws_manager.send_personal_message(orjson.dumps({"type": "pong"}).decode(), websocket)
+
+async def _handle_subscribe(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    # Subscribe to specific alerts
+    await ws_manager.send_personal_message(
+        orjson.dumps({"type": "subscribed", "alerts": True}).decode(), 
+        websocket
+    )
+
+async def _handle_subscribe_mobile(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    # Mobile app - subscribe to real-time alerts
+    await ws_manager.send_personal_message(
+        orjson.dumps({"type": "mobile_alerts_subscribed", "status": "active"}).decode(),
+        websocket
+    )
+
+async def _handle_location_update(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    # Mobile officer location update
+    lat = message.get('latitude')
+    lng = message.get('longitude')
+    logger.info(f"Location update from {user_id}: {lat}, {lng}")
+    await ws_manager.send_personal_message(
+        orjson.dumps({"type": "location_received", "user_id": user_id}).decode(),
+        websocket
+    )
+
+async def _handle_camera_control(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    # Handle camera control commands
+    camera_id = message.get('camera_id')
+    command = message.get('command')
+    logger.info(f"Camera control from {user_id}: {camera_id} - {command}")
+
+_MSG_HANDLERS: Dict[str, Callable[[WebSocket, str, Dict[str, Any]], Awaitable[None]]] = {
+    'ping': _handle_ping,
+    'subscribe_alerts': _handle_subscribe,
+    'subscribe_mobile_alerts': _handle_subscribe_mobile,
+    'location_update': _handle_location_update,
+    'camera_control': _handle_camera_control
+}
+
 async def handle_websocket_message(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
     """Handle WebSocket messages from clients"""
     message_type = message.get('type')
-    
-    if message_type == 'ping':
-        await ws_manager.send_personal_message(json.dumps({"type": "pong"}), websocket)
-    elif message_type == 'subscribe_alerts':
-        # Subscribe to specific alerts
-        await ws_manager.send_personal_message(
-            json.dumps({"type": "subscribed", "alerts": True}), 
-            websocket
-        )
-    elif message_type == 'subscribe_mobile_alerts':
-        # Mobile app - subscribe to real-time alerts
-        await ws_manager.send_personal_message(
-            json.dumps({"type": "mobile_alerts_subscribed", "status": "active"}),
-            websocket
-        )
-    elif message_type == 'location_update':
-        # Mobile officer location update
-        lat = message.get('latitude')
-        lng = message.get('longitude')
-        logger.info(f"Location update from {user_id}: {lat}, {lng}")
-        await ws_manager.send_personal_message(
-            json.dumps({"type": "location_received", "user_id": user_id}),
-            websocket
-        )
-    elif message_type == 'camera_control':
-        # Handle camera control commands
-        camera_id = message.get('camera_id')
-        command = message.get('command')
-        logger.info(f"Camera control from {user_id}: {camera_id} - {command}")
+    # Non-string types (lists, objects) are unhashable; ignore them like unknown types
+    handler = _MSG_HANDLERS.get(message_type) if isinstance(message_type, str) else None
+    if handler:
+        await handler(websocket, user_id, message)
 
 # ==================== RESPONSE TEAMS ====================
 
+_TEAMS_BUILT_AT = utcnow()
 MOCK_TEAMS = [
     {
         "id": "team_001",
@@ -2660,7 +3356,7 @@ MOCK_TEAMS = [
         "vehicles": 1,
         "capabilities": ["patrol", "apprehension", "traffic"],
         "current_incident": None,
-        "last_deployed": (utcnow() - timedelta(hours=3)).isoformat(),
+        "last_deployed": (_TEAMS_BUILT_AT - timedelta(hours=3)).isoformat(),
         "response_time_avg": 8.5
     },
     {
@@ -2674,7 +3370,7 @@ MOCK_TEAMS = [
         "vehicles": 1,
         "capabilities": ["first_aid", "ambulance", "medical"],
         "current_incident": "inc_003",
-        "last_deployed": (utcnow() - timedelta(minutes=15)).isoformat(),
+        "last_deployed": (_TEAMS_BUILT_AT - timedelta(minutes=15)).isoformat(),
         "response_time_avg": 6.2
     },
     {
@@ -2688,7 +3384,7 @@ MOCK_TEAMS = [
         "vehicles": 2,
         "capabilities": ["traffic_management", "accident_response"],
         "current_incident": None,
-        "last_deployed": (utcnow() - timedelta(hours=5)).isoformat(),
+        "last_deployed": (_TEAMS_BUILT_AT - timedelta(hours=5)).isoformat(),
         "response_time_avg": 5.8
     },
     {
@@ -2702,22 +3398,32 @@ MOCK_TEAMS = [
         "vehicles": 1,
         "capabilities": ["detection", "apprehension", "search"],
         "current_incident": None,
-        "last_deployed": (utcnow() - timedelta(days=1)).isoformat(),
+        "last_deployed": (_TEAMS_BUILT_AT - timedelta(days=1)).isoformat(),
         "response_time_avg": 12.3
     }
 ]
 
 TEAMS_STORE = MOCK_TEAMS.copy()
 
-@app.get("/api/teams")
+def _group_by(items: List[dict], field: str) -> Dict[str, List[dict]]:
+    """Bucket dicts by one field, preserving order within each bucket"""
+    groups = defaultdict(list)
+    for item in items:
+        groups[item[field]].append(item)
+    return groups
+
+teams_by_status = _group_by(TEAMS_STORE, "status")
+
+@functools.lru_cache(maxsize=32)
+def _teams_json(status: Optional[str]) -> PrerenderedJSON:
+    """Serialized team list per status filter; cleared whenever TEAMS_STORE changes"""
+    teams = teams_by_status.get(status, []) if status else TEAMS_STORE
+    return PrerenderedJSON({"teams": teams, "total": len(teams)})
+
+@app.get("/api/teams", response_class=OverwatchJSONResponse)
 async def get_response_teams(status: Optional[str] = None):
     """Get all response teams"""
-    teams = TEAMS_STORE.copy()
-    
-    if status:
-        teams = [t for t in teams if t["status"] == status]
-    
-    return {"teams": teams, "total": len(teams)}
+    return _teams_json(status).response()
 
 @app.post("/api/teams/{team_id}/dispatch")
 async def dispatch_team(team_id: str, dispatch_data: Dict[str, Any]):
@@ -2728,16 +3434,20 @@ async def dispatch_team(team_id: str, dispatch_data: Dict[str, Any]):
     
     logger.info(f"Dispatching team {team_id} to incident {incident_id} (priority: {priority})")
     
+    now = utcnow()
+    now_iso = now.isoformat()
     team_name = team_id
     for team in TEAMS_STORE:
         if team["id"] == team_id:
             team["status"] = "deployed"
             team["current_incident"] = incident_id
-            team["last_deployed"] = utcnow().isoformat()
+            team["last_deployed"] = now_iso
             team_name = team["name"]
+            teams_by_status.clear()
+            teams_by_status.update(_group_by(TEAMS_STORE, "status"))
             break
     
-    dispatch_id = f"disp_{uuid.uuid4().hex[:8]}"
+    dispatch_id = f"disp_{secrets.token_hex(4)}"
     dispatch_entry = {
         "id": dispatch_id,
         "incident_id": incident_id,
@@ -2745,13 +3455,16 @@ async def dispatch_team(team_id: str, dispatch_data: Dict[str, Any]):
         "team_name": team_name,
         "status": "en_route",
         "priority": priority,
-        "assigned_at": utcnow().isoformat(),
-        "eta": (utcnow() + timedelta(minutes=eta_minutes)).isoformat(),
+        "assigned_at": now_iso,
+        "eta": (now + timedelta(minutes=eta_minutes)).isoformat(),
         "arrived_at": None,
         "resolved_at": None,
         "notes": f"Dispatched to incident {incident_id}"
     }
     DISPATCHES_STORE.append(dispatch_entry)
+    dispatches_by_status[dispatch_entry["status"]].append(dispatch_entry)
+    _teams_json.cache_clear()
+    _dispatches_json.cache_clear()
     
     return {
         "success": True,
@@ -2759,7 +3472,7 @@ async def dispatch_team(team_id: str, dispatch_data: Dict[str, Any]):
         "team_id": team_id,
         "incident_id": incident_id,
         "priority": priority,
-        "dispatch_time": utcnow().isoformat(),
+        "dispatch_time": now_iso,
         "eta": f"{eta_minutes} minutes",
         "eta_minutes": eta_minutes,
         "dispatch": {
@@ -2780,11 +3493,12 @@ async def update_team_status(team_id: str, status_data: Dict[str, Any]):
         "message": "Team status updated",
         "team_id": team_id,
         "new_status": new_status,
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 # ==================== DISPATCH MANAGEMENT ====================
 
+_DISPATCHES_BUILT_AT = utcnow()
 DISPATCHES_STORE = [
     {
         "id": "disp_001",
@@ -2793,8 +3507,8 @@ DISPATCHES_STORE = [
         "team_name": "Rapid Response Unit A",
         "status": "en_route",
         "priority": "high",
-        "assigned_at": (utcnow() - timedelta(minutes=10)).isoformat(),
-        "eta": (utcnow() + timedelta(minutes=5)).isoformat(),
+        "assigned_at": (_DISPATCHES_BUILT_AT - timedelta(minutes=10)).isoformat(),
+        "eta": (_DISPATCHES_BUILT_AT + timedelta(minutes=5)).isoformat(),
         "arrived_at": None,
         "resolved_at": None,
         "notes": "Proceed to Kenyatta Avenue ATM area"
@@ -2806,29 +3520,32 @@ DISPATCHES_STORE = [
         "team_name": "Traffic Control Unit",
         "status": "on_scene",
         "priority": "medium",
-        "assigned_at": (utcnow() - timedelta(minutes=25)).isoformat(),
+        "assigned_at": (_DISPATCHES_BUILT_AT - timedelta(minutes=25)).isoformat(),
         "eta": None,
-        "arrived_at": (utcnow() - timedelta(minutes=20)).isoformat(),
+        "arrived_at": (_DISPATCHES_BUILT_AT - timedelta(minutes=20)).isoformat(),
         "resolved_at": None,
         "notes": "Managing traffic at intersection"
     }
 ]
 
-@app.get("/api/dispatch")
+dispatches_by_status = _group_by(DISPATCHES_STORE, "status")
+
+@functools.lru_cache(maxsize=32)
+def _dispatches_json(status: Optional[str]) -> PrerenderedJSON:
+    """Serialized dispatch list per status filter; cleared whenever DISPATCHES_STORE changes"""
+    dispatches = dispatches_by_status.get(status, []) if status else DISPATCHES_STORE
+    return PrerenderedJSON({"dispatches": dispatches, "total": len(dispatches)})
+
+@app.get("/api/dispatch", response_class=OverwatchJSONResponse)
 async def get_dispatches(status: Optional[str] = None):
     """Get all dispatches"""
-    dispatches = DISPATCHES_STORE.copy()
-    
-    if status:
-        dispatches = [d for d in dispatches if d["status"] == status]
-    
-    return {"dispatches": dispatches, "total": len(dispatches)}
+    return _dispatches_json(status).response()
 
 @app.post("/api/dispatch")
 async def create_dispatch(dispatch_data: Dict[str, Any]):
     """Create a new dispatch"""
     new_dispatch = {
-        "id": f"disp_{uuid.uuid4().hex[:8]}",
+        "id": f"disp_{secrets.token_hex(4)}",
         "incident_id": dispatch_data.get("incident_id"),
         "team_id": dispatch_data.get("team_id"),
         "team_name": dispatch_data.get("team_name", "Unassigned"),
@@ -2852,46 +3569,49 @@ async def update_dispatch(dispatch_id: str, update_data: Dict[str, Any]):
         "message": "Dispatch updated",
         "dispatch_id": dispatch_id,
         "status": update_data.get("status"),
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 # ==================== SYSTEM CONFIG ====================
 
-@app.get("/api/config")
+SYSTEM_CONFIG = {
+    "system": {
+        "name": "Kenya Overwatch Production",
+        "version": "2.0.0",
+        "region": "Nairobi CBD",
+        "timezone": "Africa/Nairobi"
+    },
+    "ai": {
+        "models_enabled": ["person_detection", "vehicle_detection", "weapon_detection", "anpr", "behavior_analysis"],
+        "risk_threshold_high": 0.7,
+        "risk_threshold_critical": 0.85,
+        "auto_dispatch_enabled": True,
+        "alert_delay_seconds": 5
+    },
+    "notifications": {
+        "email_enabled": True,
+        "sms_enabled": True,
+        "push_enabled": True,
+        "alert_levels": ["low", "medium", "high", "critical"]
+    },
+    "camera": {
+        "total_cameras": 1,
+        "recording_enabled": True,
+        "motion_detection_enabled": True,
+        "night_vision_enabled": True
+    },
+    "response": {
+        "auto_dispatch_threshold": 0.8,
+        "default_response_time_target": 10,
+        "backup_teams_enabled": True
+    }
+}
+_SYSTEM_CONFIG_JSON = PrerenderedJSON(SYSTEM_CONFIG)
+
+@app.get("/api/config", response_class=OverwatchJSONResponse)
 async def get_system_config():
     """Get system configuration"""
-    return {
-        "system": {
-            "name": "Kenya Overwatch Production",
-            "version": "2.0.0",
-            "region": "Nairobi CBD",
-            "timezone": "Africa/Nairobi"
-        },
-        "ai": {
-            "models_enabled": ["person_detection", "vehicle_detection", "weapon_detection", "anpr", "behavior_analysis"],
-            "risk_threshold_high": 0.7,
-            "risk_threshold_critical": 0.85,
-            "auto_dispatch_enabled": True,
-            "alert_delay_seconds": 5
-        },
-        "notifications": {
-            "email_enabled": True,
-            "sms_enabled": True,
-            "push_enabled": True,
-            "alert_levels": ["low", "medium", "high", "critical"]
-        },
-        "camera": {
-            "total_cameras": 1,
-            "recording_enabled": True,
-            "motion_detection_enabled": True,
-            "night_vision_enabled": True
-        },
-        "response": {
-            "auto_dispatch_threshold": 0.8,
-            "default_response_time_target": 10,
-            "backup_teams_enabled": True
-        }
-    }
+    return _SYSTEM_CONFIG_JSON.response()
 
 @app.patch("/api/config")
 async def update_system_config(config_data: Dict[str, Any]):
@@ -2901,49 +3621,51 @@ async def update_system_config(config_data: Dict[str, Any]):
     return {
         "message": "Configuration updated successfully",
         "changes": list(config_data.keys()),
-        "timestamp": utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 # ==================== DASHBOARD SUMMARY ====================
 
-@app.get("/api/dashboard/summary")
+_DASHBOARD_SUMMARY_TEMPLATE = _json_template({
+    "overview": {
+        "active_incidents": 2,
+        "pending_alerts": 3,
+        "deployed_teams": 1,
+        "available_teams": 2,
+        "unread_notifications": 3,
+        "citizen_reports_pending": 1
+    },
+    "incidents_by_severity": {
+        "critical": 0,
+        "high": 1,
+        "medium": 1,
+        "low": 0
+    },
+    "incidents_by_status": {
+        "active": 1,
+        "responding": 1,
+        "resolved": 0,
+        "monitoring": 0
+    },
+    "response_times": {
+        "average": 7.2,
+        "fastest": 5.8,
+        "slowest": 12.3
+    },
+    "system_health": {
+        "status": "optimal",
+        "cpu_usage": 45,
+        "memory_usage": 62,
+        "storage_usage": 38,
+        "network_latency": 12
+    },
+    "timestamp": _TIMESTAMP_SLOT
+})
+
+@app.get("/api/dashboard/summary", response_class=OverwatchJSONResponse)
 async def get_dashboard_summary():
     """Get dashboard summary for main view"""
-    return {
-        "overview": {
-            "active_incidents": 2,
-            "pending_alerts": 3,
-            "deployed_teams": 1,
-            "available_teams": 2,
-            "unread_notifications": 3,
-            "citizen_reports_pending": 1
-        },
-        "incidents_by_severity": {
-            "critical": 0,
-            "high": 1,
-            "medium": 1,
-            "low": 0
-        },
-        "incidents_by_status": {
-            "active": 1,
-            "responding": 1,
-            "resolved": 0,
-            "monitoring": 0
-        },
-        "response_times": {
-            "average": 7.2,
-            "fastest": 5.8,
-            "slowest": 12.3
-        },
-        "system_health": {
-            "status": "optimal",
-            "cpu_usage": 45,
-            "memory_usage": 62,
-            "storage_usage": 38,
-            "network_latency": 12
-        },
-        "timestamp": utcnow().isoformat()
-    }
+    return _fill_json_template(_DASHBOARD_SUMMARY_TEMPLATE, _now_iso())
 
 # ==================== AI SERVICES ====================
 
@@ -3360,15 +4082,15 @@ async def websocket_events(websocket: WebSocket):
             data = await websocket.receive_text()
             # Handle subscription messages
             try:
-                msg = json.loads(data)
+                msg = orjson.loads(data)
                 if msg.get("type") == "subscribe":
                     event_types = msg.get("events", ["all"])
                     if EVENT_SYSTEM_AVAILABLE and event_broadcaster:
                         event_broadcaster.subscribe(websocket, event_types)
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(orjson.dumps({
                         "type": "subscribed",
                         "events": event_types
-                    }))
+                    }).decode())
             except:
                 pass
     except WebSocketDisconnect:
@@ -3386,6 +4108,13 @@ async def startup_event():
     logger.info("✅ Risk Scoring Engine: Loading models")
     logger.info("✅ Evidence Manager: Verifying cryptographic integrity")
     logger.info("✅ WebSocket Server: Ready for real-time connections")
+    
+    # Shared pooled client for all outbound HTTP calls (use request.app.state.http)
+    app.state.http = httpx.AsyncClient(
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=10.0
+    )
+    ws_manager.start_broadcast_queue()
     logger.info("🌐 Production API: Ready for government deployment")
 
 @app.on_event("shutdown")
@@ -3394,7 +4123,11 @@ async def shutdown_event():
     logger.info("🔄 Kenya Overwatch Production System Shutting Down")
     logger.info("💾 Saving evidence packages")
     logger.info("🔒 Securing audit logs")
+    production_system.milestone_manager.flush_audit_log()
     logger.info("📡 Closing WebSocket connections")
+    ws_manager.broadcast_task.cancel()
+    await app.state.http.aclose()
+    log_listener.stop()
 
 if __name__ == "__main__":
     import uvicorn
@@ -3404,5 +4137,10 @@ if __name__ == "__main__":
         port=8000,
         reload=False,  # No reload in production
         log_level="info",
-        access_log=True
+        access_log=os.getenv("ACCESS_LOG") == "1",
+        loop="uvloop",
+        http="httptools",
+        ws="websockets",
+        # Stores and WebSocket connections live in-process; add workers only behind shared state
+        workers=int(os.getenv("API_WORKERS", "1"))
     )
\ No newline at end of file
@@ -4,19 +4,94 @@ Real-time AI Pipeline with Risk Scoring and Evidence Management
 """
 
 import asyncio
-import json
+import atexit
+import bisect
+import re
+import secrets
+import time
 import uuid
 import hashlib
+import queue
+import orjson
 import cv2
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import shared_memory
 import numpy as np
 from datetime import datetime, timedelta, timezone
 
 def utcnow():
     return datetime.now(timezone.utc)
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import DefaultDict, Dict, List, Mapping, Optional, Any, Set, Tuple
+from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 import logging
+from logging.handlers import QueueHandler, QueueListener
+
+_uuid7_state = [0, 0]  # last timestamp (ms), sequence within that ms
+
+def uuid7() -> str:
+    """Time-ordered UUIDv7 for internal ids; the 62 random bits come from secrets, so ids are not guessable"""
+    ms = time.time_ns() // 1_000_000
+    last_ms, seq = _uuid7_state
+    if ms <= last_ms:
+        ms, seq = last_ms, seq + 1
+        if seq > 0xFFF:
+            ms, seq = ms + 1, 0
+    else:
+        seq = 0
+    _uuid7_state[0], _uuid7_state[1] = ms, seq
+    value = (ms << 80) | (0x7 << 76) | (seq << 64) | (0b10 << 62) | secrets.randbits(62)
+    return str(uuid.UUID(int=value))
+
+# datetimes (naive ones as UTC) and numpy values are encoded natively by orjson in C
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+_CANONICAL_JSON_OPTIONS = _JSON_OPTIONS | orjson.OPT_SORT_KEYS
+
+def _json_default(obj: Any) -> Any:
+    """Fallback for the few values orjson can't encode natively"""
+    if isinstance(obj, timedelta):
+        return obj.total_seconds()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    return str(obj)
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+    BLAKE3_AVAILABLE = False
+
+try:
+    import onnxruntime as ort
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ort = None
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Run kernels as plain Python/NumPy when numba is not installed"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Frame hashes are integrity checks, not signatures; BLAKE3 is several times faster than SHA-256
+FRAME_HASH_ALGORITHM = "blake3" if BLAKE3_AVAILABLE else "sha256"
 
 # Configure production logging
 import os
@@ -34,6 +109,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Audit trail as a stream of msgpack maps (read back with msgpack.Unpacker(f, raw=False));
+# entries reach the handler as record args and are never formatted into strings
+AUDIT_LEVEL = logging.INFO + 5
+logging.addLevelName(AUDIT_LEVEL, 'AUDIT')
+
+class AuditHandler(logging.Handler):
+    """Appends the audit entries carried in a record's args to a binary msgpack file"""
+    
+    def __init__(self, path: str):
+        super().__init__(level=AUDIT_LEVEL)
+        self._encoder = msgspec.msgpack.Encoder(enc_hook=_json_default)
+        self._stream = open(path, 'ab')
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            entries = record.args[0] if isinstance(record.args, tuple) else record.args
+            if isinstance(entries, dict):
+                entries = (entries,)
+            self._stream.write(b''.join(self._encoder.encode(entry) for entry in entries))
+            self._stream.flush()
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.acquire()
+        try:
+            self._stream.close()
+        finally:
+            self.release()
+        super().close()
+
+class _AuditQueueHandler(QueueHandler):
+    """QueueHandler that hands records over untouched, so the entries in args reach AuditHandler"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# The msgpack encode/write/flush runs on the listener thread, never on the event loop
+audit_logger = logging.getLogger('overwatch.audit')
+audit_listener: Optional[QueueListener] = None
+if MSGSPEC_AVAILABLE:
+    _audit_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    audit_listener = QueueListener(_audit_queue, AuditHandler(os.path.join(log_dir, 'audit.msgpack')))
+    audit_logger.addHandler(_AuditQueueHandler(_audit_queue))
+    audit_logger.setLevel(AUDIT_LEVEL)
+    audit_logger.propagate = False
+    audit_listener.start()
+    atexit.register(audit_listener.stop)  # drains queued entries before exit
+
 # ==================== ENUMS ====================
 class SeverityLevel(str, Enum):
     LOW = "low"
@@ -76,14 +200,14 @@ class MilestoneType(str, Enum):
     EVIDENCE_REVIEW = "evidence_review"
 
 # ==================== DATA MODELS ====================
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Coordinates:
     lat: float
     lng: float
     altitude: Optional[float] = None
     accuracy: Optional[float] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DetectionEvent:
     camera_id: str
     timestamp: datetime
@@ -93,8 +217,21 @@ class DetectionEvent:
     attributes: Dict[str, Any]
     frame_hash: str
     model_version: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Shallow dict of the event's fields, without asdict()'s recursive deep copy"""
+        return {
+            'camera_id': self.camera_id,
+            'timestamp': self.timestamp,
+            'detection_type': self.detection_type,
+            'confidence': self.confidence,
+            'bounding_box': self.bounding_box,
+            'attributes': self.attributes,
+            'frame_hash': self.frame_hash,
+            'model_version': self.model_version
+        }
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskFactors:
     temporal_risk: float
     spatial_risk: float
@@ -102,7 +239,7 @@ class RiskFactors:
     contextual_risk: float
     reason_codes: List[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RiskAssessment:
     risk_score: float
     risk_level: RiskLevel
@@ -111,7 +248,7 @@ class RiskAssessment:
     confidence: float
     timestamp: datetime
 
-@dataclass
+@dataclass(slots=True)
 class EvidencePackage:
     id: str
     incident_id: str
@@ -126,7 +263,7 @@ class EvidencePackage:
     retention_until: Optional[datetime] = None
     package_hash: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class ProductionIncident:
     id: str
     type: str
@@ -146,7 +283,7 @@ class ProductionIncident:
     human_review_completed: bool
     appeal_deadline: Optional[datetime]
 
-@dataclass
+@dataclass(slots=True)
 class Milestone:
     id: str
     title: str
@@ -168,6 +305,89 @@ class Milestone:
     rejection_reason: Optional[str]
 
 # ==================== AI PIPELINE ====================
+DETECTION_BATCH_SIZE = 16  # max frames per forward pass
+DETECTION_BATCH_WINDOW_SECONDS = 0.01  # how long the first frame waits for others to join its batch
+DETECTION_INPUT_SIZE = (640, 640)  # model input (width, height)
+DETECTION_NMS_IOU = 0.45
+# Detector models whose ONNX sessions run in _detect_batch, and the event type each one emits
+_DETECTOR_LABELS = (('person_detection', 'person'), ('vehicle_detection', 'vehicle'))
+FRAME_DEDUP_MAX_DISTANCE = 4  # dHash bits that may differ for a frame to count as a near-duplicate
+# A static scene (e.g. someone loitering in place) still records one frame per interval,
+# so behavioural risk keeps seeing the detections at a reduced rate
+FRAME_DEDUP_MAX_AGE_SECONDS = 5.0
+PREPROCESS_WORKERS = min(4, os.cpu_count() or 1)
+INFERENCE_CPU_THREADS = int(os.getenv('INFERENCE_CPU_THREADS', str(os.cpu_count() or 1)))
+DETECTION_MODEL_DIR = os.getenv(
+    'DETECTION_MODEL_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'models')
+)
+
+def _preprocess_frame(frame: np.ndarray) -> np.ndarray:
+    """Resize, normalize and transpose a BGR frame into a contiguous CHW float32 tensor"""
+    resized = cv2.resize(frame, DETECTION_INPUT_SIZE, interpolation=cv2.INTER_LINEAR)
+    rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+    tensor = np.ascontiguousarray(rgb.transpose(2, 0, 1), dtype=np.float32)
+    tensor *= 1.0 / 255.0
+    return tensor
+
+class EventRing:
+    """Per-camera detection history stored as parallel NumPy columns (structure of arrays)"""
+    
+    COLUMNS = (
+        ('ts', np.float64), ('conf', np.float32), ('x', np.int32), ('y', np.int32),
+        ('w', np.int32), ('h', np.int32), ('phash', np.uint64)
+    )
+    
+    def __init__(self, capacity: int = 1024):
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, dtype in self.COLUMNS}
+        self._start = 0
+        self._end = 0
+        self.last_phash: Optional[int] = None  # dHash of the most recently stored frame
+        self.last_ts: Optional[float] = None  # timestamp of the most recently stored frame
+    
+    def __len__(self) -> int:
+        return self._end - self._start
+    
+    def column(self, name: str) -> np.ndarray:
+        """View of one field across all live events, oldest first"""
+        return self._columns[name][self._start:self._end]
+    
+    def extend(self, events: List[DetectionEvent], frame_phash: int = 0):
+        """Append events from one frame, copying only their scalar fields into the columns"""
+        count = len(events)
+        if not count:
+            return
+        self._reserve(count)
+        start, end = self._end, self._end + count
+        columns = self._columns
+        columns['ts'][start:end] = [event.timestamp.timestamp() for event in events]
+        columns['conf'][start:end] = [event.confidence for event in events]
+        for key in ('x', 'y', 'w', 'h'):
+            columns[key][start:end] = [event.bounding_box.get(key, 0) for event in events]
+        columns['phash'][start:end] = frame_phash
+        self._end = end
+        self.last_phash = frame_phash
+        self.last_ts = float(columns['ts'][end - 1])
+    
+    def expire(self, cutoff: float):
+        """Drop events with ts <= cutoff; timestamps are appended in order, so this is a binary search"""
+        self._start += int(np.searchsorted(self.column('ts'), cutoff, side='right'))
+    
+    def _reserve(self, count: int):
+        """Make room for count more events, compacting or doubling the columns as needed"""
+        capacity = self._columns['ts'].shape[0]
+        if self._end + count <= capacity:
+            return
+        size = len(self)
+        while size + count > capacity:
+            capacity *= 2
+        for name, dtype in self.COLUMNS:
+            old = self._columns[name]
+            new = old if capacity == old.shape[0] else np.empty(capacity, dtype=dtype)
+            new[:size] = old[self._start:self._end]
+            self._columns[name] = new
+        self._start, self._end = 0, size
+
 class AIDetectionPipeline:
     """Production AI Pipeline with multiple detection models"""
     
@@ -180,18 +400,57 @@ class AIDetectionPipeline:
             'behavior_analysis': self._load_behavior_model()
         }
         self.trackers = {}  # Per-camera object trackers
-        self.detection_history = {}  # Historical data for risk scoring
+        self.detection_history: Dict[str, EventRing] = {}  # Historical data for risk scoring
+        self._pending_frames: Optional[asyncio.Queue] = None  # (tensor, future) awaiting a batch
+        self._batch_worker_task: Optional[asyncio.Task] = None
+        # OpenCV and NumPy release the GIL, so preprocessing overlaps the batch worker on threads
+        self._preprocess_pool = ThreadPoolExecutor(max_workers=PREPROCESS_WORKERS, thread_name_prefix='preprocess')
+        # Batches run one at a time; each ONNX Runtime call is already multi-threaded internally
+        self._inference_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inference')
         
     def _load_yolo_model(self, object_type: str):
         """Load YOLO model for object detection"""
         # In production, load actual model weights
         logger.info(f"Loading YOLO model for {object_type}")
-        return {
+        model = {
             'type': 'yolo',
             'object_type': object_type,
             'confidence_threshold': 0.6,
             'model_version': '1.2.0'
         }
+        # Exported with train_ai.export_model (FP16, dynamic batch); an INT8 build from
+        # train_ai.quantize_model takes precedence for these always-on detectors
+        for precision, filename in (('int8', f'yolo_{object_type}.int8.onnx'), ('fp16', f'yolo_{object_type}.onnx')):
+            model_path = os.path.join(DETECTION_MODEL_DIR, filename)
+            if ONNXRUNTIME_AVAILABLE and os.path.exists(model_path):
+                model['session'] = self._create_inference_session(model_path, int8=precision == 'int8')
+                model['precision'] = precision
+                break
+        return model
+    
+    def _create_inference_session(self, model_path: str, int8: bool = False):
+        """Create an inference session preferring TensorRT FP16, then CUDA, then oneDNN/CPU"""
+        preferred = [
+            ('TensorrtExecutionProvider', {
+                'trt_fp16_enable': True,
+                'trt_int8_enable': int8,
+                'trt_engine_cache_enable': True,
+                'trt_engine_cache_path': DETECTION_MODEL_DIR
+            }),
+            ('CUDAExecutionProvider', {}),
+            # GPU-less edge boxes: oneDNN picks AVX-512/VNNI kernels at runtime when the CPU has them
+            ('DnnlExecutionProvider', {}),
+            ('CPUExecutionProvider', {})
+        ]
+        available = set(ort.get_available_providers())
+        providers = [provider for provider in preferred if provider[0] in available]
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = INFERENCE_CPU_THREADS
+        session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+        logger.info(f"Loaded {model_path} with {session.get_providers()[0]}")
+        return session
     
     def _load_weapon_model(self):
         """Load weapon detection model (hard-gated)"""
@@ -226,13 +485,19 @@ class AIDetectionPipeline:
         """Process single frame through AI pipeline"""
         events = []
         
-        # Step 1: Object Detection
-        detections = await self._detect_objects(frame)
+        # Step 1: Preprocess off the event loop, then Object Detection; the evidence hash
+        # runs on the same pool concurrently so it never blocks other cameras' coroutines
+        loop = asyncio.get_running_loop()
+        frame_hash_future = loop.run_in_executor(self._preprocess_pool, self._hash_frame, frame)
+        frame_phash_future = loop.run_in_executor(self._preprocess_pool, self._frame_phash, frame)
+        tensor = await loop.run_in_executor(self._preprocess_pool, _preprocess_frame, frame)
+        detections = await self._detect_objects(tensor, (frame.shape[1], frame.shape[0]))
         
         # Step 2: Object Tracking
         tracked_objects = await self._track_objects(camera_id, detections)
         
         # Step 3: Attribute Extraction
+        frame_hash = await frame_hash_future
         for obj in tracked_objects:
             attributes = await self._extract_attributes(frame, obj)
             
@@ -244,41 +509,123 @@ class AIDetectionPipeline:
                 confidence=obj['confidence'],
                 bounding_box=obj['bbox'],
                 attributes=attributes,
-                frame_hash=self._hash_frame(frame),
+                frame_hash=frame_hash,
                 model_version=obj['model_version']
             )
             events.append(event)
         
         # Step 5: Store in detection history
-        self._store_detection_history(camera_id, events)
+        self._store_detection_history(camera_id, events, await frame_phash_future)
         
         return events
     
-    async def _detect_objects(self, frame: np.ndarray) -> List[Dict]:
-        """Run object detection on frame"""
-        detections = []
-        
-        # Simulate YOLO detection
-        # In production, actual model inference here
-        height, width = frame.shape[:2]
-        
-        # Mock detections for demo
-        mock_detections = [
-            {
-                'type': 'person',
-                'confidence': 0.85,
-                'bbox': {'x': 100, 'y': 100, 'w': 50, 'h': 100},
-                'model_version': '1.2.0'
-            },
+    async def _detect_objects(self, tensor: np.ndarray, frame_size: Tuple[int, int]) -> List[Dict]:
+        """Run object detection on a preprocessed CHW tensor as part of the next batched forward pass"""
+        loop = asyncio.get_running_loop()
+        worker = self._batch_worker_task
+        if worker is None or worker.done() or worker.get_loop() is not loop:
+            self._pending_frames = asyncio.Queue()
+            self._batch_worker_task = loop.create_task(self._batch_worker())
+        
+        future = loop.create_future()
+        self._pending_frames.put_nowait((tensor, frame_size, future))
+        return await future
+    
+    async def _batch_worker(self):
+        """Collect frames from all cameras into batches and run one detection pass per batch"""
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._pending_frames.get()]
+            deadline = loop.time() + DETECTION_BATCH_WINDOW_SECONDS
+            while len(items) < DETECTION_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self._pending_frames.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await loop.run_in_executor(
+                    self._inference_pool, self._detect_batch,
+                    [tensor for tensor, _, _ in items], [frame_size for _, frame_size, _ in items]
+                )
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, _, future), detections in zip(items, results):
+                if not future.done():
+                    future.set_result(detections)
+    
+    def _detect_batch(self, tensors: List[np.ndarray], frame_sizes: List[Tuple[int, int]]) -> List[List[Dict]]:
+        """Run object detection over a batch of tensors, returning detections per frame"""
+        # Tensors share DETECTION_INPUT_SIZE, so they stack into one (B, 3, H, W) NCHW batch
+        batch = np.stack(tensors)
+        detectors = [(label, self.models[key]) for key, label in _DETECTOR_LABELS if 'session' in self.models[key]]
+        if detectors:
+            results: List[List[Dict]] = [[] for _ in tensors]
+            for label, model in detectors:
+                session = model['session']
+                model_input = session.get_inputs()[0]
+                feed = batch.astype(np.float16) if model_input.type == 'tensor(float16)' else batch
+                # YOLOv8 export: (B, 4 + classes, anchors), boxes as centre x/y, width, height
+                outputs = session.run(None, {model_input.name: feed})[0]
+                for detections, output, frame_size in zip(results, outputs, frame_sizes):
+                    detections.extend(self._decode_detections(output, label, model, frame_size))
+            return results
+        
+        # Mock detections for demo (no exported detector models found)
+        return [
+            [
+                {
+                    'type': 'person',
+                    'confidence': 0.85,
+                    'bbox': {'x': 100, 'y': 100, 'w': 50, 'h': 100},
+                    'model_version': '1.2.0'
+                },
+                {
+                    'type': 'vehicle',
+                    'confidence': 0.92,
+                    'bbox': {'x': 200, 'y': 150, 'w': 80, 'h': 60},
+                    'model_version': '1.2.0'
+                }
+            ]
+            for _ in range(batch.shape[0])
+        ]
+    
+    def _decode_detections(self, output: np.ndarray, label: str, model: Dict[str, Any],
+                           frame_size: Tuple[int, int]) -> List[Dict]:
+        """Turn one frame's YOLO output into NMS-filtered detections in frame pixel coordinates"""
+        preds = output.T.astype(np.float32, copy=False)
+        scores = preds[:, 4:].max(axis=1)
+        keep = scores >= model['confidence_threshold']
+        if not keep.any():
+            return []
+        preds, scores = preds[keep], scores[keep]
+        
+        # Preprocessing is a plain resize, so boxes scale back per axis
+        scale_x = frame_size[0] / DETECTION_INPUT_SIZE[0]
+        scale_y = frame_size[1] / DETECTION_INPUT_SIZE[1]
+        boxes = np.empty((len(preds), 4), dtype=np.float32)
+        boxes[:, 0] = (preds[:, 0] - preds[:, 2] / 2) * scale_x
+        boxes[:, 1] = (preds[:, 1] - preds[:, 3] / 2) * scale_y
+        boxes[:, 2] = preds[:, 2] * scale_x
+        boxes[:, 3] = preds[:, 3] * scale_y
+        
+        indices = cv2.dnn.NMSBoxes(boxes.tolist(), scores.tolist(), model['confidence_threshold'], DETECTION_NMS_IOU)
+        return [
             {
-                'type': 'vehicle',
-                'confidence': 0.92,
-                'bbox': {'x': 200, 'y': 150, 'w': 80, 'h': 60},
-                'model_version': '1.2.0'
+                'type': label,
+                'confidence': float(scores[i]),
+                'bbox': {'x': int(boxes[i, 0]), 'y': int(boxes[i, 1]), 'w': int(boxes[i, 2]), 'h': int(boxes[i, 3])},
+                'model_version': model['model_version']
             }
+            for i in np.asarray(indices).reshape(-1)
         ]
-        
-        return mock_detections
     
     async def _track_objects(self, camera_id: str, detections: List[Dict]) -> List[Dict]:
         """Track objects across frames"""
@@ -328,24 +675,73 @@ class AIDetectionPipeline:
     
     def _hash_frame(self, frame: np.ndarray) -> str:
         """Create cryptographic hash of frame for evidence integrity"""
-        frame_bytes = frame.tobytes()
-        return hashlib.sha256(frame_bytes).hexdigest()
+        # Hash the frame buffer in place; only non-contiguous views (e.g. crops) need a copy
+        if not frame.flags['C_CONTIGUOUS']:
+            frame = np.ascontiguousarray(frame)
+        frame_view = memoryview(frame).cast('B')
+        if BLAKE3_AVAILABLE:
+            return blake3.blake3(frame_view).hexdigest()
+        return hashlib.sha256(frame_view).hexdigest()
+    
+    def _frame_phash(self, frame: np.ndarray) -> int:
+        """64-bit difference hash (dHash) of frame for near-duplicate detection, not evidence"""
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+        small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+        return int.from_bytes(np.packbits(small[:, 1:] > small[:, :-1]).tobytes(), 'big')
     
-    def _store_detection_history(self, camera_id: str, events: List[DetectionEvent]):
+    def _store_detection_history(self, camera_id: str, events: List[DetectionEvent], frame_phash: int = 0):
         """Store detection events for risk scoring and evidence"""
-        if camera_id not in self.detection_history:
-            self.detection_history[camera_id] = []
-        
-        self.detection_history[camera_id].extend(events)
+        history = self.detection_history.get(camera_id)
+        if history is None:
+            history = self.detection_history[camera_id] = EventRing()
         
         # Keep only last 24 hours of data
-        cutoff_time = utcnow() - timedelta(hours=24)
-        self.detection_history[camera_id] = [
-            event for event in self.detection_history[camera_id]
-            if event.timestamp > cutoff_time
-        ]
+        history.expire((utcnow() - timedelta(hours=24)).timestamp())
+        
+        if not events:
+            return
+        
+        # A static scene yields near-identical frames; keep the first of each run plus one per
+        # FRAME_DEDUP_MAX_AGE_SECONDS. This is frame-level, so a stationary subject is thinned
+        # along with the background rather than tracked individually
+        if (history.last_phash is not None
+                and (history.last_phash ^ frame_phash).bit_count() <= FRAME_DEDUP_MAX_DISTANCE
+                and events[0].timestamp.timestamp() - history.last_ts < FRAME_DEDUP_MAX_AGE_SECONDS):
+            return
+        history.extend(events, frame_phash)
 
 # ==================== RISK SCORING ENGINE ====================
+RISK_FACTOR_ORDER = ('behavioral', 'spatial', 'temporal', 'contextual')
+
+# Scores below each threshold map to the level at the same index; the rest are CRITICAL
+_RISK_LEVEL_THRESHOLDS = (0.3, 0.6, 0.8)
+_RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+_RECOMMENDED_ACTIONS = {
+    RiskLevel.LOW: "Log only",
+    RiskLevel.MEDIUM: "Operator notification",
+    RiskLevel.HIGH: "Supervisor review",
+    RiskLevel.CRITICAL: "Immediate human response"
+}
+
+@njit(cache=True, fastmath=True)
+def _behavioral_kernel(timestamps):
+    """Motion-change, loitering and directional-conflict scores in a single pass"""
+    n = timestamps.shape[0]
+    
+    # Simplified logic - in production, analyze velocity vectors
+    motion_changes = 0.3  # Mock value
+    
+    # Check if same object detected for extended period (5 minutes)
+    loitering = 0.0
+    if n >= 5:
+        loitering = 0.8 if timestamps[n - 1] - timestamps[0] > 300.0 else 0.2
+    
+    # Simplified logic - in production, analyze movement vectors
+    conflicts = 0.4  # Mock value
+    
+    return motion_changes, loitering, conflicts
+
 class RiskScoringEngine:
     """Production Risk Scoring with Explainable AI"""
     
@@ -356,28 +752,31 @@ class RiskScoringEngine:
             'temporal': 0.2,
             'contextual': 0.1
         }
+        # Weight vector in factor order, so the weighted sum is a single dot product
+        self._weights = np.array([self.risk_weights[name] for name in RISK_FACTOR_ORDER], dtype=np.float64)
         self.high_risk_zones = [
             {'name': 'airport', 'risk_multiplier': 1.5},
             {'name': 'government', 'risk_multiplier': 1.3},
             {'name': 'school', 'risk_multiplier': 1.2}
         ]
+        # One precompiled pass over the location instead of a substring check per zone
+        self._zone_multipliers = {zone['name']: zone['risk_multiplier'] for zone in self.high_risk_zones}
+        self._zone_pattern = re.compile('|'.join(re.escape(name) for name in self._zone_multipliers))
         
-    async def assess_risk(self, events: List[DetectionEvent], context: Dict[str, Any]) -> RiskAssessment:
+    async def assess_risk(self, events: List[DetectionEvent], context: Mapping[str, Any],
+                          *, now: Optional[datetime] = None) -> RiskAssessment:
         """Comprehensive risk assessment with explainable factors"""
+        now = now or utcnow()
         
         # Calculate individual risk factors
         behavioral_risk = self._calculate_behavioral_risk(events)
         spatial_risk = self._calculate_spatial_risk(context)
-        temporal_risk = self._calculate_temporal_risk(events, context)
+        temporal_risk = self._calculate_temporal_risk(events, context, now)
         contextual_risk = self._calculate_contextual_risk(events, context)
         
         # Combine with weights
-        risk_score = (
-            self.risk_weights['behavioral'] * behavioral_risk +
-            self.risk_weights['spatial'] * spatial_risk +
-            self.risk_weights['temporal'] * temporal_risk +
-            self.risk_weights['contextual'] * contextual_risk
-        )
+        factor_vector = np.array([behavioral_risk, spatial_risk, temporal_risk, contextual_risk], dtype=np.float64)
+        risk_score = float(self._weights @ factor_vector)
         
         # Determine risk level
         risk_level = self._determine_risk_level(risk_score)
@@ -404,7 +803,7 @@ class RiskScoringEngine:
             factors=factors,
             recommended_action=recommended_action,
             confidence=0.85,  # Model confidence
-            timestamp=utcnow()
+            timestamp=now
         )
     
     def _calculate_behavioral_risk(self, events: List[DetectionEvent]) -> float:
@@ -415,36 +814,36 @@ class RiskScoringEngine:
         risk_score = 0.0
         reason_codes = []
         
+        # All three behavioural detectors run as one compiled pass over the event timestamps
+        timestamps = np.fromiter((event.timestamp.timestamp() for event in events), dtype=np.float64, count=len(events))
+        motion_changes, loitering_score, conflicts = _behavioral_kernel(timestamps)
+        
         # Check for sudden motion changes
-        motion_changes = self._detect_motion_changes(events)
         if motion_changes > 0.7:
             risk_score += 0.3
             reason_codes.append('SUDDEN_MOTION_CHANGE')
         
         # Check for loitering
-        loitering_score = self._detect_loitering(events)
         if loitering_score > 0.6:
             risk_score += 0.2
             reason_codes.append('EXTENDED_LOITERING')
         
         # Check for directional conflicts
-        conflicts = self._detect_directional_conflicts(events)
         if conflicts > 0.5:
             risk_score += 0.25
             reason_codes.append('DIRECTIONAL_CONFLICT')
         
         return min(risk_score, 1.0)
     
-    def _calculate_spatial_risk(self, context: Dict[str, Any]) -> float:
+    def _calculate_spatial_risk(self, context: Mapping[str, Any]) -> float:
         """Calculate spatial risk based on location"""
         base_risk = 0.1
         location = context.get('location', '').lower()
         
         # Check high-risk zones
-        for zone in self.high_risk_zones:
-            if zone['name'] in location:
-                base_risk *= zone['risk_multiplier']
-                break
+        match = self._zone_pattern.search(location)
+        if match:
+            base_risk *= self._zone_multipliers[match.group()]
         
         # Check crowd density
         crowd_density = context.get('crowd_density', 'normal')
@@ -455,9 +854,10 @@ class RiskScoringEngine:
         
         return min(base_risk, 1.0)
     
-    def _calculate_temporal_risk(self, events: List[DetectionEvent], context: Dict[str, Any]) -> float:
+    def _calculate_temporal_risk(self, events: List[DetectionEvent], context: Mapping[str, Any],
+                                 now: Optional[datetime] = None) -> float:
         """Calculate temporal risk based on time patterns"""
-        current_hour = utcnow().hour
+        current_hour = (now or utcnow()).hour
         
         # Night hours are higher risk
         if 22 <= current_hour or current_hour <= 5:
@@ -467,7 +867,7 @@ class RiskScoringEngine:
         else:  # Daytime
             return 0.1
     
-    def _calculate_contextual_risk(self, events: List[DetectionEvent], context: Dict[str, Any]) -> float:
+    def _calculate_contextual_risk(self, events: List[DetectionEvent], context: Mapping[str, Any]) -> float:
         """Calculate contextual risk based on environmental factors"""
         risk_score = 0.0
         
@@ -487,14 +887,7 @@ class RiskScoringEngine:
     
     def _determine_risk_level(self, risk_score: float) -> RiskLevel:
         """Determine risk level based on score"""
-        if risk_score < 0.3:
-            return RiskLevel.LOW
-        elif risk_score < 0.6:
-            return RiskLevel.MEDIUM
-        elif risk_score < 0.8:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.CRITICAL
+        return _RISK_LEVELS[bisect.bisect_right(_RISK_LEVEL_THRESHOLDS, risk_score)]
     
     def _generate_reason_codes(self, *risk_scores: float) -> List[str]:
         """Generate explainable reason codes"""
@@ -513,36 +906,15 @@ class RiskScoringEngine:
     
     def _recommend_action(self, risk_level: RiskLevel) -> str:
         """Recommended action based on risk level"""
-        actions = {
-            RiskLevel.LOW: "Log only",
-            RiskLevel.MEDIUM: "Operator notification",
-            RiskLevel.HIGH: "Supervisor review",
-            RiskLevel.CRITICAL: "Immediate human response"
-        }
-        return actions[risk_level]
-    
-    def _detect_motion_changes(self, events: List[DetectionEvent]) -> float:
-        """Detect sudden motion changes in events"""
-        # Simplified logic - in production, analyze velocity vectors
-        return 0.3  # Mock value
-    
-    def _detect_loitering(self, events: List[DetectionEvent]) -> float:
-        """Detect extended loitering behavior"""
-        if len(events) < 5:
-            return 0.0
-        
-        # Check if same object detected for extended period
-        time_span = (events[-1].timestamp - events[0].timestamp).total_seconds()
-        if time_span > 300:  # 5 minutes
-            return 0.8
-        return 0.2
-    
-    def _detect_directional_conflicts(self, events: List[DetectionEvent]) -> float:
-        """Detect directional conflicts between objects"""
-        # Simplified logic - in production, analyze movement vectors
-        return 0.4  # Mock value
+        return _RECOMMENDED_ACTIONS[risk_level]
 
 # ==================== EVIDENCE MANAGEMENT ====================
+# Package fields that change after creation; hashed as the header leaf on every mutation
+_PACKAGE_HEADER_FIELDS = (
+    'id', 'incident_id', 'created_at', 'metadata', 'status',
+    'reviewer_id', 'review_notes', 'appeal_status', 'retention_until'
+)
+
 class EvidenceManager:
     """Court-admissible evidence management system"""
     
@@ -550,6 +922,7 @@ class EvidenceManager:
         self.evidence_packages = {}
         self.audit_log = []
         self.retention_policies = self._load_retention_policies()
+        self._package_leaves: Dict[str, Tuple[bytes, bytes]] = {}  # package_id -> (events leaf, risk leaf)
         
     def _load_retention_policies(self) -> Dict[str, timedelta]:
         """Load data retention policies"""
@@ -564,11 +937,11 @@ class EvidenceManager:
                                      risk_assessment: RiskAssessment) -> EvidencePackage:
         """Create tamper-proof evidence package"""
         
-        package_id = str(uuid.uuid4())
+        package_id = uuid7()
         created_at = utcnow()
         
         # Calculate retention period
-        retention_until = self._calculate_retention_date(risk_assessment.risk_level)
+        retention_until = self._calculate_retention_date(risk_assessment.risk_level, created_at)
         
         # Create package
         package = EvidencePackage(
@@ -581,6 +954,8 @@ class EvidenceManager:
                 'created_by': 'AI_System',
                 'camera_calibrations': self._get_camera_calibrations(),
                 'system_version': '2.0.0',
+                'frame_hash_algorithm': FRAME_HASH_ALGORITHM,
+                'package_hash_scheme': 'sha256-merkle(events, risk_assessment, header)',
                 'chain_of_custody': []
             },
             status=EvidenceStatus.CREATED,
@@ -598,7 +973,7 @@ class EvidenceManager:
             'package_id': package_id,
             'incident_id': incident_id,
             'hash': package.package_hash
-        })
+        }, created_at)
         
         return package
     
@@ -610,6 +985,7 @@ class EvidenceManager:
             return False
         
         package = self.evidence_packages[package_id]
+        now = utcnow()
         
         # Update package
         package.status = EvidenceStatus.APPROVED if decision == 'approve' else EvidenceStatus.REJECTED
@@ -619,7 +995,7 @@ class EvidenceManager:
             'action': 'review',
             'reviewer_id': reviewer_id,
             'decision': decision,
-            'timestamp': utcnow().isoformat()
+            'timestamp': now.isoformat()
         })
         
         # Re-hash after modification
@@ -631,7 +1007,7 @@ class EvidenceManager:
             'reviewer_id': reviewer_id,
             'decision': decision,
             'notes': notes
-        })
+        }, now)
         
         return True
     
@@ -642,33 +1018,49 @@ class EvidenceManager:
             return False
         
         package = self.evidence_packages[package_id]
+        now = utcnow()
         package.status = EvidenceStatus.APPEALED
         package.appeal_status = 'submitted'
         package.metadata['appeal_reason'] = appeal_reason
-        package.metadata['appeal_date'] = utcnow().isoformat()
+        package.metadata['appeal_date'] = now.isoformat()
         
         # Extend retention for appeal
-        package.retention_until = utcnow() + self.retention_policies['appeals_data']
+        package.retention_until = now + self.retention_policies['appeals_data']
+        
+        # Re-hash after modification (only the header leaf changes)
+        package.package_hash = self._hash_package(package)
         
         # Log appeal
         self._log_audit_event('appeal_submitted', {
             'package_id': package_id,
             'reason': appeal_reason
-        })
+        }, now)
         
         return True
     
     def _hash_package(self, package: EvidencePackage) -> str:
-        """Generate cryptographic hash of evidence package"""
-        package_data = json.dumps(asdict(package), sort_keys=True, default=str)
-        return hashlib.sha256(package_data.encode()).hexdigest()
+        """Generate cryptographic hash of evidence package as a Merkle root over its leaves"""
+        # Events and risk assessment are fixed at creation, so their leaves are hashed once;
+        # reviews and appeals only re-hash the small header leaf
+        leaves = self._package_leaves.get(package.id)
+        if leaves is None:
+            leaves = (self._hash_leaf(package.events), self._hash_leaf(package.risk_assessment))
+            self._package_leaves[package.id] = leaves
+        header = {field: getattr(package, field) for field in _PACKAGE_HEADER_FIELDS}
+        return hashlib.sha256(leaves[0] + leaves[1] + self._hash_leaf(header)).hexdigest()
     
-    def _calculate_retention_date(self, risk_level: RiskLevel) -> datetime:
+    def _hash_leaf(self, value: Any) -> bytes:
+        """SHA-256 digest of the canonical JSON encoding of value"""
+        # orjson walks the dataclasses directly, so there is no asdict() deep copy
+        return hashlib.sha256(orjson.dumps(value, default=_json_default, option=_CANONICAL_JSON_OPTIONS)).digest()
+    
+    def _calculate_retention_date(self, risk_level: RiskLevel, now: Optional[datetime] = None) -> datetime:
         """Calculate retention date based on risk level"""
+        now = now or utcnow()
         if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-            return utcnow() + self.retention_policies['offence_evidence']
+            return now + self.retention_policies['offence_evidence']
         else:
-            return utcnow() + self.retention_policies['non_offence']
+            return now + self.retention_policies['non_offence']
     
     def _get_camera_calibrations(self) -> Dict[str, Any]:
         """Get camera calibration data"""
@@ -678,10 +1070,10 @@ class EvidenceManager:
             'timestamp_sync': 'NTP synced'
         }
     
-    def _log_audit_event(self, event_type: str, data: Dict[str, Any]):
+    def _log_audit_event(self, event_type: str, data: Dict[str, Any], ts: Optional[datetime] = None):
         """Log audit event for chain of custody"""
         audit_entry = {
-            'timestamp': utcnow().isoformat(),
+            'timestamp': (ts or utcnow()).isoformat(),
             'event_type': event_type,
             'data': data,
             'user_id': 'system',
@@ -691,15 +1083,47 @@ class EvidenceManager:
         self.audit_log.append(audit_entry)
         
         # In production, write to immutable audit log storage
-        logger.info(f"Audit Event: {event_type} - {data}")
+        if MSGSPEC_AVAILABLE:
+            audit_logger.log(AUDIT_LEVEL, '', audit_entry)
+        elif logger.isEnabledFor(logging.INFO):
+            payload = orjson.dumps(audit_entry, default=_json_default, option=_JSON_OPTIONS)
+            logger.info("Audit Event: %s", payload.decode())
 
 # ==================== MILESTONE MANAGEMENT ====================
+AUDIT_LOG_MAX_ENTRIES = 10000  # in-memory tail; the full trail lives in the log files
+AUDIT_FLUSH_BATCH_SIZE = 32
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.1
+
 class MilestoneManager:
     """Milestone tracking and approval system"""
     
     def __init__(self):
         self.milestones: Dict[str, Milestone] = {}
-        self.audit_log: List[Dict[str, Any]] = []
+        self.audit_log: deque = deque(maxlen=AUDIT_LOG_MAX_ENTRIES)
+        self._audit_pending: List[Dict[str, Any]] = []  # entries not yet written to the log
+        self._audit_flush_handle: Optional[asyncio.TimerHandle] = None
+        # Secondary indexes of milestone ids, kept in step with every mutation
+        self._by_status: Dict[MilestoneStatus, Set[str]] = defaultdict(set)
+        self._by_type: Dict[MilestoneType, Set[str]] = defaultdict(set)
+        self._by_assignee: Dict[Optional[str], Set[str]] = defaultdict(set)
+    
+    def _index(self, milestone: Milestone):
+        """Add milestone to the secondary indexes"""
+        self._by_status[milestone.status].add(milestone.id)
+        self._by_type[milestone.type].add(milestone.id)
+        self._by_assignee[milestone.assigned_to].add(milestone.id)
+    
+    def _unindex(self, milestone: Milestone):
+        """Remove milestone from the secondary indexes"""
+        self._by_status[milestone.status].discard(milestone.id)
+        self._by_type[milestone.type].discard(milestone.id)
+        self._by_assignee[milestone.assigned_to].discard(milestone.id)
+    
+    def _set_status(self, milestone: Milestone, status: MilestoneStatus):
+        """Transition milestone status, moving it between status index sets"""
+        self._by_status[milestone.status].discard(milestone.id)
+        milestone.status = status
+        self._by_status[status].add(milestone.id)
     
     def create_milestone(
         self,
@@ -714,7 +1138,8 @@ class MilestoneManager:
         linked_evidence_id: Optional[str] = None
     ) -> Milestone:
         """Create a new milestone"""
-        milestone_id = str(uuid.uuid4())
+        milestone_id = uuid7()
+        now = utcnow()
         
         milestone = Milestone(
             id=milestone_id,
@@ -726,7 +1151,7 @@ class MilestoneManager:
             created_by=created_by,
             assigned_to=assigned_to,
             approved_by=None,
-            created_at=utcnow(),
+            created_at=now,
             updated_at=None,
             due_date=due_date,
             completed_at=None,
@@ -738,12 +1163,13 @@ class MilestoneManager:
         )
         
         self.milestones[milestone_id] = milestone
+        self._index(milestone)
         self._log_audit_event('milestone_created', {
             'milestone_id': milestone_id,
             'title': title,
             'type': milestone_type.value,
             'created_by': created_by
-        })
+        }, now)
         
         logger.info(f"Milestone created: {milestone_id} - {title}")
         return milestone
@@ -760,17 +1186,19 @@ class MilestoneManager:
         
         milestone = self.milestones[milestone_id]
         
+        self._unindex(milestone)
         for key, value in updates.items():
             if hasattr(milestone, key):
                 setattr(milestone, key, value)
+        self._index(milestone)
         
-        milestone.updated_at = utcnow()
+        milestone.updated_at = now = utcnow()
         
         self._log_audit_event('milestone_updated', {
             'milestone_id': milestone_id,
             'updated_by': updated_by,
             'fields': list(updates.keys())
-        })
+        }, now)
         
         logger.info(f"Milestone updated: {milestone_id}")
         return milestone
@@ -785,14 +1213,13 @@ class MilestoneManager:
         if milestone.status not in [MilestoneStatus.DRAFT, MilestoneStatus.IN_PROGRESS]:
             return None
         
-        milestone.status = MilestoneStatus.PENDING_APPROVAL
-        milestone.submitted_for_approval_at = utcnow()
-        milestone.updated_at = utcnow()
+        self._set_status(milestone, MilestoneStatus.PENDING_APPROVAL)
+        milestone.submitted_for_approval_at = milestone.updated_at = now = utcnow()
         
         self._log_audit_event('milestone_submitted', {
             'milestone_id': milestone_id,
             'submitted_by': submitted_by
-        })
+        }, now)
         
         logger.info(f"Milestone submitted for approval: {milestone_id}")
         return milestone
@@ -812,17 +1239,16 @@ class MilestoneManager:
         if milestone.status != MilestoneStatus.PENDING_APPROVAL:
             return None
         
-        milestone.status = MilestoneStatus.APPROVED
+        self._set_status(milestone, MilestoneStatus.APPROVED)
         milestone.approved_by = approved_by
         milestone.approval_notes = notes
-        milestone.completed_at = utcnow()
-        milestone.updated_at = utcnow()
+        milestone.completed_at = milestone.updated_at = now = utcnow()
         
         self._log_audit_event('milestone_approved', {
             'milestone_id': milestone_id,
             'approved_by': approved_by,
             'notes': notes
-        })
+        }, now)
         
         logger.info(f"Milestone approved: {milestone_id} by {approved_by}")
         return milestone
@@ -842,16 +1268,16 @@ class MilestoneManager:
         if milestone.status != MilestoneStatus.PENDING_APPROVAL:
             return None
         
-        milestone.status = MilestoneStatus.REJECTED
+        self._set_status(milestone, MilestoneStatus.REJECTED)
         milestone.approved_by = rejected_by
         milestone.rejection_reason = reason
-        milestone.updated_at = utcnow()
+        milestone.updated_at = now = utcnow()
         
         self._log_audit_event('milestone_rejected', {
             'milestone_id': milestone_id,
             'rejected_by': rejected_by,
             'reason': reason
-        })
+        }, now)
         
         logger.info(f"Milestone rejected: {milestone_id} by {rejected_by}")
         return milestone
@@ -863,14 +1289,20 @@ class MilestoneManager:
         assigned_to: Optional[str] = None
     ) -> List[Milestone]:
         """Get milestones with optional filters"""
-        results = list(self.milestones.values())
-        
+        candidates = []
         if status:
-            results = [m for m in results if m.status == status]
+            candidates.append(self._by_status.get(status, set()))
         if milestone_type:
-            results = [m for m in results if m.type == milestone_type]
+            candidates.append(self._by_type.get(milestone_type, set()))
         if assigned_to:
-            results = [m for m in results if m.assigned_to == assigned_to]
+            candidates.append(self._by_assignee.get(assigned_to, set()))
+        
+        if candidates:
+            candidates.sort(key=len)
+            ids = candidates[0].intersection(*candidates[1:])
+            results = [self.milestones[milestone_id] for milestone_id in ids]
+        else:
+            results = list(self.milestones.values())
         
         return sorted(results, key=lambda m: m.created_at, reverse=True)
     
@@ -889,6 +1321,7 @@ class MilestoneManager:
             return False
         
         del self.milestones[milestone_id]
+        self._unindex(milestone)
         
         self._log_audit_event('milestone_deleted', {
             'milestone_id': milestone_id
@@ -897,10 +1330,10 @@ class MilestoneManager:
         logger.info(f"Milestone deleted: {milestone_id}")
         return True
     
-    def _log_audit_event(self, event_type: str, data: Dict[str, Any]):
+    def _log_audit_event(self, event_type: str, data: Dict[str, Any], ts: Optional[datetime] = None):
         """Log audit event for milestone"""
         audit_entry = {
-            'timestamp': utcnow().isoformat(),
+            'timestamp': (ts or utcnow()).isoformat(),
             'event_type': event_type,
             'data': data,
             'user_id': data.get('created_by', data.get('submitted_by', data.get('approved_by', data.get('rejected_by', 'system')))),
@@ -908,9 +1341,105 @@ class MilestoneManager:
         }
         
         self.audit_log.append(audit_entry)
-        logger.info(f"Milestone Audit: {event_type} - {data}")
+        self._audit_pending.append(audit_entry)
+        
+        # Write in batches: immediately once a batch fills, otherwise shortly after the first pending entry
+        if len(self._audit_pending) >= AUDIT_FLUSH_BATCH_SIZE:
+            self.flush_audit_log()
+        elif self._audit_flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush_audit_log()  # no event loop to defer to
+            else:
+                self._audit_flush_handle = loop.call_later(AUDIT_FLUSH_INTERVAL_SECONDS, self.flush_audit_log)
+    
+    def flush_audit_log(self):
+        """Write pending audit entries as one log record (msgpack when available)"""
+        if self._audit_flush_handle is not None:
+            self._audit_flush_handle.cancel()
+            self._audit_flush_handle = None
+        pending, self._audit_pending = self._audit_pending, []
+        if not pending:
+            return
+        if MSGSPEC_AVAILABLE:
+            audit_logger.log(AUDIT_LEVEL, '', pending)
+        elif logger.isEnabledFor(logging.INFO):
+            logger.info("Milestone Audit (%d events):\n%s", len(pending), "\n".join(
+                orjson.dumps(entry, default=_json_default, option=_JSON_OPTIONS).decode() for entry in pending
+            ))
 
 # ==================== MAIN PRODUCTION SYSTEM ====================
+STAGE_QUEUE_SIZE = 8  # detections/alerts buffered between stages
+FRAME_POOL_SIZE = int(os.getenv('FRAME_POOL_SIZE', '16'))
+FRAME_SHAPE = (1080, 1920, 3)
+
+class SharedFramePool:
+    """Preallocated shared-memory frame buffers that capture processes write into and the pipeline reads in place"""
+    
+    def __init__(self, count: int = FRAME_POOL_SIZE, shape: Tuple[int, ...] = FRAME_SHAPE, dtype=np.uint8):
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * self.dtype.itemsize
+        # Allocated once up front; frames are never copied between producer and detector
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self._free: deque = deque()
+        for _ in range(count):
+            block = shared_memory.SharedMemory(create=True, size=size)
+            self._blocks[block.name] = block
+            self._free.append(block.name)
+    
+    def acquire(self) -> Optional[Tuple[str, np.ndarray]]:
+        """Take a free buffer as (name, writable frame view), or None if all are in use"""
+        if not self._free:
+            return None
+        name = self._free.popleft()
+        return name, self.view(name)
+    
+    def view(self, name: str) -> np.ndarray:
+        """Zero-copy ndarray over a pooled buffer"""
+        return np.ndarray(self.shape, dtype=self.dtype, buffer=self._blocks[name].buf)
+    
+    def release(self, name: str):
+        """Return a buffer to the pool once the pipeline is done with it"""
+        self._free.append(name)
+    
+    def close(self):
+        """Free the shared memory blocks"""
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+        self._free.clear()
+
+DETECT_STAGE_WORKERS = min(8, DETECTION_BATCH_SIZE)
+# cv2.imdecode releases the GIL, so decode threads run alongside the event loop
+DECODE_WORKERS = max(2, (os.cpu_count() or 1) // 2)
+SIMILAR_INCIDENT_WINDOW = timedelta(minutes=10)  # new detections within this window extend an open incident
+_INCIDENT_TITLE_TEMPLATES = {
+    'security_threat': 'Security Threat Detected - {location}',
+    'traffic_violation': 'Traffic Violation Detected - {location}',
+    'public_safety': 'Public Safety Incident - {location}',
+    'surveillance_alert': 'Surveillance Alert - {location}'
+}
+_DEFAULT_INCIDENT_TITLE = 'Incident Detected - {location}'
+
+# Used for cameras not passed to register_camera
+_DEFAULT_CAMERA_CONTEXT: Dict[str, Any] = {
+    'location': 'Nairobi CBD',
+    'coordinates': Coordinates(-1.2921, 36.8219),
+    'weather': 'clear',  # Get from weather API
+    'traffic': 'normal',  # Get from traffic API
+    'crowd_density': 'medium'
+}
+
+_SEVERITY_BY_RISK_LEVEL = {
+    RiskLevel.LOW: SeverityLevel.LOW,
+    RiskLevel.MEDIUM: SeverityLevel.MEDIUM,
+    RiskLevel.HIGH: SeverityLevel.HIGH,
+    RiskLevel.CRITICAL: SeverityLevel.CRITICAL
+}
+
 class KenyaOverwatchProduction:
     """Production-Grade Kenya Overwatch System"""
     
@@ -921,55 +1450,212 @@ class KenyaOverwatchProduction:
         self.milestone_manager = MilestoneManager()
         self.active_incidents = {}
         self.camera_streams = {}
+        self._camera_cfg: Dict[str, Dict[str, Any]] = {}  # camera_id -> static context
+        self._camera_context: Dict[str, Tuple[int, Mapping[str, Any]]] = {}  # camera_id -> (hour, context)
+        self._incidents_by_camera: Dict[str, Set[str]] = defaultdict(set)  # camera_id -> open incident ids
+        # Stage pipeline (detect -> risk -> alert), started lazily on the running loop.
+        # Detection reads a latest-only slot per camera: a newer frame replaces one not yet picked up
+        self._latest_frames: Dict[str, Tuple[np.ndarray, datetime, Optional[str]]] = {}
+        self._ready_cameras: Optional[asyncio.Queue] = None  # camera ids with a frame waiting in their slot
+        self._risk_queue: Optional[asyncio.Queue] = None
+        self._alert_queue: Optional[asyncio.Queue] = None
+        self._stage_tasks: List[asyncio.Task] = []
+        self.dropped_frames = 0
+        # At most one inference per camera; a frame arriving mid-detection waits in the latest-only slot
+        self._cam_sem: DefaultDict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(1))
+        self._deferred_cameras: Set[str] = set()  # cameras to re-signal when their in-flight inference ends
+        self._frame_pool: Optional[SharedFramePool] = None
+        self._decode_pool = ThreadPoolExecutor(max_workers=DECODE_WORKERS, thread_name_prefix='decode')
         
         logger.info("Kenya Overwatch Production System initialized")
     
-    async def process_camera_stream(self, camera_id: str, frame: np.ndarray):
-        """Process real-time camera stream through AI pipeline"""
-        
-        timestamp = utcnow()
-        
-        try:
-            # Step 1: AI Detection Pipeline
-            detection_events = await self.ai_pipeline.process_frame(camera_id, frame, timestamp)
-            
-            if not detection_events:
-                return
-            
-            # Step 2: Risk Assessment
-            context = self._get_context_data(camera_id, timestamp)
-            risk_assessment = await self.risk_engine.assess_risk(detection_events, context)
-            
-            # Step 3: Check if incident should be created
-            if risk_assessment.risk_score > 0.3:  # Threshold for incident creation
-                await self._create_or_update_incident(camera_id, detection_events, risk_assessment, context)
-            
-            # Step 4: Real-time alerts for high risk
-            if risk_assessment.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
-                await self._send_real_time_alert(risk_assessment, detection_events)
+    @property
+    def frame_pool(self) -> SharedFramePool:
+        """Shared-memory frame buffers, allocated on first use"""
+        if self._frame_pool is None:
+            self._frame_pool = SharedFramePool()
+        return self._frame_pool
+    
+    async def process_camera_stream(self, camera_id: str, frame: np.ndarray,
+                                    frame_slot: Optional[str] = None):
+        """Hand a camera frame to the AI pipeline, superseding any frame from this camera still waiting"""
+        self._ensure_stage_workers()
+        stale = self._latest_frames.get(camera_id)
+        self._latest_frames[camera_id] = (frame, utcnow(), frame_slot)
+        if stale is None:
+            self._ready_cameras.put_nowait(camera_id)
+            return
+        
+        # Detection is behind; only the freshest frame is worth processing
+        self.dropped_frames += 1
+        if stale[2] is not None:
+            self.frame_pool.release(stale[2])
+    
+    async def process_encoded_frame(self, camera_id: str, frame_bytes: bytes):
+        """Decode a JPEG/PNG frame on the decode pool, then queue it like process_camera_stream"""
+        loop = asyncio.get_running_loop()
+        frame = await loop.run_in_executor(
+            self._decode_pool, cv2.imdecode, np.frombuffer(frame_bytes, np.uint8), cv2.IMREAD_COLOR
+        )
+        if frame is None:
+            logger.warning(f"Could not decode frame from camera {camera_id}")
+            return
+        await self.process_camera_stream(camera_id, frame)
+    
+    async def process_pooled_frame(self, camera_id: str, frame_slot: str):
+        """Queue a frame already written into a frame_pool buffer, without copying it"""
+        await self.process_camera_stream(camera_id, self.frame_pool.view(frame_slot), frame_slot)
+    
+    def _ensure_stage_workers(self):
+        """Start the detection, risk and alert stage workers on the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._stage_tasks and all(not task.done() and task.get_loop() is loop for task in self._stage_tasks):
+            return
+        for task in self._stage_tasks:
+            task.cancel()
+        for _, _, frame_slot in self._latest_frames.values():
+            if frame_slot is not None:
+                self.frame_pool.release(frame_slot)
+        self._latest_frames.clear()
+        self._cam_sem.clear()
+        self._deferred_cameras.clear()
+        self._ready_cameras = asyncio.Queue()
+        self._risk_queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        self._alert_queue = asyncio.Queue(maxsize=STAGE_QUEUE_SIZE)
+        # Several detection workers keep enough frames in flight for the detector to batch them
+        self._stage_tasks = [loop.create_task(self._detect_worker()) for _ in range(DETECT_STAGE_WORKERS)]
+        self._stage_tasks.append(loop.create_task(self._risk_worker()))
+        self._stage_tasks.append(loop.create_task(self._alert_worker()))
+    
+    async def join_pipeline(self):
+        """Wait until every queued frame has passed through all stages"""
+        if not self._stage_tasks:
+            return
+        await self._ready_cameras.join()
+        await self._risk_queue.join()
+        await self._alert_queue.join()
+    
+    async def _detect_worker(self):
+        """Stage 1: AI detection"""
+        while True:
+            camera_id = await self._ready_cameras.get()
+            sem = self._cam_sem[camera_id]
+            if sem.locked():
+                # Camera is mid-inference: leave its newest frame in the slot for the in-flight worker to re-signal
+                self._deferred_cameras.add(camera_id)
+                self._ready_cameras.task_done()
+                continue
+            frame, timestamp, frame_slot = self._latest_frames.pop(camera_id)
+            try:
+                async with sem:
+                    try:
+                        detection_events = await self.ai_pipeline.process_frame(camera_id, frame, timestamp)
+                    finally:
+                        if camera_id in self._deferred_cameras:
+                            self._deferred_cameras.discard(camera_id)
+                            self._ready_cameras.put_nowait(camera_id)
+                # process_frame has finished reading the frame, so a pooled buffer can be reused
+                if frame_slot is not None:
+                    self.frame_pool.release(frame_slot)
+                    frame_slot = None
+                if detection_events:
+                    await self._risk_queue.put((camera_id, detection_events, timestamp))
+            except Exception as e:
+                logger.error(f"Error processing camera stream {camera_id}: {e}")
+            finally:
+                if frame_slot is not None:
+                    self.frame_pool.release(frame_slot)
+                self._ready_cameras.task_done()
+    
+    async def _risk_worker(self):
+        """Stage 2: risk assessment and incident creation"""
+        while True:
+            camera_id, detection_events, timestamp = await self._risk_queue.get()
+            try:
+                # Formatted once per frame and shared by every message this frame produces
+                ts_iso = timestamp.isoformat()
+                context = self._get_context_data(camera_id, timestamp)
+                risk_assessment = await self.risk_engine.assess_risk(detection_events, context, now=timestamp)
+                
+                # Check if incident should be created
+                if risk_assessment.risk_score > 0.3:  # Threshold for incident creation
+                    await self._create_or_update_incident(camera_id, detection_events, risk_assessment, context, ts_iso)
                 
-        except Exception as e:
-            logger.error(f"Error processing camera stream {camera_id}: {e}")
+                # Real-time alerts for high risk
+                if risk_assessment.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+                    await self._alert_queue.put((risk_assessment, detection_events, ts_iso))
+            except Exception as e:
+                logger.error(f"Error assessing risk for camera {camera_id}: {e}")
+            finally:
+                self._risk_queue.task_done()
+    
+    async def _alert_worker(self):
+        """Stage 3: alert delivery, decoupled so slow alerting never stalls detection"""
+        while True:
+            risk_assessment, detection_events, ts_iso = await self._alert_queue.get()
+            try:
+                await self._send_real_time_alert(risk_assessment, detection_events, ts_iso)
+            except Exception as e:
+                logger.error(f"Error sending real-time alert: {e}")
+            finally:
+                self._alert_queue.task_done()
     
     async def _create_or_update_incident(self, camera_id: str, events: List[DetectionEvent], 
-                                        risk_assessment: RiskAssessment, context: Dict[str, Any]):
+                                        risk_assessment: RiskAssessment, context: Mapping[str, Any],
+                                        ts_iso: Optional[str] = None):
         """Create or update incident based on AI analysis"""
         
+        incident_type = self._classify_incident_type(events)
+        
         # Check if similar incident exists
-        existing_incident = self._find_similar_incident(camera_id, events)
+        existing_incident = self._find_similar_incident(camera_id, incident_type)
         
         if existing_incident:
             # Update existing incident
             await self._update_incident(existing_incident, events, risk_assessment)
         else:
             # Create new incident
-            await self._create_new_incident(camera_id, events, risk_assessment, context)
+            await self._create_new_incident(camera_id, events, risk_assessment, context, incident_type, ts_iso)
+    
+    def _find_similar_incident(self, camera_id: str, incident_type: str) -> Optional[ProductionIncident]:
+        """Find a recent open incident of the same type on this camera"""
+        cutoff = utcnow() - SIMILAR_INCIDENT_WINDOW
+        camera_incidents = self._incidents_by_camera.get(camera_id)
+        if not camera_incidents:
+            return None
+        
+        # Only this camera's open incidents are scanned; closed or removed ones are pruned on the way
+        for incident_id in list(camera_incidents):
+            incident = self.active_incidents.get(incident_id)
+            if incident is None or incident.status == IncidentStatus.RESOLVED:
+                camera_incidents.discard(incident_id)
+                continue
+            if incident.type == incident_type and (incident.updated_at or incident.created_at) >= cutoff:
+                return incident
+        return None
+    
+    async def _update_incident(self, incident: ProductionIncident, events: List[DetectionEvent],
+                               risk_assessment: RiskAssessment):
+        """Attach new evidence to an existing incident"""
+        evidence_package = await self.evidence_manager.create_evidence_package(
+            incident.id, events, risk_assessment
+        )
+        incident.evidence_packages.append(evidence_package)
+        
+        # Keep the highest risk seen; severity stays as triaged
+        if risk_assessment.risk_score > incident.risk_assessment.risk_score:
+            incident.risk_assessment = risk_assessment
+        incident.updated_at = risk_assessment.timestamp
+        
+        logger.info(f"Updated incident: {incident.id} ({len(incident.evidence_packages)} evidence packages)")
     
     async def _create_new_incident(self, camera_id: str, events: List[DetectionEvent], 
-                                 risk_assessment: RiskAssessment, context: Dict[str, Any]):
+                                 risk_assessment: RiskAssessment, context: Mapping[str, Any],
+                                 incident_type: Optional[str] = None, ts_iso: Optional[str] = None):
         """Create new production incident"""
         
-        incident_id = str(uuid.uuid4())
+        incident_id = uuid7()
+        created_at = utcnow()
         
         # Create evidence package
         evidence_package = await self.evidence_manager.create_evidence_package(
@@ -977,7 +1663,7 @@ class KenyaOverwatchProduction:
         )
         
         # Determine incident type and severity
-        incident_type = self._classify_incident_type(events)
+        incident_type = incident_type or self._classify_incident_type(events)
         severity = self._map_risk_to_severity(risk_assessment.risk_level)
         
         # Create incident
@@ -992,34 +1678,47 @@ class KenyaOverwatchProduction:
             status=IncidentStatus.UNDER_REVIEW,
             risk_assessment=risk_assessment,
             evidence_packages=[evidence_package],
-            created_at=utcnow(),
+            created_at=created_at,
+            updated_at=None,
             reported_by='AI_System',
+            assigned_team_id=None,
             requires_human_review=risk_assessment.risk_level != RiskLevel.LOW,
             human_review_completed=False,
-            appeal_deadline=utcnow() + timedelta(days=30) if severity != SeverityLevel.LOW else None
+            appeal_deadline=created_at + timedelta(days=30) if severity != SeverityLevel.LOW else None
         )
         
         self.active_incidents[incident_id] = incident
+        self._incidents_by_camera[camera_id].add(incident_id)
         
         logger.info(f"Created new incident: {incident_id} - {incident.title}")
         
         # Send notifications
-        await self._notify_incident_created(incident)
+        await self._notify_incident_created(incident, ts_iso or created_at.isoformat())
     
-    def _get_context_data(self, camera_id: str, timestamp: datetime) -> Dict[str, Any]:
-        """Get contextual data for risk assessment"""
-        return {
-            'location': 'Nairobi CBD',  # Get from camera config
-            'coordinates': Coordinates(-1.2921, 36.8219),
-            'time_of_day': timestamp.hour,
-            'weather': 'clear',  # Get from weather API
-            'traffic': 'normal',  # Get from traffic API
-            'crowd_density': 'medium'
+    def register_camera(self, camera_id: str, location: str, coordinates: Coordinates, **fields: Any):
+        """Record a camera's static context (location, coordinates, ...) once"""
+        self._camera_cfg[camera_id] = {
+            **_DEFAULT_CAMERA_CONTEXT,
+            'location': location,
+            'coordinates': coordinates,
+            **fields
         }
+        self._camera_context.pop(camera_id, None)
+    
+    def _get_context_data(self, camera_id: str, timestamp: datetime) -> Mapping[str, Any]:
+        """Get contextual data for risk assessment (read-only, shared between frames in the same hour)"""
+        hour = timestamp.hour
+        cached = self._camera_context.get(camera_id)
+        if cached is not None and cached[0] == hour:
+            return cached[1]
+        cfg = self._camera_cfg.get(camera_id, _DEFAULT_CAMERA_CONTEXT)
+        context = MappingProxyType({**cfg, 'time_of_day': hour})
+        self._camera_context[camera_id] = (hour, context)
+        return context
     
     def _classify_incident_type(self, events: List[DetectionEvent]) -> str:
         """Classify incident type based on detection events"""
-        detection_types = [event.detection_type for event in events]
+        detection_types = {event.detection_type for event in events}
         
         if 'weapon' in detection_types:
             return 'security_threat'
@@ -1032,59 +1731,48 @@ class KenyaOverwatchProduction:
     
     def _map_risk_to_severity(self, risk_level: RiskLevel) -> SeverityLevel:
         """Map risk level to incident severity"""
-        mapping = {
-            RiskLevel.LOW: SeverityLevel.LOW,
-            RiskLevel.MEDIUM: SeverityLevel.MEDIUM,
-            RiskLevel.HIGH: SeverityLevel.HIGH,
-            RiskLevel.CRITICAL: SeverityLevel.CRITICAL
-        }
-        return mapping[risk_level]
+        return _SEVERITY_BY_RISK_LEVEL[risk_level]
     
-    def _generate_incident_title(self, incident_type: str, context: Dict[str, Any]) -> str:
+    def _generate_incident_title(self, incident_type: str, context: Mapping[str, Any]) -> str:
         """Generate incident title"""
         location = context.get('location', 'Unknown Location')
-        
-        titles = {
-            'security_threat': f'Security Threat Detected - {location}',
-            'traffic_violation': f'Traffic Violation Detected - {location}',
-            'public_safety': f'Public Safety Incident - {location}',
-            'surveillance_alert': f'Surveillance Alert - {location}'
-        }
-        
-        return titles.get(incident_type, f'Incident Detected - {location}')
+        return _INCIDENT_TITLE_TEMPLATES.get(incident_type, _DEFAULT_INCIDENT_TITLE).format(location=location)
     
     def _generate_incident_description(self, events: List[DetectionEvent], 
                                      risk_assessment: RiskAssessment) -> str:
         """Generate detailed incident description"""
-        description = f"AI-detected incident with risk score {risk_assessment.risk_score:.2f}. "
-        description += f"Reason codes: {', '.join(risk_assessment.factors.reason_codes)}. "
-        description += f"Detected objects: {', '.join(set(event.detection_type for event in events))}."
-        
-        return description
+        # dict.fromkeys dedups in one pass and keeps first-seen order
+        detected = dict.fromkeys(event.detection_type for event in events)
+        return (
+            f"AI-detected incident with risk score {risk_assessment.risk_score:.2f}. "
+            f"Reason codes: {', '.join(risk_assessment.factors.reason_codes)}. "
+            f"Detected objects: {', '.join(detected)}."
+        )
     
-    async def _send_real_time_alert(self, risk_assessment: RiskAssessment, events: List[DetectionEvent]):
+    async def _send_real_time_alert(self, risk_assessment: RiskAssessment, events: List[DetectionEvent],
+                                    ts_iso: Optional[str] = None):
         """Send real-time alert for high-risk incidents"""
         alert_data = {
             'type': 'high_risk_alert',
             'risk_score': risk_assessment.risk_score,
             'risk_level': risk_assessment.risk_level,
             'recommended_action': risk_assessment.recommended_action,
-            'detections': [asdict(event) for event in events],
-            'timestamp': utcnow().isoformat()
+            'detections': [event.to_dict() for event in events],
+            'timestamp': ts_iso or utcnow().isoformat()
         }
         
         # Send to WebSocket clients
         # In production, send to alerting system
         logger.warning(f"High Risk Alert: {risk_assessment.risk_level} - {risk_assessment.recommended_action}")
     
-    async def _notify_incident_created(self, incident: ProductionIncident):
+    async def _notify_incident_created(self, incident: ProductionIncident, ts_iso: Optional[str] = None):
         """Notify relevant parties about new incident"""
         notification = {
             'type': 'incident_created',
             'incident_id': incident.id,
             'severity': incident.severity,
             'requires_review': incident.requires_human_review,
-            'timestamp': utcnow().isoformat()
+            'timestamp': ts_iso or utcnow().isoformat()
         }
         
         logger.info(f"Incident Created Notification: {incident.id}")
@@ -1100,11 +1788,15 @@ if __name__ == "__main__":
     async def test_production_system():
         print("🚀 Testing Kenya Overwatch Production System")
         
-        # Mock frame data
-        mock_frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+        # Mock frame data, written straight into a pooled shared-memory buffer
+        frame_slot, mock_frame = system.frame_pool.acquire()
+        mock_frame.fill(0)
         
         # Process camera stream
-        await system.process_camera_stream("camera_001", mock_frame)
+        await system.process_pooled_frame("camera_001", frame_slot)
+        await system.join_pipeline()
+        del mock_frame
+        system.frame_pool.close()
         
         print("✅ Production system test completed")
     
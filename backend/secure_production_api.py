@@ -2,21 +2,31 @@
 Production API with Authentication and Security
 """
 
-from fastapi import FastAPI, HTTPException, Depends, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Depends, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
-from typing import Dict, List, Optional, Any
+from typing import Awaitable, Callable, Dict, Optional, Any, Set
 import asyncio
-import json
 import logging
+import orjson
+import queue
+import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    psutil = None
+    PSUTIL_AVAILABLE = False
 
 # Import production system components
 from production_system import KenyaOverwatchProduction
 from app.services.auth import (
-    AuthService, TokenManager, AuditLogger, 
-    session_manager, rate_limiter
+    AuthService, TokenManager, 
+    session_manager, token_manager, rate_limiter, audit_writer, get_cached_user
 )
 from app.config.database import init_db, check_db_health
 
@@ -36,6 +46,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Request paths only enqueue log records; formatting and file/console writes
+# happen on the QueueListener thread started in startup_event
+_root_logger = logging.getLogger()
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+
 app = FastAPI(
     title="Kenya Overwatch Production API",
     description="Real-time AI surveillance with risk scoring and evidence management",
@@ -59,65 +76,83 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Initialize production system
 production_system = KenyaOverwatchProduction()
 
+_WS_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+def _encode_ws_message(message: Any) -> str:
+    """Encode a WebSocket message once with orjson; pre-encoded strings pass through"""
+    if isinstance(message, str):
+        return message
+    return orjson.dumps(message, default=str, option=_WS_JSON_OPTIONS).decode()
+
+BROADCAST_CHUNK_SIZE = 256  # concurrent sends per gather
+
 # WebSocket connection manager
 class ProductionConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
         self.user_connections: Dict[str, WebSocket] = {}
+        self.user_by_ws: Dict[WebSocket, str] = {}  # reverse of user_connections
         
     async def connect(self, websocket: WebSocket, user_id: Optional[str] = None):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         if user_id:
             self.user_connections[user_id] = websocket
+            self.user_by_ws[websocket] = user_id
         logger.info(f"WebSocket connected - User: {user_id}")
     
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         
-        # Remove from user connections
-        user_id = None
-        for uid, ws in self.user_connections.items():
-            if ws == websocket:
-                user_id = uid
-                break
-        if user_id:
+        # Remove from user connections, unless the user has since reconnected on another socket
+        user_id = self.user_by_ws.pop(websocket, None)
+        if user_id and self.user_connections.get(user_id) is websocket:
             del self.user_connections[user_id]
         logger.info(f"WebSocket disconnected - User: {user_id}")
     
-    async def send_personal_message(self, message: str, websocket: WebSocket):
+    async def send_personal_message(self, message: Any, websocket: WebSocket):
         try:
-            await websocket.send_text(message)
+            await websocket.send_text(_encode_ws_message(message))
         except:
             self.disconnect(websocket)
     
     async def broadcast(self, message: Dict[str, Any]):
-        message_str = json.dumps(message)
+        message_str = _encode_ws_message(message)
         dead_connections = []
         
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message_str)
-            except:
-                dead_connections.append(connection)
+        # Snapshot: connections may come and go while sends are awaited
+        connections = tuple(self.active_connections)
+        
+        # Sends overlap, so a slow client only delays its own chunk; chunking bounds tasks per loop turn
+        for start in range(0, len(connections), BROADCAST_CHUNK_SIZE):
+            chunk = connections[start:start + BROADCAST_CHUNK_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(message_str) for connection in chunk),
+                return_exceptions=True
+            )
+            dead_connections.extend(
+                connection for connection, result in zip(chunk, results) if isinstance(result, Exception)
+            )
         
         # Remove dead connections
         for connection in dead_connections:
             self.disconnect(connection)
     
     async def send_to_user(self, user_id: str, message: Dict[str, Any]):
-        if user_id in self.user_connections:
+        websocket = self.user_connections.get(user_id)
+        if websocket is not None:
             try:
-                await self.user_connections[user_id].send_text(json.dumps(message))
+                await websocket.send_text(_encode_ws_message(message))
             except:
-                del self.user_connections[user_id]
+                self.disconnect(websocket)
 
 ws_manager = ProductionConnectionManager()
 
 # Rate limiting middleware
 @app.middleware("http")
 async def rate_limit_middleware(request, call_next):
+    # One clock read per request; handlers reuse it instead of formatting their own
+    request.state.now_iso = datetime.utcnow().isoformat()
     client_ip = request.client.host
     endpoint = request.url.path
     
@@ -136,6 +171,7 @@ async def rate_limit_middleware(request, call_next):
 @app.on_event("startup")
 async def startup_event():
     """Initialize production system"""
+    log_listener.start()
     logger.info("🚀 Kenya Overwatch Production System Starting")
     
     # Initialize database
@@ -151,6 +187,9 @@ async def startup_event():
     logger.info("✅ Evidence Manager: Verifying cryptographic integrity")
     logger.info("✅ WebSocket Server: Ready for real-time connections")
     logger.info("🌐 Production API: Ready for government deployment")
+    
+    if PSUTIL_AVAILABLE:
+        app.state.metrics_sampler = asyncio.create_task(_metrics_sampler())
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -158,17 +197,48 @@ async def shutdown_event():
     logger.info("🔄 Kenya Overwatch Production System Shutting Down")
     logger.info("💾 Saving evidence packages")
     logger.info("🔒 Securing audit logs")
+    await audit_writer.stop()
     logger.info("📡 Closing WebSocket connections")
+    log_listener.stop()
+
+# ==================== HEALTH ====================
+HEALTH_CACHE_TTL_SECONDS = 2.0
+METRICS_SAMPLE_INTERVAL_SECONDS = 1.0
+
+_started_at = time.monotonic()
+_health_cache: Dict[str, Any] = {"ts": 0.0, "value": None}
+_health_lock = asyncio.Lock()
+system_metrics: Dict[str, Any] = {"cpu_usage": None, "memory_usage": None, "disk_usage": None}
+
+def _format_uptime() -> str:
+    """Process uptime as e.g. '72h 15m'"""
+    minutes = int(time.monotonic() - _started_at) // 60
+    return f"{minutes // 60}h {minutes % 60}m"
+
+async def _metrics_sampler():
+    """Sample host metrics in the background so health checks never block on them"""
+    psutil.cpu_percent(interval=None)  # prime; the first reading is always 0.0
+    while True:
+        await asyncio.sleep(METRICS_SAMPLE_INTERVAL_SECONDS)
+        system_metrics["cpu_usage"] = psutil.cpu_percent(interval=None)
+        system_metrics["memory_usage"] = psutil.virtual_memory().percent
+        system_metrics["disk_usage"] = psutil.disk_usage("/").percent
 
 # Health check (public)
 @app.get("/api/health")
-async def health_check():
-    """Public health check endpoint"""
-    db_healthy = await check_db_health()
+async def health_check(request: Request):
+    """Public health check endpoint (DB status cached for a couple of seconds)"""
+    if time.monotonic() - _health_cache["ts"] >= HEALTH_CACHE_TTL_SECONDS:
+        async with _health_lock:
+            # Another request may have refreshed the cache while this one waited
+            if time.monotonic() - _health_cache["ts"] >= HEALTH_CACHE_TTL_SECONDS:
+                _health_cache["value"] = await check_db_health()
+                _health_cache["ts"] = time.monotonic()
+    db_healthy = _health_cache["value"]
     
     return {
         "status": "healthy" if db_healthy else "unhealthy",
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": request.state.now_iso,
         "services": {
             "ai_pipeline": "operational",
             "risk_engine": "operational",
@@ -177,16 +247,15 @@ async def health_check():
             "websocket_server": "operational"
         },
         "system_metrics": {
-            "cpu_usage": 45.2,
-            "memory_usage": 62.8,
-            "disk_usage": 34.1,
-            "uptime": "72h 15m"
+            **system_metrics,
+            "uptime": _format_uptime(),
+            "audit_drops": audit_writer.audit_drops
         }
     }
 
 # Authentication endpoints
 @app.post("/api/auth/login")
-async def login(login_data: Dict[str, str]):
+async def login(login_data: Dict[str, str], request: Request):
     """User authentication"""
     username = login_data.get('username')
     password = login_data.get('password')
@@ -202,8 +271,8 @@ async def login(login_data: Dict[str, str]):
         
         if not user:
             # Log failed login attempt
-            await AuditLogger.log_security_event(
-                db, None, "login_failed", "authentication",
+            audit_writer.enqueue(
+                None, "login_failed", "authentication",
                 ip_address="127.0.0.1"  # Get from request in production
             )
             
@@ -217,18 +286,23 @@ async def login(login_data: Dict[str, str]):
             data={"sub": str(user.id), "username": user.username, "role": user.role}
         )
         refresh_token = AuthService.create_refresh_token(
-            data={"sub": str(user.id)}
+            data={
+                "sub": str(user.id),
+                "username": user.username,
+                "role": user.role,
+                "ver": token_manager.refresh_token_version(user.id)
+            }
         )
         
         # Create session
         session_id = session_manager.create_session(
             str(user.id), 
-            {"login_time": datetime.utcnow().isoformat()}
+            {"login_time": request.state.now_iso}
         )
         
         # Log successful login
-        await AuditLogger.log_security_event(
-            db, str(user.id), "login_success", "authentication",
+        audit_writer.enqueue(
+            str(user.id), "login_success", "authentication",
             ip_address="127.0.0.1"
         )
         
@@ -258,27 +332,23 @@ async def refresh_token(refresh_data: Dict[str, str]):
         payload = AuthService.verify_token(refresh_token, "refresh")
         user_id = payload.get("sub")
         
-        if not user_id:
+        if not user_id or token_manager.is_refresh_token_revoked(user_id, payload.get("ver")):
             raise HTTPException(status_code=401, detail="Invalid refresh token")
         
-        # Get user from database
-        from app.config.database import AsyncSessionLocal
-        from app.models.database import User
+        # Cached snapshot; only a miss opens a database session
+        user = await get_cached_user(user_id)
+        if not user or not user.active:
+            raise HTTPException(status_code=401, detail="User not found or inactive")
         
-        async with AsyncSessionLocal() as db:
-            user = await db.get(User, user_id)
-            if not user or not user.active:
-                raise HTTPException(status_code=401, detail="User not found or inactive")
-            
-            # Create new access token
-            access_token = AuthService.create_access_token(
-                data={"sub": str(user.id), "username": user.username, "role": user.role}
-            )
-            
-            return {
-                "access_token": access_token,
-                "token_type": "bearer"
-            }
+        # Create new access token from the user's current role, not the refresh-token claims
+        access_token = AuthService.create_access_token(
+            data={"sub": str(user.id), "username": user.username, "role": user.role}
+        )
+        
+        return {
+            "access_token": access_token,
+            "token_type": "bearer"
+        }
             
     except Exception as e:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
@@ -286,7 +356,8 @@ async def refresh_token(refresh_data: Dict[str, str]):
 @app.post("/api/auth/logout")
 async def logout(current_user = Depends(AuthService.get_current_user)):
     """User logout"""
-    # In a real implementation, you would blacklist the token
+    # Outstanding refresh tokens stop working; access tokens lapse at expiry
+    token_manager.revoke_refresh_tokens(current_user.id)
     return {"message": "Successfully logged out"}
 
 # Protected endpoints (require authentication)
@@ -297,20 +368,14 @@ async def get_incidents(
     current_user = Depends(AuthService.get_current_user)
 ):
     """Get incidents with filtering (authenticated)"""
-    incidents = list(production_system.active_incidents.values())
-    
-    # Apply filters
-    if status:
-        incidents = [inc for inc in incidents if inc.status.value == status]
-    if severity:
-        incidents = [inc for inc in incidents if inc.severity.value == severity]
+    # Apply filters in a single pass
+    incidents = [
+        inc for inc in production_system.active_incidents.values()
+        if (not status or inc.status.value == status) and (not severity or inc.severity.value == severity)
+    ]
     
     # Log access
-    from app.config.database import AsyncSessionLocal
-    async with AsyncSessionLocal() as db:
-        await AuditLogger.log_security_event(
-            db, str(current_user.id), "incidents_accessed", "incidents"
-        )
+    audit_writer.enqueue(str(current_user.id), "incidents_accessed", "incidents")
     
     return incidents
 
@@ -325,12 +390,10 @@ async def get_incident(
         raise HTTPException(status_code=404, detail="Incident not found")
     
     # Log access
-    from app.config.database import AsyncSessionLocal
-    async with AsyncSessionLocal() as db:
-        await AuditLogger.log_security_event(
-            db, str(current_user.id), "incident_accessed", "incident",
-            resource_id=incident_id
-        )
+    audit_writer.enqueue(
+        str(current_user.id), "incident_accessed", "incident",
+        resource_id=incident_id
+    )
     
     return incident
 
@@ -371,9 +434,9 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
         while True:
             data = await websocket.receive_text()
             try:
-                message = json.loads(data)
+                message = orjson.loads(data)
                 await handle_websocket_message(websocket, user_id, message)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 await ws_manager.send_personal_message(
                     {"error": "Invalid JSON format"}, 
                     websocket
@@ -381,22 +444,34 @@ async def websocket_endpoint(websocket: WebSocket, user_id: str):
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
 
+async def _handle_ping(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    await ws_manager.send_personal_message({"type": "pong"}, websocket)
+
+async def _handle_subscribe(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    await ws_manager.send_personal_message(
+        {"type": "subscribed", "alerts": True}, 
+        websocket
+    )
+
+async def _handle_camera_control(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
+    # Handle camera control commands (requires permissions)
+    camera_id = message.get('camera_id')
+    command = message.get('command')
+    logger.info(f"Camera control from {user_id}: {camera_id} - {command}")
+
+_MSG_HANDLERS: Dict[str, Callable[[WebSocket, str, Dict[str, Any]], Awaitable[None]]] = {
+    'ping': _handle_ping,
+    'subscribe_alerts': _handle_subscribe,
+    'camera_control': _handle_camera_control
+}
+
 async def handle_websocket_message(websocket: WebSocket, user_id: str, message: Dict[str, Any]):
     """Handle WebSocket messages from clients"""
     message_type = message.get('type')
-    
-    if message_type == 'ping':
-        await ws_manager.send_personal_message({"type": "pong"}, websocket)
-    elif message_type == 'subscribe_alerts':
-        await ws_manager.send_personal_message(
-            {"type": "subscribed", "alerts": True}, 
-            websocket
-        )
-    elif message_type == 'camera_control':
-        # Handle camera control commands (requires permissions)
-        camera_id = message.get('camera_id')
-        command = message.get('command')
-        logger.info(f"Camera control from {user_id}: {camera_id} - {command}")
+    # Non-string types (lists, objects) are unhashable; ignore them like unknown types
+    handler = _MSG_HANDLERS.get(message_type) if isinstance(message_type, str) else None
+    if handler:
+        await handler(websocket, user_id, message)
 
 # Include all original production API endpoints with authentication
 # (Previous endpoints from production_api.py would be added here with authentication)
@@ -8,89 +8,103 @@ import json
 from datetime import datetime, timedelta
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 from secure_production_api import app
 from app.services.auth import AuthService, AuditLogger
 from app.config.database import get_db, init_db
 from app.models.database import User, Incident, EvidencePackage, Alert
 
-# Test database session
-@pytest.fixture
-async def test_db():
-    """Create test database session"""
-    from app.config.database import AsyncSessionLocal, Base
+# Session-wide event loop so session-scoped async fixtures share it with the tests
+@pytest.fixture(scope="session")
+def event_loop():
+    """Create one event loop for the whole test session"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+# Test database: schema built once, each test rolled back
+@pytest.fixture(scope="session")
+async def _engine():
+    """Create the in-memory test database and its schema once per session"""
+    from app.config.database import Base
     from sqlalchemy.ext.asyncio import create_async_engine
-    import tempfile
-    import os
+    from sqlalchemy.pool import StaticPool
     
-    # Create in-memory SQLite database for testing
-    db_file = tempfile.mktemp()
-    engine = create_async_engine(f"sqlite+aiosqlite:///{db_file}")
+    # StaticPool keeps a single connection, so every session sees the same in-memory database
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
     
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    TestingSessionLocal = sessionmaker(
-        engine, class_=AsyncSession, expire_on_commit=False
-    )
-    
-    async with TestingSessionLocal() as session:
-        yield session
+    yield engine
     
-    # Cleanup
-    os.unlink(db_file)
+    await engine.dispose()
 
 @pytest.fixture
+async def test_db(_engine):
+    """Create test database session inside a transaction rolled back after the test"""
+    conn = await _engine.connect()
+    trans = await conn.begin()
+    # Commits inside the test release a SAVEPOINT instead of ending the outer transaction
+    session = AsyncSession(bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint")
+    
+    yield session
+    
+    await session.close()
+    await trans.rollback()
+    await conn.close()
+
+@pytest.fixture(scope="session")
 def test_client():
-    """Create test client"""
+    """Create test client shared by the whole session"""
     return TestClient(app)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def async_client():
-    """Create async test client"""
-    async with AsyncClient(app=app, base_url="http://test") as client:
+    """Create async test client shared by the whole session"""
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         yield client
 
-@pytest.fixture
-async def test_user(test_db: AsyncSession):
+# bcrypt is deliberately slow, so each test password is hashed once at import
+_TEST_USER_PASSWORD_HASH = AuthService.get_password_hash("testpass123")
+_ADMIN_USER_PASSWORD_HASH = AuthService.get_password_hash("adminpass123")
+
+async def _create_user(engine, user: User) -> User:
+    """Commit a user outside the per-test transactions so it lives for the whole session"""
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+    return user
+
+@pytest.fixture(scope="session")
+async def test_user(_engine):
     """Create test user"""
-    user = User(
+    return await _create_user(_engine, User(
         username="testoperator",
         email="test@kenya-overwatch.go.ke",
-        password_hash=AuthService.get_password_hash("testpass123"),
+        password_hash=_TEST_USER_PASSWORD_HASH,
         role="operator",
         permissions=["view_incidents", "review_evidence"],
         active=True
-    )
-    
-    test_db.add(user)
-    await test_db.commit()
-    await test_db.refresh(user)
-    
-    return user
+    ))
 
-@pytest.fixture
-async def admin_user(test_db: AsyncSession):
+@pytest.fixture(scope="session")
+async def admin_user(_engine):
     """Create admin user"""
-    admin = User(
+    return await _create_user(_engine, User(
         username="testadmin",
         email="admin@kenya-overwatch.go.ke",
-        password_hash=AuthService.get_password_hash("adminpass123"),
+        password_hash=_ADMIN_USER_PASSWORD_HASH,
         role="admin",
         permissions=["all"],
         active=True
-    )
-    
-    test_db.add(admin)
-    await test_db.commit()
-    await test_db.refresh(admin)
-    
-    return admin
+    ))
 
-@pytest.fixture
-async def auth_headers(test_user: User):
-    """Get authentication headers"""
+@pytest.fixture(scope="session")
+def auth_headers(test_user: User):
+    """Get authentication headers (token minted once per session)"""
     token = AuthService.create_access_token(
         data={
             "sub": str(test_user.id), 
@@ -101,9 +115,9 @@ async def auth_headers(test_user: User):
     
     return {"Authorization": f"Bearer {token}"}
 
-@pytest.fixture
-async def admin_headers(admin_user: User):
-    """Get admin authentication headers"""
+@pytest.fixture(scope="session")
+def admin_headers(admin_user: User):
+    """Get admin authentication headers (token minted once per session)"""
     token = AuthService.create_access_token(
         data={
             "sub": str(admin_user.id), 
@@ -604,6 +618,35 @@ class TestIntegration:
             assert data["type"] == "subscribed"
             assert data["alerts"] is True
 
+class TestKeysetPagination:
+    """Test keyset pagination cursors"""
+    
+    def test_duplicate_timestamps_across_page_boundary(self):
+        """Test items sharing created_at with a page's last item are not skipped"""
+        from production_api import keyset_page
+        
+        def key(item):
+            return item["created_at"], item["id"]
+        
+        # Four reports share one timestamp, so a page of three ends mid-run
+        timestamps = ["2024-01-01T00:00:00+00:00"] * 4 + [f"2024-01-0{day}T00:00:00+00:00" for day in (2, 3, 4)]
+        items = sorted(
+            [{"id": f"cit_{i}", "created_at": created_at} for i, created_at in enumerate(timestamps)],
+            key=key
+        )
+        
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = keyset_page(items, key, cursor, 3)
+            seen.extend(item["id"] for item in page)
+            if cursor is None:
+                break
+            # Cursors are URL-safe, so they survive an unencoded query string
+            assert "+" not in cursor and "/" not in cursor and "=" not in cursor
+        
+        assert seen == [item["id"] for item in items]
+
 if __name__ == "__main__":
     # Run tests
     pytest.main([__file__, "-v", "--tb=short"])
\ No newline at end of file
@@ -185,20 +185,72 @@ def test_model(model_path="runs/train/kenya_overwatch/weights/best.pt"):
     except Exception as e:
         print(f"✗ Testing failed: {e}")
 
-def export_model(model_path="runs/train/kenya_overwatch/weights/best.pt", format="onnx"):
-    """Export model to different formats"""
+def export_model(model_path="runs/train/kenya_overwatch/weights/best.pt", format="onnx", half=True):
+    """Export model to different formats (FP16 with a dynamic batch axis by default)"""
     print(f"\n📤 Exporting model to {format}...")
     
     try:
         from ultralytics import YOLO
         model = YOLO(model_path)
         
-        exported = model.export(format=format)
+        exported = model.export(
+            format=format,
+            imgsz=CONFIG["imgsz"],
+            half=half,
+            dynamic=True,
+            opset=17 if format == "onnx" else None,
+        )
         print(f"✓ Model exported to: {exported}")
         
     except Exception as e:
         print(f"✗ Export failed: {e}")
 
+def quantize_model(onnx_path, calibration_dir=TRAIN_DIR / "samples", samples=500):
+    """Post-training INT8 quantization of an FP32 ONNX export (export with half=False first)"""
+    print(f"\n🔢 Quantizing {onnx_path} to INT8...")
+    
+    try:
+        import cv2
+        import numpy as np
+        import onnxruntime
+        from onnxruntime.quantization import (
+            CalibrationDataReader, CalibrationMethod, QuantFormat, QuantType, quantize_static
+        )
+        
+        images = sorted(Path(calibration_dir).rglob("*.jpg"))[:samples]
+        input_name = onnxruntime.InferenceSession(
+            str(onnx_path), providers=["CPUExecutionProvider"]
+        ).get_inputs()[0].name
+        
+        class FrameReader(CalibrationDataReader):
+            """Feeds calibration frames preprocessed the same way as the live pipeline"""
+            def __init__(self):
+                self._images = iter(images)
+            
+            def get_next(self):
+                path = next(self._images, None)
+                if path is None:
+                    return None
+                frame = cv2.resize(cv2.imread(str(path)), (CONFIG["imgsz"], CONFIG["imgsz"]))
+                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                tensor = np.ascontiguousarray(rgb.transpose(2, 0, 1), dtype=np.float32) / 255.0
+                return {input_name: tensor[None]}
+        
+        output_path = Path(onnx_path).with_suffix(".int8.onnx")
+        quantize_static(
+            str(onnx_path),
+            str(output_path),
+            FrameReader(),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QInt8,
+            weight_type=QuantType.QInt8,
+            calibrate_method=CalibrationMethod.Entropy,
+        )
+        print(f"✓ INT8 model written to: {output_path} ({len(images)} calibration frames)")
+        
+    except Exception as e:
+        print(f"✗ Quantization failed: {e}")
+
 def main():
     print("=" * 50)
     print("Kenya Overwatch AI Training Pipeline")